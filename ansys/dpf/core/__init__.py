@@ -22,8 +22,13 @@ from ansys.dpf.core.meshes_container import MeshesContainer
 from ansys.dpf.core.scopings_container import ScopingsContainer
 from ansys.dpf.core.server import (start_local_server, _global_server,
                                    connect_to_server, has_local_server)
+from ansys.dpf.core.server_pool import ServerPool
+from ansys.dpf.core.channel import ChannelOptions
+from ansys.dpf.core.release_queue import ReleaseQueue, flush
+from ansys.dpf.core.session_scope import Session, session
 from ansys.dpf.core.data_sources import DataSources
-from ansys.dpf.core.scoping import Scoping
+from ansys.dpf.core.scoping import Scoping, ScopingIndex
+from ansys.dpf.core.buffer_pool import BufferPool
 from ansys.dpf.core.common import types, natures, locations, shell_layers
 from ansys.dpf.core import help
 from ansys.dpf.core.core import BaseService, load_library, download_file, upload_file,upload_file_in_tmp_folder, upload_files_in_folder, download_files_in_folder, make_tmp_dir_server
@@ -33,11 +38,16 @@ from ansys.dpf.core.elements import element_types
 from ansys.dpf.core.result_info import ResultInfo
 from ansys.dpf.core.collection import Collection
 from ansys.dpf.core.workflow import Workflow
+from ansys.dpf.core.futures import OutputFuture, gather
 from ansys.dpf.core.cyclic_support import CyclicSupport
-from ansys.dpf.core import operators
 from ansys.dpf.core.fields_factory import field_from_array
 from ansys.dpf.core import fields_container_factory,fields_factory, mesh_scoping_factory, time_freq_scoping_factory
 from ansys.dpf.core import server
+from ansys.dpf.core import profiling
+from ansys.dpf.core import local_operators
+from ansys.dpf.core import result_cache
+from ansys.dpf.core import output_cache
+from ansys.dpf.core.expressions import Expression, lazy
 from ansys.dpf.core import check_version
 
 # for matplotlib
@@ -79,4 +89,18 @@ if module_exists("pyvista"):
 
 SERVER = None
 
+# the generated operators package is only imported when first accessed
+_LAZY_SUBMODULES = ("operators",)
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        import importlib
+        return importlib.import_module("." + name, __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_SUBMODULES))
+
 _server_instances = []
@@ -0,0 +1,132 @@
+"""
+Lazy operators package
+======================
+Import on first access of the generated operators subpackages and of the
+operator classes they contain.
+
+The ``__init__`` files of the operators package only list their
+attributes. They are written by :func:`_write_lazy_inits`, which is run
+again on the package regenerated by the server when a plugin is loaded.
+"""
+import importlib
+import os
+import pkgutil
+import sys
+import types
+
+_PACKAGE_INIT = '''"""
+.. _ref_operators_package:
+
+ansys.dpf.core.operators
+========================
+The operators subpackages and the operator classes they contain are only
+imported when they are first accessed.
+"""
+from ansys.dpf.core._lazy_operators import _lazy_attributes
+
+__all__ = [
+{names}
+]
+
+__getattr__, __dir__ = _lazy_attributes(__name__, __all__)
+'''
+
+_SUBPACKAGE_INIT = '''from ansys.dpf.core._lazy_operators import _lazy_attributes
+
+__all__ = [
+{names}
+]
+
+__getattr__, __dir__ = _lazy_attributes(__name__, __all__, classes=True)
+'''
+
+
+class _ClassesModule(types.ModuleType):
+    """Module whose submodules are bound as the class of the same name they
+    define, including when a submodule is imported directly."""
+
+    def __setattr__(self, name, value):
+        # the import system binds each imported submodule on its package
+        if isinstance(value, types.ModuleType) and name in self.__dict__["_lazy_classes"]:
+            value = getattr(value, name, value)
+        super().__setattr__(name, value)
+
+
+def _package_names(path, classes):
+    """Names of the subpackages of the operators package in ``path``, or
+    of the operator modules of a subpackage when ``classes`` is ``True``."""
+    return sorted(name for _, name, is_package in pkgutil.iter_modules(path)
+                  if is_package is not classes and not name.startswith("_"))
+
+
+def _lazy_attributes(module_name, names, classes=False):
+    """Return the ``__getattr__`` and ``__dir__`` functions of a module
+    whose attributes ``names`` are imported on first access (PEP 562).
+
+    The names missing from ``names`` are looked for in the package files,
+    which a loaded plugin can add after the import.
+
+    Parameters
+    ----------
+    module_name : str
+        Name of the module getting the lazy attributes.
+
+    names : list of str
+        Names of the submodules of the module, extended with the ones
+        found afterwards.
+
+    classes : bool, optional
+        When ``True``, the attribute is the class with the same name
+        defined in the submodule instead of the submodule itself.
+
+    Returns
+    -------
+    __getattr__ : function
+
+    __dir__ : function
+    """
+    module = sys.modules[module_name]
+    lazy_names = set(names)
+    if classes:
+        module.__dict__["_lazy_classes"] = lazy_names
+        module.__class__ = _ClassesModule
+
+    def __getattr__(name):
+        if name not in lazy_names and not name.startswith("_"):
+            for new_name in _package_names(module.__path__, classes):
+                if new_name not in lazy_names:
+                    lazy_names.add(new_name)
+                    names.append(new_name)
+        if name not in lazy_names:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        attribute = importlib.import_module("." + name, module_name)
+        if classes:
+            attribute = getattr(attribute, name)
+        setattr(module, name, attribute)
+        return attribute
+
+    def __dir__():
+        return sorted(set(module.__dict__) | lazy_names)
+
+    return __getattr__, __dir__
+
+
+def _write_init(path, template, names):
+    with open(os.path.join(path, "__init__.py"), "w") as init:
+        init.write(template.format(names="\n".join(f'    "{name}",' for name in names)))
+
+
+def _write_lazy_inits(path):
+    """Write the ``__init__`` files of the operators package in ``path``
+    and of its subpackages, listing the operators of the package files.
+
+    Parameters
+    ----------
+    path : str
+        Directory of the operators package.
+    """
+    subpackages = _package_names([path], classes=False)
+    _write_init(path, _PACKAGE_INIT, subpackages)
+    for name in subpackages:
+        subpackage = os.path.join(path, name)
+        _write_init(subpackage, _SUBPACKAGE_INIT, _package_names([subpackage], classes=True))
@@ -0,0 +1,182 @@
+"""
+BufferPool
+==========
+Reusable numpy buffers receiving the data streamed by the server.
+"""
+import os
+import tempfile
+
+import numpy as np
+
+# alignment in bytes of the buffers allocated by the client
+DEFAULT_ALIGNMENT = 64
+
+
+def aligned_empty(size, dtype, alignment=DEFAULT_ALIGNMENT):
+    """Return an uninitialized 1D numpy array whose data is aligned on
+    ``alignment`` bytes.
+
+    Parameters
+    ----------
+    size : int
+        Number of items.
+
+    dtype : numpy.dtype
+
+    alignment : int, optional
+        Alignment in bytes of the first item.
+
+    Returns
+    -------
+    array : numpy.ndarray
+    """
+    dtype = np.dtype(dtype)
+    nbytes = size * dtype.itemsize
+    raw = np.empty(nbytes + alignment, dtype=np.uint8)
+    offset = (-raw.ctypes.data) % alignment
+    return raw[offset:offset + nbytes].view(dtype)
+
+
+class BufferPool:
+    """Pool of aligned numpy buffers in which the data received from the
+    server is directly written.
+
+    A buffer obtained from the pool is owned by the caller until it is given
+    back with :func:`BufferPool.release`. Released buffers are reused by the
+    next requests of the same dtype and of a smaller or equal size, which
+    avoids allocating new memory for each field of a loop.
+
+    Parameters
+    ----------
+    directory : str, optional
+        When set, the buffers are ``numpy.memmap`` backed by temporary files
+        created in this directory instead of memory allocations. This allows
+        to receive data larger than the available memory. The files are
+        removed by :func:`BufferPool.close`.
+
+    alignment : int, optional
+        Alignment in bytes of the in-memory buffers.
+
+    max_buffers : int, optional
+        Maximum number of released buffers kept by the pool.
+
+    Examples
+    --------
+    Receive the data of several fields in the same buffers
+
+    >>> from ansys.dpf import core as dpf
+    >>> from ansys.dpf.core import examples
+    >>> model = dpf.Model(examples.msup_transient)
+    >>> fields_container = model.results.displacement.on_all_time_freqs.eval()
+    >>> pool = dpf.BufferPool()
+    >>> for field in fields_container:
+    ...     data = field.get_data(out=pool)
+    ...     max_disp = data.max()
+    ...     pool.release(data)
+
+    """
+
+    def __init__(self, directory=None, alignment=DEFAULT_ALIGNMENT, max_buffers=8):
+        self._directory = directory
+        self._alignment = alignment
+        self._max_buffers = max_buffers
+        self._free = []
+        # full buffers handed out, by address of their first item
+        self._in_use = {}
+        # files backing the memmap buffers
+        self._files = []
+
+    def get(self, size, dtype):
+        """Return a 1D buffer of ``size`` items of type ``dtype``.
+
+        Parameters
+        ----------
+        size : int
+
+        dtype : numpy.dtype
+
+        Returns
+        -------
+        buffer : numpy.ndarray
+        """
+        dtype = np.dtype(dtype)
+        best = None
+        for i, buffer in enumerate(self._free):
+            if buffer.dtype == dtype and buffer.size >= size:
+                if best is None or buffer.size < self._free[best].size:
+                    best = i
+        if best is not None:
+            buffer = self._free.pop(best)
+        else:
+            buffer = self._allocate(size, dtype)
+        self._in_use[buffer.ctypes.data] = buffer
+        return buffer[:size]
+
+    def release(self, buffer):
+        """Give a buffer obtained with :func:`BufferPool.get` back to the pool.
+
+        Parameters
+        ----------
+        buffer : numpy.ndarray
+        """
+        full_buffer = self._in_use.pop(buffer.ctypes.data, None)
+        if full_buffer is None:
+            raise ValueError("The buffer was not obtained from this pool or was already released.")
+        self._free.append(full_buffer)
+        if len(self._free) > self._max_buffers:
+            self._free.sort(key=lambda free: free.size)
+            self._free.pop(0)
+
+    def clear(self):
+        """Forget all the released buffers."""
+        self._free.clear()
+
+    def close(self):
+        """Forget all the buffers and remove their files.
+
+        The buffers obtained from the pool must not be used anymore: an
+        open mapping prevents its file from being removed on Windows.
+        """
+        self._free.clear()
+        self._in_use.clear()
+        files, self._files = self._files, []
+        for path in files:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    @property
+    def in_use(self):
+        """Number of buffers obtained from the pool and not released yet.
+
+        Returns
+        -------
+        in_use : int
+        """
+        return len(self._in_use)
+
+    def _allocate(self, size, dtype):
+        if self._directory is None:
+            return aligned_empty(size, dtype, self._alignment)
+        if size == 0:
+            return np.empty(0, dtype)
+        fd, path = tempfile.mkstemp(suffix=".dpf", dir=self._directory)
+        os.close(fd)
+        self._files.append(path)
+        return np.memmap(path, dtype=dtype, mode="w+", shape=(size,))
+
+    def __len__(self):
+        return len(self._free)
@@ -0,0 +1,276 @@
+"""
+Channel
+=======
+Options of the gRPC channels opened to a DPF server.
+"""
+import collections
+import itertools
+import os
+
+import grpc
+
+from ansys.dpf.core import profiling
+
+# environment variables giving the default channel options
+_ENV_MAX_MESSAGE_LENGTH = "DPF_GRPC_MAX_MESSAGE_LENGTH"
+_ENV_KEEPALIVE_TIME_MS = "DPF_GRPC_KEEPALIVE_TIME_MS"
+_ENV_KEEPALIVE_TIMEOUT_MS = "DPF_GRPC_KEEPALIVE_TIMEOUT_MS"
+_ENV_COMPRESSION = "DPF_GRPC_COMPRESSION"
+_ENV_STREAMING_COMPRESSION = "DPF_GRPC_STREAMING_COMPRESSION"
+_ENV_N_CHANNELS = "DPF_GRPC_CHANNELS"
+
+_COMPRESSIONS = {
+    "none": grpc.Compression.NoCompression,
+    "gzip": grpc.Compression.Gzip,
+    "deflate": grpc.Compression.Deflate,
+}
+
+
+def _env_int(name):
+    value = os.environ.get(name)
+    return int(value) if value else None
+
+
+def _compression(name):
+    """Return the ``grpc.Compression`` of a compression name"""
+    if name is None or isinstance(name, grpc.Compression):
+        return name
+    try:
+        return _COMPRESSIONS[name.lower()]
+    except KeyError:
+        raise ValueError(f'Invalid compression "{name}", '
+                         f'expected one of {list(_COMPRESSIONS)}') from None
+
+
+class ChannelOptions:
+    """Options of the gRPC channels opened to a DPF server.
+
+    Each option not given is read from an environment variable, and left
+    to the gRPC default when the variable is not set.
+
+    Parameters
+    ----------
+    max_send_message_length : int, optional
+        Maximum size in bytes of the messages sent to the server.
+        Environment variable: ``DPF_GRPC_MAX_MESSAGE_LENGTH``.
+
+    max_receive_message_length : int, optional
+        Maximum size in bytes of the messages received from the server.
+        Environment variable: ``DPF_GRPC_MAX_MESSAGE_LENGTH``.
+
+    keepalive_time_ms : int, optional
+        Period in milliseconds of the keepalive pings sent on idle
+        connections. Environment variable: ``DPF_GRPC_KEEPALIVE_TIME_MS``.
+
+    keepalive_timeout_ms : int, optional
+        Time in milliseconds waited for a keepalive ping acknowledgment
+        before closing the connection.
+        Environment variable: ``DPF_GRPC_KEEPALIVE_TIMEOUT_MS``.
+
+    compression : str, optional
+        Compression of the unary calls: ``"gzip"``, ``"deflate"`` or
+        ``"none"``. Environment variable: ``DPF_GRPC_COMPRESSION``.
+
+    streaming_compression : str, optional
+        Compression of the streaming calls (field data and scoping ids
+        transfers), ``compression`` by default.
+        Environment variable: ``DPF_GRPC_STREAMING_COMPRESSION``.
+
+    n_channels : int, optional
+        Number of channels opened to the server. Concurrent streaming calls
+        are distributed between the channels in turn, which can increase
+        the aggregate throughput. Environment variable:
+        ``DPF_GRPC_CHANNELS``.
+
+    interceptors : list, optional
+        Additional gRPC client interceptors installed on the channel, for
+        example to trace the calls.
+
+    Examples
+    --------
+    Compress the transfers of arrays and open 4 channels to a remote server
+
+    >>> from ansys.dpf import core as dpf
+    >>> options = dpf.ChannelOptions(streaming_compression="gzip", n_channels=4,
+    ...                              keepalive_time_ms=30000)
+    >>> server = dpf.connect_to_server("127.0.0.1", 50054, as_global=False,
+    ...                                channel_options=options) # doctest: +SKIP
+
+    """
+
+    def __init__(self, max_send_message_length=None, max_receive_message_length=None,
+                 keepalive_time_ms=None, keepalive_timeout_ms=None,
+                 compression=None, streaming_compression=None, n_channels=None,
+                 interceptors=None):
+        if max_send_message_length is None:
+            max_send_message_length = _env_int(_ENV_MAX_MESSAGE_LENGTH)
+        if max_receive_message_length is None:
+            max_receive_message_length = _env_int(_ENV_MAX_MESSAGE_LENGTH)
+        if keepalive_time_ms is None:
+            keepalive_time_ms = _env_int(_ENV_KEEPALIVE_TIME_MS)
+        if keepalive_timeout_ms is None:
+            keepalive_timeout_ms = _env_int(_ENV_KEEPALIVE_TIMEOUT_MS)
+        if compression is None:
+            compression = os.environ.get(_ENV_COMPRESSION) or None
+        if streaming_compression is None:
+            streaming_compression = os.environ.get(_ENV_STREAMING_COMPRESSION) or compression
+        if n_channels is None:
+            n_channels = _env_int(_ENV_N_CHANNELS) or 1
+        if n_channels < 1:
+            raise ValueError("n_channels must be a positive number of channels")
+        self.max_send_message_length = max_send_message_length
+        self.max_receive_message_length = max_receive_message_length
+        self.keepalive_time_ms = keepalive_time_ms
+        self.keepalive_timeout_ms = keepalive_timeout_ms
+        self.compression = _compression(compression)
+        self.streaming_compression = _compression(streaming_compression)
+        self.n_channels = n_channels
+        self.interceptors = list(interceptors) if interceptors else None
+
+    def grpc_options(self):
+        """Return the options given to ``grpc.insecure_channel``.
+
+        Returns
+        -------
+        options : list[tuple]
+        """
+        options = []
+        if self.max_send_message_length is not None:
+            options.append(("grpc.max_send_message_length", self.max_send_message_length))
+        if self.max_receive_message_length is not None:
+            options.append(("grpc.max_receive_message_length", self.max_receive_message_length))
+        if self.keepalive_time_ms is not None:
+            options.append(("grpc.keepalive_time_ms", self.keepalive_time_ms))
+            options.append(("grpc.keepalive_permit_without_calls", 1))
+            options.append(("grpc.http2.max_pings_without_data", 0))
+        if self.keepalive_timeout_ms is not None:
+            options.append(("grpc.keepalive_timeout_ms", self.keepalive_timeout_ms))
+        return options
+
+    def __repr__(self):
+        options = ", ".join(f"{key}={value!r}" for key, value in vars(self).items()
+                            if value is not None)
+        return f"ChannelOptions({options})"
+
+
+class _ClientCallDetails(
+        collections.namedtuple("_ClientCallDetails",
+                               ("method", "timeout", "metadata", "credentials",
+                                "wait_for_ready", "compression")),
+        grpc.ClientCallDetails):
+    pass
+
+
+class _CompressionInterceptor(grpc.UnaryUnaryClientInterceptor,
+                              grpc.UnaryStreamClientInterceptor,
+                              grpc.StreamUnaryClientInterceptor,
+                              grpc.StreamStreamClientInterceptor):
+    """Set the compression of the calls which do not request one, depending
+    on whether they are unary or streaming calls"""
+
+    def __init__(self, compression, streaming_compression):
+        self._compression = compression
+        self._streaming_compression = streaming_compression
+
+    def _details(self, details, compression):
+        if compression is None or details.compression is not None:
+            return details
+        return _ClientCallDetails(details.method, details.timeout, details.metadata,
+                                  details.credentials, details.wait_for_ready, compression)
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        return continuation(self._details(client_call_details, self._compression), request)
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        return continuation(self._details(client_call_details, self._streaming_compression),
+                            request)
+
+    def intercept_stream_unary(self, continuation, client_call_details, request_iterator):
+        return continuation(self._details(client_call_details, self._streaming_compression),
+                            request_iterator)
+
+    def intercept_stream_stream(self, continuation, client_call_details, request_iterator):
+        return continuation(self._details(client_call_details, self._streaming_compression),
+                            request_iterator)
+
+
+class _StripedMultiCallable:
+    """Multi-callable sending each call on the next channel in turn"""
+
+    def __init__(self, callables):
+        self._callables = callables
+        self._next = itertools.count()
+
+    def _callable(self):
+        return self._callables[next(self._next) % len(self._callables)]
+
+    def __call__(self, *args, **kwargs):
+        return self._callable()(*args, **kwargs)
+
+    def with_call(self, *args, **kwargs):
+        return self._callable().with_call(*args, **kwargs)
+
+    def future(self, *args, **kwargs):
+        return self._callable().future(*args, **kwargs)
+
+
+class _StripedChannel(grpc.Channel):
+    """Channel sending the unary calls on its first channel and striping the
+    streaming calls across all its channels"""
+
+    def __init__(self, channels):
+        self._channels = channels
+
+    def subscribe(self, callback, try_to_connect=False):
+        self._channels[0].subscribe(callback, try_to_connect)
+
+    def unsubscribe(self, callback):
+        self._channels[0].unsubscribe(callback)
+
+    def unary_unary(self, method, *args, **kwargs):
+        return self._channels[0].unary_unary(method, *args, **kwargs)
+
+    def unary_stream(self, method, *args, **kwargs):
+        return _StripedMultiCallable([channel.unary_stream(method, *args, **kwargs)
+                                      for channel in self._channels])
+
+    def stream_unary(self, method, *args, **kwargs):
+        return _StripedMultiCallable([channel.stream_unary(method, *args, **kwargs)
+                                      for channel in self._channels])
+
+    def stream_stream(self, method, *args, **kwargs):
+        return _StripedMultiCallable([channel.stream_stream(method, *args, **kwargs)
+                                      for channel in self._channels])
+
+    def close(self):
+        for channel in self._channels:
+            channel.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+def _open_channel(target, channel_options):
+    """Open the channel(s) to ``target`` configured by ``channel_options``"""
+    options = channel_options.grpc_options()
+    if channel_options.n_channels > 1:
+        # distinct subchannel pools open one connection per channel
+        options = options + [("grpc.use_local_subchannel_pool", 1)]
+    interceptor = None
+    if channel_options.compression is not None or channel_options.streaming_compression is not None:
+        interceptor = _CompressionInterceptor(channel_options.compression,
+                                              channel_options.streaming_compression)
+    channels = []
+    for _ in range(channel_options.n_channels):
+        channel = grpc.insecure_channel(target, options=options)
+        if interceptor is not None:
+            channel = grpc.intercept_channel(channel, interceptor)
+        channels.append(channel)
+    channel = channels[0] if len(channels) == 1 else _StripedChannel(channels)
+    # recording the calls of dpf.profiling.record()
+    interceptors = [profiling._INTERCEPTOR] + (channel_options.interceptors or [])
+    return grpc.intercept_channel(channel, *interceptors)
@@ -7,6 +7,17 @@ Used to verify if the server version is a minimum value.
 from ansys.dpf.core import errors as dpf_errors
 import sys
 
+# minimum server version providing each feature checked by the client
+CAPABILITIES = {
+    # scoping ids and field data streamed as contiguous chunks
+    "streaming_ids": "2.1",
+    # named selections returned as scopings by the meshed region service
+    "named_selection_scoping": "2.1",
+    # field data sent in single precision with ``float_or_double=float``
+    "float_transfer": "2.0",
+}
+
+
 def server_meet_version(required_version, server):
     """
     Check if a given server version matches with a required version.
@@ -24,9 +35,10 @@ def server_meet_version(required_version, server):
     bool : 
         True if the server version meets the requirement.
     """
-    version = get_server_version(server)
-    meets = version_tuple(required_version)
-    return meets_version(version, meets)
+    if server is None:
+        from ansys.dpf import core
+        server = core.SERVER
+    return server.meet_version(required_version)
 
 
 def server_meet_version_and_raise(required_version, server, msg = None):
@@ -16,6 +16,7 @@ from ansys.dpf.core.time_freq_support import TimeFreqSupport
 from ansys.dpf.core.errors import protect_grpc
 from ansys.dpf.core import server
 from ansys.dpf.core.scoping import Scoping
+from ansys.dpf.core.session_scope import _record
 
 
 class Collection:
@@ -46,6 +47,7 @@ class Collection:
         self._stub = self._connect()
         self._type = dpf_type
         # self.__info = None  # cached info
+        self._label_spaces = None  # label spaces of the entries by index
 
         if collection is None:
             request = collection_pb2.CollectionRequest()
@@ -55,11 +57,13 @@ class Collection:
                 stype = dpf_type
             request.type = base_pb2.Type.Value(stype.upper())
             self._message = self._stub.Create(request)
+            _record(self)
         elif hasattr(collection, '_message'):
             self._message = collection._message
             self._collection = collection #keep the base collection used for copy
         else:
             self._message = collection
+            _record(self)
 
     def set_labels(self, labels):
         """set the requested labels to scope the collection
@@ -78,6 +82,7 @@ class Collection:
         request.collection.CopyFrom(self._message)
         request.labels.extend([collection_pb2.NewLabel(label=lab) for lab in labels])
         self._stub.UpdateLabels(request)
+        self._label_spaces = None
 
     def add_label(self, label, default_value =None):
         """Add the requested label to scope the collection
@@ -104,6 +109,7 @@ class Collection:
             new_label.default_value.default_value=default_value
         request.labels.extend([new_label])
         self._stub.UpdateLabels(request)
+        self._label_spaces = None
 
     def _get_labels(self):
         """get the labels scoping the collection
@@ -171,22 +177,103 @@ class Collection:
         out = self._stub.GetEntries(request)
         list_out =[]
         for obj in out.entries :
-            if obj.HasField("dpf_type"):
-                if self._type == types.scoping:
-                    unpacked_msg = scoping_pb2.Scoping()
-                    obj.dpf_type.Unpack(unpacked_msg)
-                    list_out.append(Scoping(scoping=unpacked_msg, server=self._server))
-                elif self._type == types.field:
-                    unpacked_msg = field_pb2.Field()
-                    obj.dpf_type.Unpack(unpacked_msg)
-                    list_out.append(Field(field=unpacked_msg, server=self._server))
-                elif self._type == types.meshed_region:
-                    unpacked_msg = meshed_region_pb2.MeshedRegion()
-                    obj.dpf_type.Unpack(unpacked_msg)
-                    list_out.append(MeshedRegion(mesh=unpacked_msg, server=self._server))
+            entry = self._entry_from_message(obj)
+            if entry is not None:
+                list_out.append(entry)
         if len(list_out)==0:
             list_out=None
         return list_out  
+
+    def _entry_from_message(self, obj):
+        """Returns the entry wrapped in an entry message, or ``None`` for
+        entries which are not dpf types"""
+        if obj.HasField("dpf_type"):
+            if self._type == types.scoping:
+                unpacked_msg = scoping_pb2.Scoping()
+                obj.dpf_type.Unpack(unpacked_msg)
+                return Scoping(scoping=unpacked_msg, server=self._server)
+            elif self._type == types.field:
+                unpacked_msg = field_pb2.Field()
+                obj.dpf_type.Unpack(unpacked_msg)
+                return Field(field=unpacked_msg, server=self._server)
+            elif self._type == types.meshed_region:
+                unpacked_msg = meshed_region_pb2.MeshedRegion()
+                obj.dpf_type.Unpack(unpacked_msg)
+                return MeshedRegion(mesh=unpacked_msg, server=self._server)
+        return None
+
+    def get_all_entries(self):
+        """Returns all the entries of the collection and their label spaces,
+        retrieved from the server in one call.
+
+        The label spaces are cached on the client and used by
+        :func:`get_label_space` and :func:`get_available_ids_for_label`.
+
+        Returns
+        -------
+        entries : list[Scoping], list[Field], list[MeshedRegion]
+            Entries ordered by index.
+
+        label_spaces : list[dict(str:int)]
+            Label space of each entry, for example:
+            ``{"time": 1, "complex": 0}``
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.msup_transient)
+        >>> fields_container = model.results.displacement.on_all_time_freqs.eval()
+        >>> fields, label_spaces = fields_container.get_all_entries()
+        >>> label_spaces[0]
+        {'time': 1}
+
+        """
+        # an empty label space matches all the entries
+        request = collection_pb2.EntryRequest()
+        request.collection.CopyFrom(self._message)
+        request.label_space.SetInParent()
+        out = self._stub.GetEntries(request).entries
+        size = len(self)
+        if len(out) != size or size > 1 and not self._ordered_by_index(out):
+            # the server did not return all the entries for an empty label
+            # space, or not by index: request them one by one
+            out = [self._entry_at_index(index) for index in range(size)]
+        entries = [self._entry_from_message(obj) for obj in out]
+        self._label_spaces = [dict(obj.label_space.label_space) for obj in out]
+        return entries, [dict(label_space) for label_space in self._label_spaces]
+
+    def _entry_at_index(self, index):
+        """Returns the entry message at an index"""
+        request = collection_pb2.EntryRequest()
+        request.collection.CopyFrom(self._message)
+        request.index = index
+        return self._stub.GetEntries(request).entries[0]
+
+    def _ordered_by_index(self, entries):
+        """Whether the entries matching an empty label space are ordered by
+        index, which the server does not document: the label spaces of the
+        first and last entries are checked, the label spaces of a
+        collection being unique."""
+        return all(entries[index].label_space == self._entry_at_index(index).label_space
+                   for index in (0, len(entries) - 1))
+
+    def get_label_spaces(self):
+        """Returns the label spaces of all the entries of the collection.
+
+        The label spaces are retrieved from the server in one call the first
+        time and then cached on the client until the collection is modified
+        through this object.
+
+        Returns
+        -------
+        label_spaces : list[dict(str:int)]
+            Label space of each entry, for example:
+            ``{"time": 1, "complex": 0}``
+        """
+        if self._label_spaces is None:
+            self.get_all_entries()
+        return [dict(label_space) for label_space in self._label_spaces]
     
     
     def _get_entry(self, label_space_or_index):
@@ -227,6 +314,8 @@ class Collection:
             Scoping of the requested entry, for example:
             ``{"time": 1, "complex": 0}``
         """
+        if self._label_spaces is not None and 0 <= index < len(self._label_spaces):
+            return dict(self._label_spaces[index])
         request = collection_pb2.EntryRequest()
         request.collection.CopyFrom(self._message)
         request.index = index
@@ -253,9 +342,10 @@ class Collection:
             ids corresponding to the input label
         """
         ids = []
-        for i in range(len(self)):
-            current_scop = self.get_label_space(i)
-            if label in current_scop and current_scop[label] not in ids:
+        found = set()
+        for current_scop in self.get_label_spaces():
+            if label in current_scop and current_scop[label] not in found:
+                found.add(current_scop[label])
                 ids.append(current_scop[label])
         return ids
     
@@ -327,6 +417,7 @@ class Collection:
         for key in label_space:
             request.label_space.label_space[key] = label_space[key]
         self._stub.UpdateEntry(request)
+        self._label_spaces = None
         
     def _get_time_freq_support(self):
         """
@@ -380,10 +471,11 @@ class Collection:
 
     def __del__(self):
         try:
-            self._stub.Delete(self._message)
+            self._server.release_queue.push(self._stub.Delete, self._message)
         except:
             pass
 
     def __iter__(self):
-        for i in range(len(self)):
-            yield self[i]
+        entries, _ = self.get_all_entries()
+        for entry in entries:
+            yield entry
@@ -112,6 +112,70 @@ class DefinitionLabels:
     time = "time"
     complex = "complex"
     
+def _varints(values):
+    """Encode integers as protobuf varints.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        Integers, negative values are encoded on 10 bytes like protobuf
+        does for ``int32`` and ``int64`` fields.
+
+    Returns
+    -------
+    encoded : numpy.ndarray
+        ``numpy.uint8`` array of shape ``(len(values), width)`` where
+        ``width`` is the length of the longest varint, the varint of
+        ``values[i]`` is ``encoded[i, :lengths[i]]``.
+
+    lengths : numpy.ndarray
+        Number of bytes of each varint.
+    """
+    values = np.ascontiguousarray(values, dtype=np.int64).reshape(-1).view(np.uint64)
+    lengths = np.ones(values.size, dtype=np.int64)
+    for i in range(1, 10):
+        longer = values >= np.uint64(1 << (7 * i))
+        if not longer.any():
+            break
+        lengths += longer
+    width = int(lengths.max()) if values.size else 1
+    encoded = np.empty((values.size, width), dtype=np.uint8)
+    for i in range(width):
+        encoded[:, i] = (values >> np.uint64(7 * i)) & np.uint64(0x7F)
+        if i < width - 1:
+            encoded[:, i] |= (lengths > i + 1).view(np.uint8) << 7
+    return encoded, lengths
+
+
+def _join_varints(values):
+    """Encode integers as consecutive protobuf varints.
+
+    Returns
+    -------
+    encoded : numpy.ndarray
+        ``numpy.uint8`` array of the concatenated varints.
+
+    lengths : numpy.ndarray
+        Number of bytes of each varint.
+    """
+    encoded, lengths = _varints(values)
+    return encoded[np.arange(encoded.shape[1]) < lengths[:, None]], lengths
+
+
+# ``float_or_double`` metadata requesting the field data in each precision
+_FLOAT_OR_DOUBLE = {np.dtype(np.float64): u"double", np.dtype(np.float32): u"float"}
+
+
+def _float_or_double(dtype):
+    """Return the ``float_or_double`` metadata value requesting field data
+    of type ``dtype`` (``numpy.float64`` or ``numpy.float32``)"""
+    try:
+        return _FLOAT_OR_DOUBLE[np.dtype(dtype)]
+    except (KeyError, TypeError):
+        raise ValueError(f'Invalid dtype "{dtype}", expected numpy.float64 '
+                         f'or numpy.float32') from None
+
+
 def _common_progress_bar(text, unit, tot_size=None):
     
     if tot_size:
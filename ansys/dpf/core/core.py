@@ -368,6 +368,9 @@ class BaseService():
             code_gen.run()    
             
             self.download_files_in_folder(TARGET_PATH, LOCAL_PATH,"py")
+            # the generated package imports all the operators
+            from ansys.dpf.core._lazy_operators import _write_lazy_inits
+            _write_lazy_inits(LOCAL_PATH)
             
     
     @property
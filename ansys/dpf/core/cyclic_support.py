@@ -266,6 +266,6 @@ class CyclicSupport:
 
     def __del__(self):
         try:
-            self._stub.Delete(self._message)
+            self._server.release_queue.push(self._stub.Delete, self._message)
         except:
             pass
@@ -9,6 +9,7 @@ import os
 from ansys import dpf
 from ansys.grpc.dpf import data_sources_pb2, data_sources_pb2_grpc, base_pb2
 from ansys.dpf.core.errors import protect_grpc
+from ansys.dpf.core.session_scope import _record
 
 
 class DataSources:
@@ -52,6 +53,7 @@ class DataSources:
             self._message = self._stub.Create(request)
         else:
             self._message = data_sources
+        _record(self)
 
         if result_path is not None:
             self.set_result_file_path(result_path)
@@ -257,6 +259,6 @@ class DataSources:
 
     def __del__(self):
         try:  # should silently fail
-            self._stub.Delete(self._message)
+            self._server.release_queue.push(self._stub.Delete, self._message)
         except:
             pass
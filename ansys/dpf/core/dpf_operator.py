@@ -17,6 +17,8 @@ from ansys.dpf.core.errors import protect_grpc
 from ansys.dpf.core.config import Config
 from ansys.dpf.core.mapping_types import types
 from ansys.dpf.core import server as serverlib
+from ansys.dpf.core import output_cache, result_cache
+from ansys.dpf.core.session_scope import _record
 
 LOG = logging.getLogger(__name__)
 LOG.setLevel('DEBUG')
@@ -72,17 +74,31 @@ class Operator:
         self._description = None
         self._inputs = None
         self._outputs = None
+        # inputs connected by pin, and configuration options, identifying
+        # the outputs in the result cache. The inputs are None once the
+        # operator is added to a workflow, which can connect it.
+        self._connections = {}
+        self._config_options = () if config is None else None
 
         self.__send_init_request(config)
+        _record(self)
         
-        # add dynamic inputs
-        if len(self._message.spec.map_input_pin_spec) > 0 and self._inputs==None:
-            self._inputs = Inputs(self._message.spec.map_input_pin_spec, self)
-        if len(self._message.spec.map_output_pin_spec) != 0 and self._outputs==None:
-            self._outputs = Outputs(self._message.spec.map_output_pin_spec, self)
+        # add dynamic inputs, generated operators create their own
+        if not hasattr(self.__class__, "_spec"):
+            if len(self._message.spec.map_input_pin_spec) > 0 and self._inputs==None:
+                self._inputs = Inputs(self._message.spec.map_input_pin_spec, self)
+            if len(self._message.spec.map_output_pin_spec) != 0 and self._outputs==None:
+                self._outputs = Outputs(self._message.spec.map_output_pin_spec, self)
         
         self._description = self._message.spec.description
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # the specification of a generated operator is built once per class
+        spec = cls.__dict__.get("_spec")
+        if isinstance(spec, staticmethod):
+            cls._spec = staticmethod(functools.lru_cache(maxsize=None)(spec.__func__))
+
     def _add_sub_res_operators(self, sub_results):
         """Dynamically add operators instantiating for sub-results.
 
@@ -144,6 +160,11 @@ class Operator:
         if inpt is self:
             raise ValueError('Cannot connect to itself')
         self._stub.Update(request)
+        if self._connections is not None:
+            # a list is copied: the values sent are the ones identifying the outputs
+            self._connections[pin] = (tuple(inpt) if isinstance(inpt, list) else inpt, pin_out)
+        if output_cache._cache is not None:
+            output_cache._cache.invalidate(self)
     
         
     @protect_grpc
@@ -157,18 +178,110 @@ class Operator:
 
         output_type : core.type enum, optional
             The requested type of the output.
+
+        Notes
+        -----
+        Fields and fields containers are read from the output cache and
+        from the result cache when they are enabled, see
+        :mod:`ansys.dpf.core.output_cache` and
+        :mod:`ansys.dpf.core.result_cache`.
+        """
+        cache = output_cache._cache
+        if cache is not None and output_type in output_cache._CACHED_TYPES:
+            return cache.get_output(self, pin, output_type)
+        return self._read_output(pin, output_type)
+
+    def _read_output(self, pin, output_type):
+        """Output read from the result cache, else evaluated"""
+        cache = result_cache._cache
+        if cache is not None and output_type in result_cache._CACHED_TYPES:
+            return cache.get_output(self, pin, output_type)
+        return self._evaluate(pin, output_type)
+
+    def _evaluate(self, pin, output_type):
+        request = self._get_output_request(pin, output_type)
+        return self._convert_output(self._stub.Get(request), output_type)
+
+    def get_output_async(self, pin=0, output_type=None):
+        """Requests the output of the operator on the pin number without
+        waiting for its evaluation.
+
+        Several operators can be evaluated concurrently by the server
+        by requesting their outputs before waiting for any of them.
+
+        Parameters
+        ----------
+        pin : int, optional
+            Number of the output pin.
+
+        output_type : core.type enum, optional
+            The requested type of the output.
+
+        Returns
+        -------
+        future : OutputFuture
+            Future whose ``result()`` is the output.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.static_rst)
+        >>> disp = model.results.displacement()
+        >>> future = disp.get_output_async(0, dpf.types.fields_container)
+        >>> fields_container = future.result()
+
+        """
+        from ansys.dpf.core.futures import OutputFuture
+        request = self._get_output_request(pin, output_type)
+        return OutputFuture(self._stub.Get.future(request),
+                            functools.partial(self._convert_output, output_type=output_type),
+                            owner=self)
+
+    @protect_grpc
+    async def get_output_aio(self, pin=0, output_type=None):
+        """Coroutine returning the output of the operator on the pin number.
+
+        The evaluation request is sent with the ``grpc.aio`` API on the
+        running event loop.
+
+        Parameters
+        ----------
+        pin : int, optional
+            Number of the output pin.
+
+        output_type : core.type enum, optional
+            The requested type of the output.
+
+        Examples
+        --------
+        >>> import asyncio
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.static_rst)
+        >>> disp = model.results.displacement()
+        >>> fields_container = asyncio.run(disp.get_output_aio(0, dpf.types.fields_container))
+
         """
+        request = self._get_output_request(pin, output_type)
+        stub = operator_pb2_grpc.OperatorServiceStub(self._server._aio_channel())
+        out = await stub.Get(request)
+        return self._convert_output(out, output_type)
+
+    def _get_output_request(self, pin, output_type):
         request = operator_pb2.OperatorEvaluationRequest()
         request.op.CopyFrom(self._message)
         request.pin = pin
-        
         if output_type is not None:
             _write_output_type_to_proto_style(output_type, request)
-            out = self._stub.Get(request)
-            return _convertOutputMessageToPythonInstance(out, output_type, self._server)
         else:
             request.type = base_pb2.Type.Value('RUN')
-            return self._stub.Get(request)
+        return request
+
+    def _convert_output(self, out, output_type):
+        if output_type is not None:
+            return _convertOutputMessageToPythonInstance(out, output_type, self._server)
+        return out
             
     
     @property
@@ -199,6 +312,9 @@ class Operator:
         request.op.CopyFrom(self._message)
         request.config.CopyFrom(value._message)
         self._stub.UpdateConfig(request)
+        self._config_options = None
+        if output_cache._cache is not None:
+            output_cache._cache.invalidate(self)
         
     @property
     def inputs(self):
@@ -267,7 +383,7 @@ class Operator:
 
     def __del__(self):
         try:
-            self._stub.Delete(self._message)
+            self._server.release_queue.push(self._stub.Delete, self._message)
         except:
             pass
 
@@ -488,7 +604,7 @@ def _convertOutputMessageToPythonInstance(out, output_type, server):
 def _fillConnectionRequestMessage(request, inpt, pin_out=0):
     from ansys.dpf.core import (fields_container, field, property_field, field_base, scopings_container, scoping,
                             meshes_container, meshed_region, result_info, time_freq_support, collection, data_sources,
-                            collection, data_sources, cyclic_support, model)
+                            collection, data_sources, cyclic_support, model, expressions)
     if isinstance(inpt, str):
         request.str = inpt
     elif isinstance(inpt, bool):
@@ -522,6 +638,9 @@ def _fillConnectionRequestMessage(request, inpt, pin_out=0):
     elif isinstance(inpt, Output):
         request.inputop.inputop.CopyFrom(inpt._operator._message)
         request.inputop.pinOut = inpt._pin
+    elif isinstance(inpt, expressions.Expression):
+        request.inputop.inputop.CopyFrom(inpt.operator()._message)
+        request.inputop.pinOut = 0
     else:
         errormsg = f"input type {inpt.__class__} cannot be connected"
         raise TypeError(errormsg)
@@ -13,7 +13,7 @@ from ansys.grpc.dpf import meshed_region_pb2
 from ansys.dpf.core.errors import protect_grpc
 from ansys.dpf.core.common import locations
 from ansys.dpf.core import nodes
-from ansys.dpf.core.common import __write_enum_doc__
+from ansys.dpf.core.common import __write_enum_doc__, _varints, _join_varints
 
 class Element:
     """An element of the mesh. Encapsulates all the properties of an element: 
@@ -195,6 +195,7 @@ class Elements():
     def __init__(self, mesh):
         self._mesh = mesh
         self._mapping_id_to_index = None
+        self._scoping_index = None
 
     def __str__(self):
         return 'DPF Elements object with %d elements' % len(self)
@@ -289,7 +290,55 @@ class Elements():
             element_request.shape =meshed_region_pb2.ElementShape.Value(add.shape.upper())
             request.elements.append(element_request)  
         self._mesh._stub.Add(request)
+        self._clear_mappings()
     
+    @staticmethod
+    def _shapes_from_types(element_type_values):
+        """Return the ``meshed_region_pb2.ElementShape`` values of an array
+        of element types values."""
+        values = np.asarray(element_type_values, dtype=np.int64).reshape(-1)
+        offset = -min(e.value for e in element_types)
+        table = np.full(max(e.value for e in element_types) + offset + 1,
+                        meshed_region_pb2.UNKNOWN_SHAPE)
+        for element_type, shape in element_types._shapes().items():
+            table[element_type.value + offset] = meshed_region_pb2.ElementShape.Value(shape.upper())
+        shapes = np.full(values.size, meshed_region_pb2.UNKNOWN_SHAPE)
+        known = (values + offset >= 0) & (values + offset < table.size)
+        shapes[known] = table[values[known] + offset]
+        return shapes
+
+    def _add_elements_from_arrays(self, ids, shapes, connectivity, offsets):
+        """Add elements in the mesh with a few requests, each of them holding
+        the elements fitting in the server's chunk size.
+
+        Parameters
+        ----------
+        ids : numpy.ndarray
+            Ids of the elements.
+
+        shapes : numpy.ndarray
+            ``meshed_region_pb2.ElementShape`` values of the elements.
+
+        connectivity : numpy.ndarray
+            Nodes indices connected to all the elements.
+
+        offsets : numpy.ndarray
+            ``len(ids) + 1`` offsets, the connectivity of the element ``i`` is
+            ``connectivity[offsets[i]:offsets[i+1]]``.
+        """
+        ids = np.asarray(ids).reshape(-1)
+        shapes = np.asarray(shapes).reshape(-1)
+        connectivity = np.asarray(connectivity).reshape(-1)
+        offsets = np.asarray(offsets, dtype=np.int64).reshape(-1)
+        for start in range(0, ids.size, nodes._ENCODING_BATCH_SIZE):
+            stop = min(start + nodes._ENCODING_BATCH_SIZE, ids.size)
+            batch_offsets = offsets[start:stop + 1]
+            self._mesh._add_serialized(*_encode_elements(
+                ids[start:stop], shapes[start:stop],
+                connectivity[batch_offsets[0]:batch_offsets[-1]],
+                batch_offsets - batch_offsets[0]))
+        self._clear_mappings()
+
     def add_solid_element(self, id, connectivity):
         """Appends a new solid 3D element in the mesh
         
@@ -364,6 +413,7 @@ class Elements():
         element_request.shape = meshed_region_pb2.ElementShape.Value(shape.upper())
         request.elements.extend([element_request])
         self._mesh._stub.Add(request)
+        self._clear_mappings()
     
     @protect_grpc
     def __get_element(self, elementindex=None, elementid=None):
@@ -489,7 +539,8 @@ class Elements():
 
     def _build_mapping_id_to_index(self):
         """Return a mapping between ids and indices of the entity."""
-        return {eid: i for i, eid in enumerate(self.scoping.ids)}
+        ids = self.scoping_index.ids.tolist()
+        return dict(zip(ids, range(len(ids))))
 
     @property
     def mapping_id_to_index(self) -> dict:
@@ -507,6 +558,33 @@ class Elements():
             self._mapping_id_to_index = self._build_mapping_id_to_index()
         return self._mapping_id_to_index
 
+    @property
+    def scoping_index(self):
+        """Mapping between the ids and indices of the elements, computed
+        once and used to map the scopings of fields to these elements.
+
+        Returns
+        -------
+        scoping_index : ScopingIndex
+
+        Examples
+        --------
+        >>> import ansys.dpf.core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.static_rst)
+        >>> elements = model.metadata.meshed_region.elements
+        >>> index = elements.scoping_index
+        >>> indices, mask = index.map(elements.scoping)
+
+        """
+        if self._scoping_index is None:
+            self._scoping_index = scoping.ScopingIndex(self.scoping)
+        return self._scoping_index
+
+    def _clear_mappings(self):
+        self._mapping_id_to_index = None
+        self._scoping_index = None
+
     def map_scoping(self, external_scope):
         """Return the indices to map the scoping of these elements to
         the scoping of a field.
@@ -541,11 +619,8 @@ class Elements():
         
         """
         if external_scope.location in ['Nodal', 'NodalElemental']:
-            raise ValueError('Input scope location must be "Nodal"')
-        arr = np.array(list(map(self.mapping_id_to_index.get, external_scope.ids)))
-        mask = arr != None
-        ind = arr[mask].astype(np.int)
-        return ind, mask
+            raise ValueError('Input scope location must be "Elemental"')
+        return self.scoping_index.map(external_scope)
     
     @property
     def has_shell_elements(self) -> bool:
@@ -760,4 +835,64 @@ class element_types(Enum):
         return element_types._shapes().get(element_type, "unknown_shape")
         
 
+_ELEMENTS_TAG = nodes._tag(meshed_region_pb2.AddRequest, "elements", 2)
+_ELEMENT_ID_TAG = nodes._tag(meshed_region_pb2.ElementRequest, "id", 0)
+_ELEMENT_SHAPE_TAG = nodes._tag(meshed_region_pb2.ElementRequest, "shape", 0)
+_ELEMENT_CONNECTIVITY_TAG = nodes._tag(meshed_region_pb2.ElementRequest, "connectivity", 2)
+
+
+def _encode_elements(ids, shapes, connectivity, offsets):
+    """Serialize elements as the ``elements`` field of an ``AddRequest``.
+
+    Parameters
+    ----------
+    ids : numpy.ndarray
+
+    shapes : numpy.ndarray
+
+    connectivity : numpy.ndarray
+
+    offsets : numpy.ndarray
+        ``len(ids) + 1`` offsets in ``connectivity``.
+
+    Returns
+    -------
+    data : numpy.ndarray
+        ``numpy.uint8`` serialized elements.
+
+    ends : numpy.ndarray
+        End offset in ``data`` of each element.
+    """
+    n_elements = len(ids)
+    sizes = np.diff(offsets)
+    # all the fields of an ElementRequest are varints: each element is
+    # written as the varints [tag, length, tag, id, tag, shape, tag, length,
+    # connectivity...] and all of them are encoded at once
+    _, connectivity_lengths = _varints(connectivity)
+    element_index = np.repeat(np.arange(n_elements), sizes)
+    packed_lengths = np.bincount(element_index, weights=connectivity_lengths,
+                                 minlength=n_elements).astype(np.int64)
+    _, id_lengths = _varints(ids)
+    _, shape_lengths = _varints(shapes)
+    _, packed_length_lengths = _varints(packed_lengths)
+    element_lengths = 3 + id_lengths + shape_lengths + packed_length_lengths + packed_lengths
+    header = np.empty((n_elements, 8), dtype=np.int64)
+    header[:, 0] = _ELEMENTS_TAG
+    header[:, 1] = element_lengths
+    header[:, 2] = _ELEMENT_ID_TAG
+    header[:, 3] = ids
+    header[:, 4] = _ELEMENT_SHAPE_TAG
+    header[:, 5] = shapes
+    header[:, 6] = _ELEMENT_CONNECTIVITY_TAG
+    header[:, 7] = packed_lengths
+    values = np.empty(8 * n_elements + len(connectivity), dtype=np.int64)
+    header_starts = offsets[:-1] + 8 * np.arange(n_elements)
+    values[header_starts[:, None] + np.arange(8)] = header
+    values[np.arange(len(connectivity)) + 8 * (element_index + 1)] = connectivity
+    data, _ = _join_varints(values)
+    _, element_length_lengths = _varints(element_lengths)
+    ends = np.cumsum(1 + element_length_lengths + element_lengths)
+    return data, ends
+
+
 element_types.__doc__=__write_enum_doc__(element_types,"Types of elements available in a dpf's mesh.")
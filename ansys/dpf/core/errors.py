@@ -1,5 +1,7 @@
 from grpc._channel import _InactiveRpcError, _MultiThreadedRendezvous
+from grpc.aio import AioRpcError
 from functools import wraps
+from inspect import iscoroutinefunction
 
 _COMPLEX_PLOTTING_ERROR_MSG = """
 Complex fields can not be plotted. Use operators to get the amplitude
@@ -88,8 +90,29 @@ class InvalidPortError(OSError):
         OSError.__init__(self, msg)
 
 
+def _server_error(error):
+    """Return the dpf exception corresponding to a gRPC error"""
+    details = error.details()
+    if 'object is null in the dataBase' in details:
+        return DPFServerNullObject(details)
+    return DPFServerException(details)
+
+
 def protect_grpc(func):
     """Capture gRPC exceptions and return a more succinct error message"""
+    if iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            """Capture grpc.aio exceptions"""
+            try:
+                out = await func(*args, **kwargs)
+            except AioRpcError as error:
+                raise _server_error(error) from None
+
+            return out
+
+        return async_wrapper
+
     @wraps(func)
     def wrapper(*args, **kwargs):
         """Capture gRPC exceptions"""
@@ -97,10 +120,7 @@ def protect_grpc(func):
         try:
             out = func(*args, **kwargs)
         except (_InactiveRpcError, _MultiThreadedRendezvous) as error:
-            details = error.details()
-            if 'object is null in the dataBase' in details:
-                raise DPFServerNullObject(details) from None
-            raise DPFServerException(details) from None            
+            raise _server_error(error) from None
 
         return out
 
@@ -0,0 +1,473 @@
+"""
+Expressions
+===========
+Lazy arithmetic on fields, fields containers and operator outputs.
+
+The arithmetic operators of :class:`ansys.dpf.core.Field`,
+:class:`ansys.dpf.core.FieldsContainer` and
+:class:`ansys.dpf.core.Operator` create and connect one server operator
+per operation. Wrapping the first operand with :func:`lazy` builds the
+expression on the client instead, and compiles it into a single
+:class:`ansys.dpf.core.Workflow` when it is first evaluated:
+
+- identical subexpressions are computed by one operator,
+- the scalar operands are folded, ``(a * 2.) * 3.`` scales ``a`` once and
+  ``a + 0.`` is ``a``,
+- the workflow is reused by the expressions of the same shape on the same
+  server: evaluating ``(a - b) ** 2`` again, or on other fields, only
+  connects the operands and requests the output.
+
+Notes
+-----
+The compiled workflows are not released by :func:`ansys.dpf.core.session`.
+They keep their last operands alive on the server until their shape is
+evicted, after ``MAX_COMPILED_EXPRESSIONS`` other shapes.
+"""
+import collections
+import threading
+
+from ansys.dpf.core.common import types
+
+# number of compiled workflows kept by server, the least recently used are
+# released
+MAX_COMPILED_EXPRESSIONS = 64
+
+# operators of each operation, on fields and on fields containers
+_OPERATORS = {
+    "add": ("add", "add_fc"),
+    "minus": ("minus", "minus_fc"),
+    "product": ("generalized_inner_product", "generalized_inner_product_fc"),
+    "divide": ("component_wise_divide", "component_wise_divide_fc"),
+    "add_constant": ("add_constant", "add_constant_fc"),
+    "scale": ("scale", "scale_fc"),
+    "invert": ("invert", "invert_fc"),
+    "sqr": ("sqr", "sqr_fc"),
+    "sqrt": ("sqrt", "sqrt_fc"),
+    "pow": ("Pow", "Pow_fc"),
+    "forward": ("forward", "forward"),
+}
+
+_lock = threading.Lock()
+
+
+def _is_constant(value):
+    return (isinstance(value, (int, float)) and not isinstance(value, bool)
+            or isinstance(value, (list, tuple))
+            and all(isinstance(item, (int, float)) for item in value))
+
+
+class _Leaf:
+    """Operand of an expression: field, fields container, operator output
+    or constant"""
+    __slots__ = ("value", "pin", "key")
+
+    def __init__(self, value, pin=0):
+        if isinstance(value, (int, float)):
+            value = float(value)
+            self.key = ("value", value)
+        elif isinstance(value, (list, tuple)):
+            value = [float(item) for item in value]
+            self.key = ("value", tuple(value))
+        else:
+            # the expression holds the entity, its id is not reused
+            self.key = ("entity", id(value), pin)
+        self.value = value
+        self.pin = pin
+
+    @property
+    def is_constant(self):
+        return self.key[0] == "value"
+
+    def __repr__(self):
+        if self.is_constant:
+            return repr(self.value)
+        return type(self.value).__name__
+
+
+class _Node:
+    """Operation of an expression"""
+    __slots__ = ("operation", "args")
+
+    def __init__(self, operation, *args):
+        self.operation = operation
+        self.args = args
+
+    def __repr__(self):
+        return f"{self.operation}({', '.join(repr(arg) for arg in self.args)})"
+
+
+class _CompiledExpression:
+    """Workflow computing the expressions of a shape, with the names of the
+    input pins of each operand"""
+
+    def __init__(self, workflow, input_names, operators):
+        self.workflow = workflow
+        self.input_names = input_names
+        self.operators = operators
+        self.lock = threading.Lock()
+
+
+def _structure(node, leaves):
+    """Shape of the expression of ``node``: nested tuples of the operations
+    where the operands are replaced by their index in ``leaves``, filled in
+    order of first occurrence"""
+    if isinstance(node, _Leaf):
+        index = leaves.setdefault(node.key, (len(leaves), node))[0]
+        return ("leaf", index)
+    return (node.operation,) + tuple(_structure(arg, leaves) for arg in node.args)
+
+
+def _build_operators(structure, fields_container, server):
+    """Create and connect the operators of an expression shape, an operator
+    per distinct subexpression.
+
+    Returns the operator of the expression, the list of operators and the
+    ``(operator, pin)`` inputs of each operand index."""
+    from ansys.dpf.core.dpf_operator import Operator
+    operators = {}
+    inputs = collections.defaultdict(list)
+
+    def build(sub_structure):
+        operator = operators.get(sub_structure)
+        if operator is None:
+            name = _OPERATORS[sub_structure[0]][fields_container]
+            operator = Operator(name, server=server)
+            for pin, arg in enumerate(sub_structure[1:]):
+                if arg[0] == "leaf":
+                    inputs[arg[1]].append((operator, pin))
+                else:
+                    operator.connect(pin, build(arg), 0)
+            operators[sub_structure] = operator
+        return operator
+
+    return build(structure), list(operators.values()), inputs
+
+
+def _compile(structure, fields_container, server):
+    """Workflow of an expression shape, compiled on first use"""
+    from ansys.dpf.core.session_scope import _unrecorded
+    from ansys.dpf.core.workflow import Workflow
+    key = (structure, fields_container)
+    compiled_expressions = server._compiled_expressions
+    with _lock:
+        compiled = compiled_expressions.get(key)
+        if compiled is not None:
+            compiled_expressions.move_to_end(key)
+            return compiled
+    # the compiled workflows outlive the sessions evaluating them
+    with _unrecorded():
+        output, operators, inputs = _build_operators(structure, fields_container, server)
+        workflow = Workflow(server=server)
+        workflow.add_operators(operators)
+        input_names = collections.defaultdict(list)
+        for index, operator_pins in inputs.items():
+            for i, (operator, pin) in enumerate(operator_pins):
+                name = f"operand_{index}_{i}"
+                workflow.set_input_name(name, operator, pin)
+                input_names[index].append(name)
+        workflow.set_output_name("output", output, 0)
+    compiled = _CompiledExpression(workflow, dict(input_names), operators)
+    with _lock:
+        compiled_expressions[key] = compiled
+        while len(compiled_expressions) > MAX_COMPILED_EXPRESSIONS:
+            compiled_expressions.popitem(last=False)
+    return compiled
+
+
+class Expression:
+    """Arithmetic expression on fields, fields containers and operator
+    outputs, evaluated by a single workflow on demand.
+
+    Expressions are created with :func:`lazy` and combined with ``+``,
+    ``-``, ``*``, ``/``, ``**`` and numbers or other operands. They are
+    evaluated by :func:`Expression.eval`, and can be connected as
+    inputs of operators and workflows like operators.
+
+    Examples
+    --------
+    >>> from ansys.dpf import core as dpf
+    >>> from ansys.dpf.core import examples
+    >>> model = dpf.Model(examples.static_rst)
+    >>> disp = model.results.displacement().outputs.fields_container()
+    >>> expression = (dpf.lazy(disp) * 2. + 1.) ** 2
+    >>> expression
+    sqr_fc(add_constant_fc(scale_fc(FieldsContainer, 2.0), 1.0))
+    >>> fields_container = expression.eval()
+
+    """
+
+    def __init__(self, node, fields_container, server):
+        self._node = node
+        self._fields_container = fields_container
+        self._server = server
+        self._operator = None
+
+    @property
+    def output_type(self):
+        """Type of the output of the expression: ``types.fields_container``
+        or ``types.field``."""
+        return types.fields_container if self._fields_container else types.field
+
+    def _leaves(self):
+        leaves = {}
+        structure = _structure(self._node, leaves)
+        return structure, [leaf for _, leaf in sorted(leaves.values(), key=lambda item: item[0])]
+
+    def eval(self):
+        """Evaluate the expression.
+
+        The first evaluation of an expression shape compiles its workflow,
+        the next ones only connect the operands.
+
+        Returns
+        -------
+        output : Field or FieldsContainer
+        """
+        if isinstance(self._node, _Leaf):
+            value = self._node.value
+            if hasattr(value, "get_output"):
+                return value.get_output(self._node.pin, self.output_type)
+            return value
+        structure, leaves = self._leaves()
+        compiled = _compile(structure, self._fields_container, self._server)
+        with compiled.lock:
+            for index, names in compiled.input_names.items():
+                leaf = leaves[index]
+                for name in names:
+                    compiled.workflow.connect(name, leaf.value, leaf.pin)
+            return compiled.workflow.get_output("output", self.output_type)
+
+    def get_output(self, pin=0, output_type=None):
+        """Evaluate the expression, like ``Operator.get_output``.
+
+        Parameters
+        ----------
+        pin : int, optional
+            The expression only has the output pin 0.
+
+        output_type : core.type enum, optional
+            Ignored, the type of the output is ``output_type``.
+
+        Returns
+        -------
+        output : Field or FieldsContainer
+        """
+        if pin != 0:
+            raise ValueError("An expression only has the output pin 0")
+        return self.eval()
+
+    @property
+    def outputs(self):
+        """Outputs of the expression, like ``Operator.outputs``:
+        ``outputs.fields_container()`` or ``outputs.field()``
+        evaluates it."""
+        return _ExpressionOutputs(self)
+
+    def operator(self):
+        """Operator computing the expression, to chain it with other
+        operators.
+
+        Its operators are created once and connected to the operands of
+        the expression, an operator per distinct subexpression.
+
+        Returns
+        -------
+        operator : Operator
+        """
+        if self._operator is None:
+            if isinstance(self._node, _Leaf) and hasattr(self._node.value, "get_output"):
+                return self._node.value
+            if isinstance(self._node, _Leaf):
+                # the expression of an entity is forwarded by an operator
+                structure, leaves = ("forward", ("leaf", 0)), [self._node]
+            else:
+                structure, leaves = self._leaves()
+            output, _, inputs = _build_operators(structure, self._fields_container,
+                                                 self._server)
+            for index, operator_pins in inputs.items():
+                leaf = leaves[index]
+                for operator, pin in operator_pins:
+                    operator.connect(pin, leaf.value, leaf.pin)
+            self._operator = output
+        return self._operator
+
+    def _new(self, operation, *args, fields_container=False):
+        return Expression(_Node(operation, self._node, *args),
+                          self._fields_container or fields_container, self._server)
+
+    def _binary(self, operation, other):
+        other = lazy(other)
+        return self._new(operation, other._node, fields_container=other._fields_container)
+
+    def _scale(self, factor):
+        if factor == 1.:
+            return self
+        node = self._node
+        if (isinstance(node, _Node) and node.operation == "scale"
+                and isinstance(node.args[1].value, float)):
+            # (a * x) * y is a * (x * y)
+            return Expression(_Node("scale", node.args[0], _Leaf(node.args[1].value * factor)),
+                              self._fields_container, self._server)
+        return self._new("scale", _Leaf(factor))
+
+    def _add_constant(self, value):
+        constant = _Leaf(value)
+        if not any(constant.value if isinstance(constant.value, list) else [constant.value]):
+            return self
+        node = self._node
+        if isinstance(node, _Node) and node.operation == "add_constant":
+            previous = node.args[1].value
+            if isinstance(previous, float) and isinstance(constant.value, float):
+                merged = previous + constant.value
+            elif (isinstance(previous, list) and isinstance(constant.value, list)
+                  and len(previous) == len(constant.value)):
+                merged = [x + y for x, y in zip(previous, constant.value)]
+            else:
+                merged = None
+            if merged is not None:
+                # (a + x) + y is a + (x + y)
+                return Expression(node.args[0], self._fields_container,
+                                  self._server)._add_constant(merged)
+        return self._new("add_constant", constant)
+
+    def __add__(self, other):
+        if _is_constant(other):
+            return self._add_constant(other)
+        return self._binary("add", other)
+
+    def __radd__(self, other):
+        if _is_constant(other):
+            return self._add_constant(other)
+        return lazy(other)._binary("add", self)
+
+    def __sub__(self, other):
+        if _is_constant(other):
+            if isinstance(other, (list, tuple)):
+                return self._add_constant([-item for item in other])
+            return self._add_constant(-other)
+        return self._binary("minus", other)
+
+    def __rsub__(self, other):
+        if _is_constant(other):
+            return (-self)._add_constant(other)
+        return lazy(other)._binary("minus", self)
+
+    def __mul__(self, other):
+        if isinstance(other, (int, float)) and not isinstance(other, bool):
+            return self._scale(float(other))
+        if _is_constant(other):
+            return self._new("product", _Leaf(other))
+        return self._binary("product", other)
+
+    def __rmul__(self, other):
+        if _is_constant(other):
+            return self.__mul__(other)
+        return lazy(other)._binary("product", self)
+
+    def __truediv__(self, other):
+        if isinstance(other, (int, float)) and not isinstance(other, bool):
+            return self._scale(1. / other)
+        return self._binary("divide", other)
+
+    def __rtruediv__(self, other):
+        if isinstance(other, (int, float)) and not isinstance(other, bool):
+            return self._new("invert")._scale(float(other))
+        return lazy(other)._binary("divide", self)
+
+    def __pow__(self, exponent):
+        if not isinstance(exponent, (int, float)):
+            raise TypeError("The exponent of an expression must be a number")
+        if exponent == 1:
+            return self
+        if exponent == 2:
+            return self._new("sqr")
+        if exponent == 0.5:
+            return self._new("sqrt")
+        return self._new("pow", _Leaf(exponent))
+
+    def __neg__(self):
+        return self._scale(-1.)
+
+    def __pos__(self):
+        return self
+
+    def __repr__(self):
+        return _repr(self._node, self._fields_container)
+
+
+def _repr(node, fields_container):
+    if isinstance(node, _Leaf):
+        return repr(node)
+    name = _OPERATORS[node.operation][fields_container]
+    return f"{name}({', '.join(_repr(arg, fields_container) for arg in node.args)})"
+
+
+class _ExpressionOutputs:
+    """Evaluates an expression like the outputs of an operator"""
+
+    def __init__(self, expression):
+        self._expression = expression
+
+    def fields_container(self):
+        return self._expression.eval()
+
+    def field(self):
+        return self._expression.eval()
+
+
+def _output_is_fields_container(operator, pin):
+    outputs = operator.outputs
+    if outputs is None or pin not in outputs._dict_outputs:
+        return True
+    return list(outputs._dict_outputs[pin].type_names) != ["field"]
+
+
+def lazy(entity):
+    """Start a lazy arithmetic expression.
+
+    The arithmetic operators applied on the returned expression build it
+    on the client, without sending any request to the server until it is
+    evaluated with :func:`Expression.eval`.
+
+    Parameters
+    ----------
+    entity : Field, FieldsContainer, Operator, Output or Expression
+        First operand. An operator is used by its first output.
+
+    Returns
+    -------
+    expression : Expression
+        Evaluated as a fields container if any operand is a fields
+        container or the output of an operator which is not a field,
+        as a field otherwise.
+
+    Examples
+    --------
+    Compute ``((a - b) ** 2 + c) / d`` with one workflow, reused for
+    the next fields
+
+    >>> from ansys.dpf import core as dpf
+    >>> import numpy as np
+    >>> a, b, c, d = [dpf.field_from_array(np.random.random((10, 3))) for _ in range(4)]
+    >>> expression = ((dpf.lazy(a) - b) ** 2 + c) / d
+    >>> field = expression.eval()
+
+    """
+    from ansys.dpf.core.dpf_operator import Operator
+    from ansys.dpf.core.field_base import _FieldBase
+    from ansys.dpf.core.fields_container import FieldsContainer
+    from ansys.dpf.core.outputs import Output
+    if isinstance(entity, Expression):
+        return entity
+    if isinstance(entity, Output):
+        operator, pin = entity._operator, entity._pin
+        fields_container = list(entity._spec.type_names) != ["field"]
+        return Expression(_Leaf(operator, pin), fields_container, operator._server)
+    if isinstance(entity, Operator):
+        return Expression(_Leaf(entity), _output_is_fields_container(entity, 0),
+                          entity._server)
+    if isinstance(entity, FieldsContainer):
+        return Expression(_Leaf(entity), True, entity._server)
+    if isinstance(entity, _FieldBase):
+        return Expression(_Leaf(entity), False, entity._server)
+    raise TypeError(f"{type(entity).__name__} can't be an operand of an expression")
@@ -163,7 +163,7 @@ class Field(_FieldBase):
         
         """
         if self.field_definition:
-            return self.field_definition.location
+            return self._metadata_cache.get("location", lambda: self.field_definition.location)
         
     @location.setter
     def location(self, value):
@@ -205,7 +205,7 @@ class Field(_FieldBase):
         Enum : shell_layers
         """
         if self.field_definition:
-            return self.field_definition.shell_layers
+            return self._metadata_cache.get("shell_layers", lambda: self.field_definition.shell_layers)
         
     @shell_layers.setter
     def shell_layers(self, value):
@@ -290,6 +290,7 @@ class Field(_FieldBase):
         request.size.scoping_size = nentities
         request.size.data_size = datasize
         self._stub.UpdateSize(request)
+        self._invalidate_metadata()
 
     def _load_field_definition(self):
         """Attempt to load the field definition for this field"""
@@ -297,7 +298,10 @@ class Field(_FieldBase):
             request=field_pb2.GetRequest()
             request.field.CopyFrom(self._message)
             out = self._stub.GetFieldDefinition(request)
-            return FieldDefinition(out.field_definition, self._server)
+            field_definition = FieldDefinition(out.field_definition, self._server)
+            # modifying this definition must invalidate the field's metadata
+            field_definition._owner_cache = self._metadata_cache
+            return field_definition
         except:
             return
 
@@ -321,7 +325,7 @@ class Field(_FieldBase):
         
         """
         if self.field_definition:
-            return self.field_definition.unit
+            return self._metadata_cache.get("unit", lambda: self.field_definition.unit)
         
     @unit.setter
     def unit(self, value):
@@ -357,7 +361,7 @@ class Field(_FieldBase):
             nature and size of the elementary data
         """
         if self.field_definition:
-            return self.field_definition.dimensionnality
+            return self._metadata_cache.get("dimensionnality", lambda: self.field_definition.dimensionnality)
         
     @dimensionnality.setter
     def dimensionnality(self, value):
@@ -389,6 +393,7 @@ class Field(_FieldBase):
         request.field_def.CopyFrom(field_definition._messageDefinition)
         request.field.CopyFrom(self._message)
         self._stub.UpdateFieldDefinition(request)
+        self._invalidate_metadata()
            
     @property
     def field_definition(self):
@@ -564,24 +569,46 @@ class Field(_FieldBase):
         op.connect(0, self)
         return op
 
-    def min(self):
+    def min(self, local=None):
         """Component-wise minimum over this field
 
+        Parameters
+        ----------
+        local : bool, optional
+            Compute the minimum on the client with NumPy instead of with
+            the ``min_max`` operator. By default, it is computed on the
+            client when the data of the field is held by the client (see
+            ``as_local_field``).
+
         Returns
         -------
         min : Field
             Component-wise minimum field.
         """
+        from ansys.dpf.core import local_operators
+        if local_operators._use_local(local, self):
+            return local_operators.min_max(self)[0]
         return self._min_max().get_output(0, types.field)
 
-    def max(self):
+    def max(self, local=None):
         """Component-wise maximum over this field
 
+        Parameters
+        ----------
+        local : bool, optional
+            Compute the maximum on the client with NumPy instead of with
+            the ``min_max`` operator. By default, it is computed on the
+            client when the data of the field is held by the client (see
+            ``as_local_field``).
+
         Returns
         -------
         max : Field
             Component-wise maximum field.
         """
+        from ansys.dpf.core import local_operators
+        if local_operators._use_local(local, self):
+            return local_operators.min_max(self)[1]
         return self._min_max().get_output(1, types.field)
     
     def deep_copy(self,server=None):
@@ -611,7 +638,7 @@ class Field(_FieldBase):
         """            
         f = Field(nentities=len(self.scoping), location=self.location,nature=self.field_definition.dimensionnality.nature, server=server)
         f.scoping = self.scoping.deep_copy(server)
-        f.data = self.data
+        f.data = self.get_data(dtype=np.float64)
         f.unit = self.unit
         f.location = self.location
        
@@ -661,4 +688,5 @@ class _LocalField(_LocalFieldBase,Field):
     
     def __init__(self, field):
         super().__init__(field)
+        self._field_definition = field._field_definition
         
\ No newline at end of file
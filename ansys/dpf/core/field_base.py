@@ -1,12 +1,91 @@
 
+import os
+from collections.abc import Sequence
+
 from ansys.grpc.dpf import field_pb2, base_pb2, field_pb2_grpc
 from ansys.dpf.core import scoping
-from ansys.dpf.core.common import natures, locations
+from ansys.dpf.core.common import natures, locations, _float_or_double
 from ansys.dpf.core import errors 
 from ansys.dpf.core import server as serverlib
+from ansys.dpf.core.session_scope import _record
 
 import numpy as np
 
+# default value of ``_FieldBase.cache_metadata`` for new fields
+CACHE_FIELD_METADATA = os.environ.get('DPF_CACHE_FIELD_METADATA', 'true').lower() != 'false'
+
+
+class _FieldMetadataCache:
+    """Client side store of the metadata of a field (component count,
+    elementary data count, scoping, location, unit...).
+
+    Values are requested to the server once and kept until one of the
+    client's own mutating calls on the field (or on its scoping or field
+    definition) clears the cache.
+
+    Parameters
+    ----------
+    enabled : bool, optional
+        When ``False``, every value is requested to the server.
+    """
+    # number of server calls avoided by all the caches of the session
+    avoided_round_trips = 0
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.hits = 0
+        self._values = {}
+
+    def get(self, key, getter):
+        """Return the cached value of ``key`` or call ``getter`` to
+        request it to the server."""
+        if self.enabled and key in self._values:
+            self.hits += 1
+            _FieldMetadataCache.avoided_round_trips += 1
+            return self._values[key]
+        value = getter()
+        if self.enabled:
+            self._values[key] = value
+        return value
+
+    def clear(self):
+        """Forget all the cached values"""
+        self._values.clear()
+
+
+def metadata_cache_hits(reset=False):
+    """Number of server round trips avoided by the fields' metadata caches
+    since the beginning of the session.
+
+    Parameters
+    ----------
+    reset : bool, optional
+        Reset the counter after reading it.
+
+    Returns
+    -------
+    hits : int
+
+    Examples
+    --------
+    >>> from ansys.dpf import core as dpf
+    >>> from ansys.dpf.core import field_base
+    >>> field = dpf.fields_factory.create_3d_vector_field(2)
+    >>> field.data = [1., 2., 3., 4., 5., 6.]
+    >>> field.component_count
+    3
+    >>> field.shape
+    (2, 3)
+    >>> field_base.metadata_cache_hits() > 0
+    True
+
+    """
+    hits = _FieldMetadataCache.avoided_round_trips
+    if reset:
+        _FieldMetadataCache.avoided_round_trips = 0
+    return hits
+
+
 class _FieldBase:
     """Base APIs for all implementations that follow Dpf's
     field concept."""
@@ -23,6 +102,8 @@ class _FieldBase:
 
         self._server = server
         self._stub = self._connect()
+        self._metadata_cache = _FieldMetadataCache(CACHE_FIELD_METADATA)
+        self._float_dtype = None
 
         if field is None:
             request = field_pb2.FieldRequest()
@@ -43,6 +124,7 @@ class _FieldBase:
             if is_property_field:
                 request.datatype = u"int"
             self._message = self._stub.Create(request)
+            _record(self)
         else:
             from ansys.dpf.core import field as field_module
             from ansys.dpf.core import property_field
@@ -52,8 +134,90 @@ class _FieldBase:
                 self._message = field._message
             elif isinstance(field, field_pb2.Field):
                 self._message = field
+                _record(self)
             else:
                 raise TypeError(f'Cannot create a field from a "{type(field)}" object')
+
+    @property
+    def cache_metadata(self):
+        """Whether the metadata of this field (component count, elementary data
+        count, scoping, location, unit...) is kept on the client after its
+        first request to the server.
+
+        The cache is cleared by the mutating calls done through this object
+        (setting the data, the scoping or the field definition, appending,
+        resizing...). Set it to ``False`` if the field is modified by other
+        means, for example by an operator working in place.
+
+        Returns
+        -------
+        cache_metadata : bool
+        """
+        return self._metadata_cache.enabled
+
+    @cache_metadata.setter
+    def cache_metadata(self, value):
+        self._metadata_cache.enabled = value
+        self._metadata_cache.clear()
+
+    def _invalidate_metadata(self):
+        self._metadata_cache.clear()
+
+    @property
+    def float_dtype(self):
+        """Precision in which the data of this field is received from the
+        server by default: ``numpy.float64`` or ``numpy.float32``.
+
+        Defaults to the precision of the fields container which returned
+        this field, else to the ``float_dtype`` of its server. Set it to
+        ``None`` to go back to these defaults. It is ignored by property
+        fields, whose data are integers.
+
+        Returns
+        -------
+        float_dtype : numpy.dtype
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> import numpy as np
+        >>> field = dpf.fields_factory.create_3d_vector_field(2)
+        >>> field.data = [1., 2., 3., 4., 5., 6.]
+        >>> field.float_dtype = np.float32
+        >>> field.data.dtype
+        dtype('float32')
+
+        """
+        if self._float_dtype is not None:
+            return self._float_dtype
+        return self._server.float_dtype
+
+    @float_dtype.setter
+    def float_dtype(self, value):
+        if value is not None:
+            _float_or_double(value)
+            value = np.dtype(value)
+        self._float_dtype = value
+
+    def _data_type(self, dtype=None):
+        """Return the ``float_or_double`` metadata and the numpy type of the
+        data received from the server"""
+        if self._message.datatype == u"int":
+            if dtype is not None and np.dtype(dtype) != np.dtype(np.int32):
+                raise ValueError(f'Invalid dtype "{dtype}", the data of a property '
+                                 f'field is received as numpy.int32')
+            return u"int", np.dtype(np.int32)
+        if dtype is None:
+            dtype = self.float_dtype
+        data_type = _float_or_double(dtype)
+        if data_type == u"float" and not self._server.has_capability("float_transfer"):
+            from ansys.dpf.core.check_version import CAPABILITIES
+            raise errors.DpfVersionNotSupported(
+                CAPABILITIES["float_transfer"],
+                msg="Receiving field data in single precision requires a server version "
+                    f"{CAPABILITIES['float_transfer']} or above, use numpy.float64 instead.")
+        return data_type, np.dtype(dtype)
+
     @property
     def shape(self):
         """Numpy-like shape of the field
@@ -85,16 +249,18 @@ class _FieldBase:
         ncomp : int
             Number of component of the each elementary data
         """
-        request = field_pb2.CountRequest()
-        request.entity = base_pb2.NUM_COMPONENT
-        request.field.CopyFrom(self._message)
-        return self._stub.Count(request).count
+        return self._metadata_cache.get("component_count",
+                                        lambda: self._count(base_pb2.NUM_COMPONENT))
     
     @property
     def elementary_data_count(self):
         """Number of elementary data in the field"""
+        return self._metadata_cache.get("elementary_data_count",
+                                        lambda: self._count(base_pb2.NUM_ELEMENTARY_DATA))
+
+    def _count(self, entity):
         request = field_pb2.CountRequest()
-        request.entity = base_pb2.NUM_ELEMENTARY_DATA
+        request.entity = entity
         request.field.CopyFrom(self._message)
         return self._stub.Count(request).count
     
@@ -139,7 +305,7 @@ class _FieldBase:
 
     def __del__(self):
         try:
-            self._stub.Delete(self._message)
+            self._server.release_queue.push(self._stub.Delete, self._message)
         except:
             pass
 
@@ -157,6 +323,7 @@ class _FieldBase:
         request.scoping.CopyFrom(scoping._message)
         request.field.CopyFrom(self._message)
         self._stub.UpdateScoping(request)
+        self._invalidate_metadata()
         
     def _get_scoping(self):
         """
@@ -164,10 +331,25 @@ class _FieldBase:
         -------
         scoping : Scoping
         """
+        return self._metadata_cache.get("scoping", self._request_scoping)
+
+    def _request_scoping(self):
         request = field_pb2.GetRequest()
         request.field.CopyFrom(self._message)
         message = self._stub.GetScoping(request)
-        return scoping.Scoping(scoping=message.scoping, server = self._server)
+        out = scoping.Scoping(scoping=message.scoping, server = self._server)
+        # modifying this scoping must invalidate the field's metadata
+        out._owner_cache = self._metadata_cache
+        return out
+
+    def _get_scoping_ids(self):
+        """
+        Returns
+        -------
+        ids : list of int
+            Ids of the field's scoping.
+        """
+        return self._metadata_cache.get("scoping_ids", lambda: self._get_scoping().ids)
 
     @property
     def scoping(self):
@@ -206,8 +388,16 @@ class _FieldBase:
         return self._set_scoping(scoping)
                
         
-    def get_entity_data(self, index):
+    def get_entity_data(self, index, dtype=None):
         """Returns the elementary data of the scoping's index in parameter
+
+        Parameters
+        ----------
+        index : int
+
+        dtype : numpy.dtype, optional
+            ``numpy.float64`` or ``numpy.float32``, precision in which the
+            data is received. Defaults to :attr:`float_dtype`.
         
         Returns
         --------
@@ -243,23 +433,34 @@ class _FieldBase:
         request = field_pb2.GetElementaryDataRequest()
         request.field.CopyFrom(self._message)
         request.index = index
-        list_message = self._stub.GetElementaryData(request, metadata=[(b'float_or_double', b'double')])
+        data_type, dtype = self._data_type(dtype)
+        list_message = self._stub.GetElementaryData(request, metadata=[(u"float_or_double", data_type)])
         data = []
         if list_message.elemdata_containers.data.HasField("datadouble"):
             data = list_message.elemdata_containers.data.datadouble.rep_double
+        elif list_message.elemdata_containers.data.HasField("datafloat"):
+            data = list_message.elemdata_containers.data.datafloat.rep_float
         elif list_message.elemdata_containers.data.HasField("dataint"):
             data = list_message.elemdata_containers.data.dataint.rep_int
 
-        array = np.array(data)
+        array = np.array(data, dtype=dtype)
         if self.component_count !=1:
             n_comp = self.component_count
             array = array.reshape((len(data)//n_comp, n_comp))
 
         return array
 
-    def get_entity_data_by_id(self, id):
+    def get_entity_data_by_id(self, id, dtype=None):
         """Return the data of the scoping's id in parameter of the field.
 
+        Parameters
+        ----------
+        id : int
+
+        dtype : numpy.dtype, optional
+            ``numpy.float64`` or ``numpy.float32``, precision in which the
+            data is received. Defaults to :attr:`float_dtype`.
+
         Returns
         -------
         data : numpy.array
@@ -295,7 +496,7 @@ class _FieldBase:
         index = self.scoping.index(id)
         if index < 0:
             raise ValueError(f'The id {id} must be greater than 0')
-        return self.get_entity_data(index)
+        return self.get_entity_data(index, dtype)
 
     def append(self, data, scopingid):
         """add an entity data to the existing data
@@ -334,6 +535,7 @@ class _FieldBase:
 
         request.field.CopyFrom(self._message)
         self._stub.AddData(request)
+        self._invalidate_metadata()
            
     @property
     def _data_pointer(self):
@@ -389,16 +591,14 @@ class _FieldBase:
         
            
     def _set_data_pointer(self,data):
-        if isinstance(data,  (np.ndarray, np.generic)):
-            data = np.array(data.reshape(data.size), dtype=np.int32)
-        else:
-            data = np.array(data, dtype=np.int32)
+        data = np.ascontiguousarray(data, dtype=np.int32).reshape(-1)
         if data.size ==0:
             return
         metadata=[(u"size_int", f"{len(data)}")]
         request = field_pb2.UpdateDataRequest()
         request.field.CopyFrom(self._message)
-        self._stub.UpdateDataPointer(scoping._data_chunk_yielder(request, data), metadata=metadata)
+        self._stub.UpdateDataPointer(scoping._data_chunk_yielder(request, data, self._server.chunk_size), metadata=metadata)
+        self._invalidate_metadata()
         
         
     @property
@@ -415,14 +615,68 @@ class _FieldBase:
             Data of this field.
         """
         return self._get_data()
+
+    def get_data(self, out=None, read_only=False, dtype=None):
+        """Access the data of this field, receiving it in a given buffer.
+
+        The data streamed by the server is written chunk by chunk in the
+        final array, without intermediate copies.
+
+        Parameters
+        ----------
+        out : numpy.ndarray or BufferPool, optional
+            Buffer in which the data is received: either a C-contiguous
+            array of the field's type (``numpy.float64``, or ``numpy.int32``
+            for property fields, or ``dtype``) with at least ``field.size`` items, or a
+            :class:`ansys.dpf.core.BufferPool` providing one (the array must
+            then be given back to the pool with ``pool.release(data)``).
+            The returned array is a view on its first items.
+
+        read_only : bool, optional
+            Return a read only view on the received data.
+
+        dtype : numpy.dtype, optional
+            ``numpy.float64`` or ``numpy.float32``, precision in which the
+            data is received. The server converts the data to single
+            precision before sending it, which halves the volume
+            transferred. Defaults to :attr:`float_dtype`.
+
+        Returns
+        -------
+        data : numpy.ndarray
+            Data of this field.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> import numpy as np
+        >>> field = dpf.fields_factory.create_3d_vector_field(2)
+        >>> field.data = [1., 2., 3., 4., 5., 6.]
+        >>> buffer = np.empty(100)
+        >>> field.get_data(out=buffer)
+        array([[1., 2., 3.],
+               [4., 5., 6.]])
+        >>> field.get_data(dtype=np.float32)
+        array([[1., 2., 3.],
+               [4., 5., 6.]], dtype=float32)
+
+        """
+        data = self._get_data(out=out, dtype=dtype)
+        if read_only:
+            data = data.view()
+            data.flags.writeable = False
+        return data
     
     @property
     def data_as_list(self):
-        """The data of this field in a python list
+        """The data of this field as a python sequence.
+
+        The data is received in a numpy array and each value is only
+        converted to a python object when it is accessed.
 
         Returns
         -------
-        data : list
+        data : Sequence
             Data of this field.    
         
         Notes
@@ -441,23 +695,18 @@ class _FieldBase:
         >>> # field.data_as_list
          
          """
-        return self._get_data(np_array=False)
+        return _LazyDataList(self._get_data())
     
-    def _get_data(self, np_array=True):
+    def _get_data(self, np_array=True, out=None, dtype=None):
         request = field_pb2.ListRequest()
         request.field.CopyFrom(self._message)
-        if self._message.datatype == u"int":
-            data_type = u"int"
-            dtype = np.int32
-        else:
-            data_type = u"double"
-            dtype = np.float
+        data_type, dtype = self._data_type(dtype)
         service = self._stub.List(request, metadata=[(u"float_or_double", data_type)])
-        array= scoping._data_get_chunk_(dtype, service, np_array)
+        array= scoping._data_get_chunk_(dtype, service, np_array, out)
         
         ncomp = self.component_count
         if ncomp != 1 and np_array:
-            array = array.reshape(self.shape)
+            array = array.reshape((array.size//ncomp, ncomp))
         
         return array
     
@@ -480,28 +729,131 @@ class _FieldBase:
         if self._message.datatype == u"int":
             if not isinstance(data[0], int)and not isinstance(data[0], np.int32):
                 raise errors.InvalidTypeError("data", "list of int")
-            data = np.array(data, dtype=np.int32)
+            data = np.ascontiguousarray(data, dtype=np.int32).reshape(-1)
             metadata=[(u"size_int", f"{len(data)}")]
         else:
             if isinstance(data,  (np.ndarray, np.generic)):
                 if 0 != self.size and self.component_count >1 and data.size//self.component_count != data.size/self.component_count:
                     raise ValueError(f'An array of shape {self.shape} is expected and shape {data.shape} is in input')
                 else:
-                    data = np.array(data.reshape(data.size), dtype=float)
+                    data = np.ascontiguousarray(data, dtype=np.float64).reshape(-1)
             else:
-                data = np.array(data, dtype=float)
+                data = np.ascontiguousarray(data, dtype=np.float64).reshape(-1)
             metadata=[(u"float_or_double", u"double"), (u"size_double", f"{len(data)}")]
         request = field_pb2.UpdateDataRequest()
         request.field.CopyFrom(self._message)
-        self._stub.UpdateData(scoping._data_chunk_yielder(request, data), metadata=metadata)
+        self._stub.UpdateData(scoping._data_chunk_yielder(request, data, self._server.chunk_size), metadata=metadata)
+        self._invalidate_metadata()
         
     
     
 
+class _LazyDataList(Sequence):
+    """Read only sequence over the flattened data of a field, converting
+    the values to python objects only when they are accessed.
+
+    Parameters
+    ----------
+    array : numpy.ndarray
+    """
+
+    def __init__(self, array):
+        self._array = array.reshape(-1)
+
+    def __len__(self):
+        return self._array.size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._array[index].tolist()
+        return self._array[index].item()
+
+    def __iter__(self):
+        chunk_size = 65536
+        for start in range(0, self._array.size, chunk_size):
+            yield from self._array[start:start + chunk_size].tolist()
+
+    def __array__(self, dtype=None):
+        if dtype is None:
+            return self._array
+        return self._array.astype(dtype, copy=False)
+
+    def __eq__(self, other):
+        if isinstance(other, (Sequence, np.ndarray)) and not isinstance(other, str):
+            return len(other) == len(self) and bool(np.all(self._array == np.asarray(other)))
+        return NotImplemented
+
+    def tolist(self):
+        """Materialize the data in a python list."""
+        return self._array.tolist()
+
+    def __repr__(self):
+        return repr(self._array.tolist()) if self._array.size < 1000 else f"<{len(self)} values>"
+
+
+class _GrowableArray:
+    """1D numpy buffer with amortized appends, its capacity is doubled
+    when it is full.
+
+    Parameters
+    ----------
+    array : numpy.ndarray, list, optional
+        Initial content, used without copy when it already is a 1D
+        contiguous array of type ``dtype``.
+
+    dtype : numpy.dtype, optional
+    """
+
+    def __init__(self, array=None, dtype=np.float64):
+        self._dtype = np.dtype(dtype)
+        self.set(array if array is not None else [])
+
+    def set(self, array):
+        """Replace the content of the buffer."""
+        self._buffer = np.ascontiguousarray(array, dtype=self._dtype).reshape(-1)
+        self._size = self._buffer.size
+
+    def reserve(self, capacity):
+        """Make sure the buffer holds at least ``capacity`` items without
+        being reallocated."""
+        if capacity > self._buffer.size:
+            buffer = np.empty(max(capacity, 2 * self._buffer.size), dtype=self._dtype)
+            buffer[:self._size] = self._buffer[:self._size]
+            self._buffer = buffer
+
+    def append(self, value):
+        """Append a value at the end of the buffer."""
+        if self._size == self._buffer.size:
+            self.reserve(self._size + 1)
+        self._buffer[self._size] = value
+        self._size += 1
+
+    def extend(self, values):
+        """Append the values at the end of the buffer."""
+        values = np.asarray(values, dtype=self._dtype).reshape(-1)
+        new_size = self._size + values.size
+        self.reserve(new_size)
+        self._buffer[self._size:new_size] = values
+        self._size = new_size
+
+    @property
+    def view(self):
+        """View on the content of the buffer, it is invalidated by the next
+        call growing the buffer."""
+        return self._buffer[:self._size]
+
+    def __len__(self):
+        return self._size
+
+
 class _LocalFieldBase(_FieldBase):
     """Class only created by a field to cache the internal data of the field,
     modify it locallly, and send a single update request to the server 
-    when the local field is deleted
+    when the local field is deleted.
+
+    The data, data pointer and scoping ids are held in growable numpy
+    buffers (``numpy.int32`` for property fields, ``numpy.float64``
+    otherwise).
     
     Parameters
     ----------
@@ -514,16 +866,19 @@ class _LocalFieldBase(_FieldBase):
         self._stub = field._stub
         self._is_property_field = field._message.datatype == u"int"
         self._owner_field = field
+        self._metadata_cache = field._metadata_cache
+        self._float_dtype = None
         self.__cache_data__()
         
     def __cache_data__(self):
         self._ncomp = super().component_count
-        self._data_copy = super().data_as_list
-        self._num_entities_reserved = len(self._data_copy)
-        self._data_pointer_copy = super()._data_pointer_as_list
-        self._scoping_ids_copy = super().scoping.ids
+        dtype = np.int32 if self._is_property_field else np.float64
+        self._data_copy = _GrowableArray(super()._get_data(dtype=dtype), dtype)
+        self._data_pointer_copy = _GrowableArray(super()._data_pointer, np.int32)
+        self._scoping_ids_copy = _GrowableArray(super()._get_scoping().get_ids(), np.int32)
         self._num_entities = len(self._scoping_ids_copy)
         self._has_data_pointer = len(self._data_pointer_copy)>0
+        self._id_to_index = None
     
     @property
     def size(self):
@@ -542,6 +897,7 @@ class _LocalFieldBase(_FieldBase):
         Returns
         -------
         data : numpy.array
+            View on the local data, valid until the next append.
         
         Examples
         --------
@@ -572,22 +928,20 @@ class _LocalFieldBase(_FieldBase):
            1.52268930e+07  6.09583280e+07]]
         
         """
-        if index > self._num_entities:
-            raise ValueError(f"asked scoping {index} is greater than the number of available indices {len(self._scoping_ids_copy)}")
+        if index >= self._num_entities:
+            raise ValueError(f"asked scoping {index} is greater than the number of available indices {self._num_entities}")
+        data = self._data_copy.view
         if self._has_data_pointer:
-            first_index = self._data_pointer_copy[index]
-            if index < len(self._data_pointer_copy) -1:
-                last_index =  self._data_pointer_copy[index+1]-1
+            data_pointer = self._data_pointer_copy.view
+            first_index = data_pointer[index]
+            if index < len(data_pointer) -1:
+                last_index = data_pointer[index+1]
             else:
-                last_index = len(self._data_copy)-1
+                last_index = data.size
         else:
             first_index = self._ncomp * index
-            last_index = self._ncomp * (index+1)-1
-        if self._is_property_field:
-            array = np.array(self._data_copy[first_index:last_index+1], dtype=np.int32)
-        else:
-            array = np.array(self._data_copy[first_index:last_index+1])
-            
+            last_index = self._ncomp * (index+1)
+        array = data[first_index:last_index]
         if self._ncomp>1:
             return array.reshape((array.size//self._ncomp,self._ncomp))
         else:
@@ -630,10 +984,23 @@ class _LocalFieldBase(_FieldBase):
            7.69014221e+02  4.90502930e+02]]
 
         """
-        index = self._scoping_ids_copy.index(id)
-        if index < 0:
+        index = self._get_index_of_id(id)
+        if index is None:
             raise ValueError(f"The id {id} doesn't exist in the scoping")
         return self.get_entity_data(index)
+
+    def _get_index_of_id(self, id):
+        if self._id_to_index is None:
+            ids = self._scoping_ids_copy.view.tolist()
+            # the first index is kept for duplicated ids
+            self._id_to_index = dict(zip(reversed(ids), range(len(ids)-1, -1, -1)))
+        return self._id_to_index.get(id)
+
+    def _check_data_type(self, data):
+        data = np.asarray(data)
+        if self._is_property_field and data.size > 0 and not np.issubdtype(data.dtype, np.integer):
+            raise errors.InvalidTypeError("data", "list of int")
+        return data
     
     def append(self, data, scopingid):
         """Add an entity data to the existing data
@@ -655,36 +1022,89 @@ class _LocalFieldBase(_FieldBase):
         ...         f.append([[0.1*i,0.2*i, 0.3*i],[0.1*i,0.2*i, 0.3*i]],i)
                     
         """
-        if self._is_property_field:
-            if isinstance(data[0], np.int64):
-                data = np.array(data, dtype=np.int32)
-            if not isinstance(data[0], int) and not isinstance(data[0], np.int32):
-                raise errors.InvalidTypeError("data", "list of int")
-        if (len(data)>0 and isinstance(data, list)) or isinstance(data,  (np.ndarray, np.generic)):
-                data=np.array(data).flatten().tolist()
-            
-        data_size =len(self._data_copy)      
+        data = self._check_data_type(data).reshape(-1)
+        if not self._has_data_pointer and data.size>self._ncomp:
+            # entities of several elementary data require a data pointer
+            self._data_pointer_copy.set(np.arange(self._num_entities, dtype=np.int32) * self._ncomp)
+            self._has_data_pointer = True
+        if self._has_data_pointer:
+            self._data_pointer_copy.append(len(self._data_copy))
+        self._data_copy.extend(data)
         self._scoping_ids_copy.append(scopingid)
-        if len(self._data_pointer_copy)>0:
-            self._data_pointer_copy.append(data_size)
+        if self._id_to_index is not None:
+            self._id_to_index.setdefault(scopingid, self._num_entities)
+        self._num_entities+=1
+
+    def append_many(self, ids, data, counts=None):
+        """Add the data of several entities to the existing data
 
+        Parameters
+        ----------
+        ids : list of int, numpy.ndarray
+            Scoping ids of the entities.
+
+        data : list of int, double or array
+            Data of all the entities, flat or with one row per
+            elementary data.
+
+        counts : list of int, numpy.ndarray, optional
+            Number of elementary data of each entity. By default, each
+            entity has one elementary data.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> import numpy as np
+        >>> field_to_local = dpf.fields_factory.create_3d_vector_field(3, location=dpf.locations.elemental_nodal)
+        >>> with field_to_local.as_local_field() as f:
+        ...     f.append_many([1, 2, 3], np.ones((6, 3)), counts=[1, 2, 3])
+        ...     f.get_entity_data_by_id(2)
+        array([[1., 1., 1.],
+               [1., 1., 1.]])
+
+        """
+        ids = np.ascontiguousarray(ids, dtype=np.int32).reshape(-1)
+        data = self._check_data_type(data).reshape(-1)
+        if counts is None:
+            sizes = np.full(ids.size, self._ncomp, dtype=np.int64)
+        else:
+            sizes = np.asarray(counts, dtype=np.int64).reshape(-1) * self._ncomp
+        if sizes.size != ids.size:
+            raise ValueError(f"{sizes.size} counts are given for {ids.size} ids")
+        if sizes.sum() != data.size:
+            raise ValueError(f"{data.size} values are given while the counts require {sizes.sum()}")
+        self._append_entities(ids, data, sizes)
+
+    def _append_entities(self, ids, data, sizes):
+        sizes = np.asarray(sizes, dtype=np.int64)
+        if sizes.size == 0:
+            return
+        data_size = len(self._data_copy)
+        if not self._has_data_pointer and np.any(sizes>self._ncomp):
+            # entities of several elementary data require a data pointer
+            self._data_pointer_copy.set(np.arange(self._num_entities, dtype=np.int32) * self._ncomp)
+            self._has_data_pointer = True
+        if self._has_data_pointer:
+            pointers = np.empty(sizes.size, dtype=np.int64)
+            pointers[0] = data_size
+            np.cumsum(sizes[:-1], out=pointers[1:])
+            pointers[1:] += data_size
+            self._data_pointer_copy.extend(pointers)
         self._data_copy.extend(data)
-        self._num_entities+=1
-        if self._has_data_pointer==False:
-            if isinstance(data,  (np.ndarray, np.generic)):
-                data_size = data.size
-            else:
-                data_size=len(data)
-            if data_size>self._ncomp:
-                self._data_pointer_copy=[i*self._ncomp for i in range(0,self._num_entities) ]
-                self._has_data_pointer=True   
+        first_index = self._num_entities
+        self._scoping_ids_copy.extend(ids)
+        self._num_entities+=len(sizes)
+        if self._id_to_index is not None:
+            for index, id in enumerate(np.asarray(ids).tolist(), first_index):
+                self._id_to_index.setdefault(id, index)
                 
+    @property
     def data_as_list(self):
-        """The data of this field in a python list
+        """The data of this field as a python sequence
 
         Returns
         -------
-        data : list
+        data : Sequence
             Data of this field.
 
         Examples
@@ -700,7 +1120,7 @@ class _LocalFieldBase(_FieldBase):
         ...     my_data_list = f.data_as_list
          
         """
-        return self._data_copy   
+        return _LazyDataList(self._data_copy.view)
     
      
     @property
@@ -732,34 +1152,26 @@ class _LocalFieldBase(_FieldBase):
          [ 1.03542516e-02 -3.53018374e-03 -3.98914380e-05]]
         
         """
+        data = self._data_copy.view
         if self._ncomp>1:
-            return np.array(self._data_copy).reshape(len(self._data_copy)//self._ncomp,self._ncomp)
+            return data.reshape(data.size//self._ncomp,self._ncomp)
         else:
-            return np.array(self._data_copy)
+            return data
         
     
     @data.setter
     def data(self, data):
-        if self._is_property_field:
-            if not isinstance(data[0], int)and not isinstance(data[0], np.int32):
-                raise errors.InvalidTypeError("data", "list of int")
-        else:
-            if isinstance(data,  (np.ndarray, np.generic)):
-                if data.shape !=  self.shape and 0 != self.size:
-                    raise ValueError(f'An array of shape {self.shape} is expected and shape {data.shape} is in input')
-        if isinstance(data,  (np.ndarray, np.generic)):
-            self._data_copy = data.flatten().tolist()
-        elif len(data)>0 and isinstance(data, list):
-            self._data_copy=np.array(data).flatten().tolist()
-        else:
-            self._data_copy = data
+        if not self._is_property_field and isinstance(data,  (np.ndarray, np.generic)):
+            if data.shape !=  self.shape and 0 != self.size:
+                raise ValueError(f'An array of shape {self.shape} is expected and shape {data.shape} is in input')
+        self._data_copy.set(self._check_data_type(data))
         
         
     @property
     def elementary_data_count(self):
         """Number of elementary data in the field"""
         if (hasattr(self, "_data_copy")):
-            return len(self._data_copy) / self._ncomp
+            return len(self._data_copy) // self._ncomp
         else:
             return super().elementary_data_count
     
@@ -784,7 +1196,7 @@ class _LocalFieldBase(_FieldBase):
         data : numpy.ndarray
             Data of this field.
         """
-        return np.array(self._data_pointer_copy)
+        return self._data_pointer_copy.view
     
     @property
     def _data_pointer_as_list(self):
@@ -795,7 +1207,7 @@ class _LocalFieldBase(_FieldBase):
         data : list of int
             Data of this field.
         """
-        return self._data_pointer_copy
+        return self._data_pointer_copy.view.tolist()
     
     
     @_data_pointer.setter
@@ -806,29 +1218,31 @@ class _LocalFieldBase(_FieldBase):
         ----------
         data : list of int or array
         """
-        if isinstance(data,  (np.ndarray, np.generic)):
-            self._data_pointer_copy = data.tolist()
-        else:
-            self._data_pointer_copy = data
+        self._data_pointer_copy.set(data)
         if self._has_data_pointer == False and len(data)>0:
             self._has_data_pointer=True
     
     @property
     def scoping_ids(self):
-        """List of int representing the scoping ids of the field.
+        """Scoping ids of the field.
+
+        Returns
+        -------
+        ids : numpy.ndarray
         """
-        return self._scoping_ids_copy
+        return self._scoping_ids_copy.view
     
     @scoping_ids.setter
     def scoping_ids(self, data):
-        self._scoping_ids_copy =data
-        self._num_entities =len(data)
+        self._scoping_ids_copy.set(data)
+        self._num_entities =len(self._scoping_ids_copy)
+        self._id_to_index = None
     
         
     def release_data(self):
-        super()._set_data(self._data_copy)
-        super()._set_data_pointer(self._data_pointer_copy)
-        super().scoping.ids = self._scoping_ids_copy
+        super()._set_data(self._data_copy.view)
+        super()._set_data_pointer(self._data_pointer_copy.view)
+        super().scoping.ids = self._scoping_ids_copy.view
         
     def __enter__(self):
         return self
@@ -841,7 +1255,3 @@ class _LocalFieldBase(_FieldBase):
             
     def __del__(self):
         pass
-     
-
-            
-        
\ No newline at end of file
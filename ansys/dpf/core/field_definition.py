@@ -8,6 +8,7 @@ from ansys.grpc.dpf import (base_pb2,
                             field_definition_pb2, field_definition_pb2_grpc)
 from ansys.dpf.core.common import natures, shell_layers
 from ansys.dpf.core.dimensionnality import Dimensionnality
+from ansys.dpf.core.session_scope import _record
 
 
 class FieldDefinition:
@@ -21,11 +22,14 @@ class FieldDefinition:
 
         self._server = server
         self._stub = self._connect(self._server.channel)
+        # metadata cache of the field owning this field definition, if any
+        self._owner_cache = None
         if isinstance(field_definition, field_definition_pb2.FieldDefinition):
             self._messageDefinition = field_definition
         else:
             request = base_pb2.Empty()
             self._messageDefinition = self._stub.Create(request)
+        _record(self, "_messageDefinition")
             
     @property
     def location(self):
@@ -111,11 +115,13 @@ class FieldDefinition:
             else:                
                 request.shell_layers = shell_layer+1
         self._stub.Update(request)
+        if self._owner_cache is not None:
+            self._owner_cache.clear()
         
     
     def __del__(self):
         try:
-            self._stub.Delete(self._messageDefinition)
+            self._server.release_queue.push(self._stub.Delete, self._messageDefinition)
         except:
             pass
 
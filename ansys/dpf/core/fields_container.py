@@ -5,10 +5,15 @@ FieldsContainer
 ===============
 Contains classes associated to the DPF FieldsContainer
 """
+import functools
+
+import numpy as np
+
 from ansys import dpf
 from ansys.dpf.core.collection import Collection
-from ansys.dpf.core.common import types
+from ansys.dpf.core.common import types, _float_or_double
 from ansys.dpf.core import errors as dpf_errors
+from ansys.dpf.core.misc import _prefetch_iter
 
 
 class FieldsContainer(Collection):
@@ -73,10 +78,56 @@ class FieldsContainer(Collection):
 
         self._component_index = None  # component index
         self._component_info = None  # for norm/max/min
+        self._float_dtype = None
 
         Collection.__init__(self, types.field,
                             collection=fields_container, server=self._server)
 
+    @property
+    def float_dtype(self):
+        """Precision in which the data of the fields of this container is
+        received from the server by default: ``numpy.float64`` or
+        ``numpy.float32``.
+
+        The fields returned by the container take this precision, unless
+        another one is set on them. Defaults to the ``float_dtype`` of the
+        server, set it to ``None`` to go back to it.
+
+        Returns
+        -------
+        float_dtype : numpy.dtype
+
+        Examples
+        --------
+        Receive the displacements in single precision
+
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> import numpy as np
+        >>> model = dpf.Model(examples.msup_transient)
+        >>> fields_container = model.results.displacement.on_all_time_freqs.eval()
+        >>> fields_container.float_dtype = np.float32
+        >>> fields_container[0].data.dtype
+        dtype('float32')
+
+        """
+        if self._float_dtype is not None:
+            return self._float_dtype
+        return self._server.float_dtype
+
+    @float_dtype.setter
+    def float_dtype(self, value):
+        if value is not None:
+            _float_or_double(value)
+            value = np.dtype(value)
+        self._float_dtype = value
+
+    def _entry_from_message(self, obj):
+        entry = super()._entry_from_message(obj)
+        if entry is not None:
+            entry.float_dtype = self._float_dtype
+        return entry
+
     def get_fields_by_time_complex_ids(self, timeid=None, complexid=None):
         """Returns the fields at a requested time/freq id and real or imaginary depending on 
         complexid (complexid=1:imaginary, complexid=0:real)
@@ -445,14 +496,90 @@ class FieldsContainer(Collection):
         """
         fc = FieldsContainer(server=server)
         fc.labels= self.labels
-        for i,f in enumerate(self):
-            fc.add_field(self.get_label_space(i),f.deep_copy(server))        
+        fields, label_spaces = self.get_all_entries()
+        for label_space, f in zip(label_spaces, fields):
+            fc.add_field(label_space, f.deep_copy(server))
         try:
             fc.time_freq_support = self.time_freq_support.deep_copy(server)
         except:
             pass
         return fc
     
+    def iter_numpy(self, batch=1, prefetch=True, dtype=None):
+        """Iterate over the data of the fields as numpy arrays.
+
+        The data of ``batch`` fields is downloaded at a time. With
+        ``prefetch``, the next batch is downloaded in a background thread
+        while the current one is processed, so that two batches are held
+        on the client at a time. The fields of a batch are only requested
+        when the batch is downloaded, and released once their data is
+        received.
+
+        Parameters
+        ----------
+        batch : int, optional
+            Number of fields downloaded at a time.
+
+        prefetch : bool, optional
+            Download the next batch in the background.
+
+        dtype : numpy.dtype, optional
+            ``numpy.float64`` or ``numpy.float32``, precision in which the
+            data is received. Defaults to :attr:`float_dtype`.
+
+        Yields
+        ------
+        time_value : float
+            Time or frequency of the field, ``None`` when the fields
+            container has no time label or no time freq support.
+
+        label_space : dict[str,int]
+            Label space of the field, for example: ``{"time": 1, "complex": 0}``
+
+        data : numpy.ndarray
+            Data of the field.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.msup_transient)
+        >>> fields_container = model.results.displacement.on_all_time_freqs.eval()
+        >>> for time_value, label_space, data in fields_container.iter_numpy(batch=5):
+        ...     max_disp = data.max()
+
+        """
+        label_spaces = self.get_label_spaces()
+        time_values = self._get_time_values(label_spaces)
+        return _prefetch_iter([functools.partial(self._download_entries, start,
+                                                 time_values[start:start + batch],
+                                                 label_spaces[start:start + batch], dtype)
+                               for start in range(0, len(label_spaces), batch)], prefetch)
+
+    def _download_entries(self, start, time_values, label_spaces, dtype=None):
+        """Download the data of the fields from index ``start``"""
+        entries = [(time_value, label_space, self._get_entry(index))
+                   for index, (time_value, label_space)
+                   in enumerate(zip(time_values, label_spaces), start)]
+        return _download_batch(entries, dtype)
+
+    def _get_time_values(self, label_spaces):
+        """Time or frequency values of the label spaces' time ids"""
+        frequencies = None
+        if "time" in self.labels:
+            try:
+                frequencies = self.time_freq_support.time_frequencies.data
+            except Exception:
+                pass
+        time_values = []
+        for label_space in label_spaces:
+            time_id = label_space.get("time")
+            if frequencies is None or time_id is None or not 0 < time_id <= len(frequencies):
+                time_values.append(None)
+            else:
+                time_values.append(float(frequencies[time_id - 1]))
+        return time_values
+
     def get_time_scoping(self):
         """Returns the time scoping containing the time sets
         
@@ -526,5 +653,13 @@ class FieldsContainer(Collection):
         op.connect(0,self)        
         op.connect(1, value)
         return op
-    
-    
+
+
+def _download_batch(batch_entries, dtype=None):
+    """Download the data of a batch of ``(time_value, label_space, field)``
+    entries and release the fields"""
+    out = []
+    while batch_entries:
+        time_value, label_space, field = batch_entries.pop(0)
+        out.append((time_value, label_space, field.get_data(dtype=dtype)))
+    return out
@@ -0,0 +1,217 @@
+"""
+Futures
+=======
+Outputs of operators and workflows evaluated asynchronously by the server.
+"""
+import asyncio
+import concurrent.futures
+import inspect
+import threading
+import time
+
+import grpc
+
+from ansys.dpf.core.errors import _server_error
+
+
+class OutputFuture:
+    """Output of an operator or of a workflow which is being evaluated by
+    the server.
+
+    It is returned by :func:`Operator.get_output_async` and
+    :func:`Workflow.get_output_async`. The evaluation request is sent
+    immediately and the client is free to send other requests, so that the
+    server can evaluate several outputs concurrently. The output message is
+    converted to its python type when the result is first requested.
+
+    Parameters
+    ----------
+    rpc_future : grpc.Future
+        Future of the gRPC evaluation call.
+
+    converter : callable
+        Function converting the output message to its python type.
+
+    owner : Operator, Workflow, optional
+        Entity evaluated, kept alive until the evaluation is done.
+
+    Examples
+    --------
+    Evaluate the displacement and the stress concurrently
+
+    >>> from ansys.dpf import core as dpf
+    >>> from ansys.dpf.core import examples
+    >>> model = dpf.Model(examples.static_rst)
+    >>> disp = model.results.displacement()
+    >>> stress = model.results.stress()
+    >>> disp_future = disp.get_output_async(0, dpf.types.fields_container)
+    >>> stress_future = stress.get_output_async(0, dpf.types.fields_container)
+    >>> disp_fc, stress_fc = dpf.gather(disp_future, stress_future)
+
+    """
+
+    def __init__(self, rpc_future, converter, owner=None):
+        self._future = rpc_future
+        self._converter = converter
+        self._owner = owner
+        self._lock = threading.Lock()
+        self._converted = False
+        self._result = None
+
+    def result(self, timeout=None):
+        """Wait for the evaluation and return the output.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum time to wait in seconds. Wait without limit by default.
+
+        Returns
+        -------
+        output
+            Output converted to its python type.
+
+        Raises
+        ------
+        concurrent.futures.TimeoutError
+            When the output is not available after ``timeout`` seconds.
+
+        concurrent.futures.CancelledError
+            When the evaluation was cancelled.
+
+        errors.DPFServerException
+            When the server failed to evaluate the output.
+        """
+        try:
+            out = self._future.result(timeout=timeout)
+        except grpc.FutureTimeoutError:
+            raise concurrent.futures.TimeoutError() from None
+        except grpc.FutureCancelledError:
+            raise concurrent.futures.CancelledError() from None
+        except grpc.RpcError as error:
+            raise _server_error(error) from None
+        with self._lock:
+            if not self._converted:
+                self._result = self._converter(out)
+                self._converted = True
+                self._owner = None
+        return self._result
+
+    def exception(self, timeout=None):
+        """Wait for the evaluation and return the exception raised by the
+        server, or ``None`` if the evaluation succeeded.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum time to wait in seconds. Wait without limit by default.
+
+        Returns
+        -------
+        exception : Exception or None
+        """
+        try:
+            error = self._future.exception(timeout=timeout)
+        except grpc.FutureTimeoutError:
+            raise concurrent.futures.TimeoutError() from None
+        except grpc.FutureCancelledError:
+            raise concurrent.futures.CancelledError() from None
+        if error is None:
+            return None
+        return _server_error(error)
+
+    def done(self):
+        """Return ``True`` if the evaluation is finished or was cancelled."""
+        return self._future.done()
+
+    def running(self):
+        """Return ``True`` if the evaluation is in progress."""
+        return self._future.running()
+
+    def cancel(self):
+        """Try to cancel the evaluation.
+
+        Returns
+        -------
+        cancelled : bool
+            ``False`` if the evaluation is already finished.
+        """
+        return self._future.cancel()
+
+    def cancelled(self):
+        """Return ``True`` if the evaluation was cancelled."""
+        return self._future.cancelled()
+
+    def add_done_callback(self, fn):
+        """Call ``fn`` with this future once the evaluation is finished.
+
+        The callback is run in a thread of gRPC, or immediately when the
+        evaluation is already finished.
+
+        Parameters
+        ----------
+        fn : callable
+            Function taking this future as argument.
+        """
+        self._future.add_done_callback(lambda _: fn(self))
+
+
+def gather(*futures, timeout=None):
+    """Wait for several outputs evaluated asynchronously.
+
+    Parameters
+    ----------
+    *futures : OutputFuture or awaitable
+        Futures returned by ``get_output_async``, or coroutines returned by
+        ``get_output_aio``.
+
+    timeout : float, optional
+        Maximum time to wait for all the futures in seconds.
+
+    Returns
+    -------
+    outputs : list
+        Outputs in the order of the futures. When an argument is an
+        awaitable, an awaitable of this list is returned instead, to be
+        used in a coroutine: the :class:`OutputFuture` arguments are then
+        waited for in the default executor of the event loop.
+
+    Examples
+    --------
+    Wait for futures
+
+    >>> from ansys.dpf import core as dpf
+    >>> from ansys.dpf.core import examples
+    >>> model = dpf.Model(examples.static_rst)
+    >>> futures = [model.results.displacement().get_output_async(0, dpf.types.fields_container),
+    ...            model.results.stress().get_output_async(0, dpf.types.fields_container)]
+    >>> disp_fc, stress_fc = dpf.gather(*futures)
+
+    Await coroutines
+
+    >>> import asyncio
+    >>> async def evaluate():
+    ...     return await dpf.gather(
+    ...         model.results.displacement().get_output_aio(0, dpf.types.fields_container),
+    ...         model.results.stress().get_output_async(0, dpf.types.fields_container))
+    >>> disp_fc, stress_fc = asyncio.run(evaluate())
+
+    """
+    for future in futures:
+        if not (isinstance(future, OutputFuture) or inspect.isawaitable(future)):
+            raise TypeError(f"gather expects OutputFuture or awaitable arguments, "
+                            f"not {type(future).__name__}")
+    if any(inspect.isawaitable(future) for future in futures):
+        return _gather_aio(futures, timeout)
+    if timeout is None:
+        return [future.result() for future in futures]
+    end = time.monotonic() + timeout
+    return [future.result(timeout=max(end - time.monotonic(), 0)) for future in futures]
+
+
+async def _gather_aio(futures, timeout):
+    loop = asyncio.get_running_loop()
+    awaitables = [future if inspect.isawaitable(future)
+                  else loop.run_in_executor(None, future.result)
+                  for future in futures]
+    return await asyncio.wait_for(asyncio.gather(*awaitables), timeout)
@@ -5,6 +5,7 @@ simplify the creation of new chained operators.
 """
 from ansys import dpf
 from ansys.dpf.core.common import types as dpf_types
+from ansys.dpf.core import local_operators
 
 
 def _check_type(instance, allowable_type):
@@ -116,14 +117,26 @@ def to_nodal(var_inp):
         raise TypeError('Input type must be a Field, FieldContainer')
 
 
-def norm(var_inp):
+def norm(var_inp, local=None):
     """Returns the euclidean norm of a Field, FieldContainer, or operator
 
+    Parameters
+    ----------
+    var_inp : ansys.dpf.core.Field, ansys.dpf.core.FieldsContainer, or ansys.dpf.core.Operator
+
+    local : bool, optional
+        Compute the norm of a Field or FieldsContainer on the client with
+        NumPy (see :mod:`ansys.dpf.core.local_operators`). By default, it
+        is computed on the client for the local fields only.
+
     Returns
     -------
     field : Field, ansys.dpf.core.FieldContainer, or ansys.dpf.core.Operator
         The euclidean norm of this field.  Output type will match input type.
     """
+    if (isinstance(var_inp, (dpf.core.Field, dpf.core.FieldsContainer))
+            and local_operators._use_local(local, var_inp)):
+        return local_operators.norm(var_inp)
     if isinstance(var_inp, dpf.core.Field):
         return _norm(var_inp)
     elif isinstance(var_inp, dpf.core.FieldsContainer):
@@ -179,14 +192,26 @@ def _norm_op(oper):
     return norm_op
 
 
-def eqv(var_inp):
+def eqv(var_inp, local=None):
     """Returns the von-mises stress of a Field or FieldContainer
 
+    Parameters
+    ----------
+    var_inp : ansys.dpf.core.Field or ansys.dpf.core.FieldsContainer
+
+    local : bool, optional
+        Compute the von-mises stress on the client with NumPy (see
+        :mod:`ansys.dpf.core.local_operators`). By default, it is computed
+        on the client for the local fields only.
+
     Returns
     -------
     field : ansys.dpf.core.Field, ansys.dpf.core.FieldContainer
         The von-mises stress of this field.  Output type will match input type.
     """
+    if (isinstance(var_inp, (dpf.core.Field, dpf.core.FieldsContainer))
+            and local_operators._use_local(local, var_inp)):
+        return local_operators.eqv(var_inp)
     if isinstance(var_inp, dpf.core.Field):
         return _eqv(var_inp)
     elif isinstance(var_inp, dpf.core.FieldsContainer):
@@ -234,15 +259,27 @@ def _eqv_fc(fields):
     return eqv_fields
 
 
-def min_max(var_inp):
+def min_max(var_inp, local=False):
     """Returns a min_max operator for a Field, FieldsContainer, or
     Operator input.
 
+    Parameters
+    ----------
+    var_inp : ansys.dpf.core.Field, ansys.dpf.core.FieldsContainer, or ansys.dpf.core.Operator
+
+    local : bool, optional
+        Compute the minimum and maximum of a Field or FieldsContainer on
+        the client with NumPy and return them instead of an operator (see
+        :mod:`ansys.dpf.core.local_operators`).
+
     Returns
     -------
-    oper : ansys.dpf.core.Operator
-        Component-wise minimum/maximum operator over the input.
+    oper : ansys.dpf.core.Operator or tuple(ansys.dpf.core.Field, ansys.dpf.core.Field)
+        Component-wise minimum/maximum operator over the input, or the
+        minimum and maximum fields when ``local`` is ``True``.
     """
+    if local and isinstance(var_inp, (dpf.core.Field, dpf.core.FieldsContainer)):
+        return local_operators.min_max(var_inp)
     if isinstance(var_inp, dpf.core.Field):
         return _min_max(var_inp)
     elif isinstance(var_inp, dpf.core.FieldsContainer):
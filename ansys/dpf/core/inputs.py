@@ -35,6 +35,8 @@ class Input:
         # always convert ranges to lists
         if isinstance(inpt, range):
             inpt = list(inpt)
+        elif isinstance(inpt, core.Expression):
+            inpt = inpt.operator().outputs
         elif isinstance(inpt, core.Operator):
             if hasattr(inpt, "outputs"):
                 inpt = inpt.outputs
@@ -138,6 +140,8 @@ class _Inputs:
             input of the operator
         """
         corresponding_pins = []
+        if isinstance(inpt, core.Expression):
+            inpt = inpt.operator()
         if isinstance(inpt, core.Operator):
             if hasattr(inpt, "outputs"):
                 inpt = inpt.outputs
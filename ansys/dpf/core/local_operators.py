@@ -0,0 +1,439 @@
+"""
+Local operators
+===============
+NumPy implementations of common DPF operators, evaluated on the client
+instead of creating server operators.
+
+They are worth it when the data of the fields is already held by the
+client, for example in the fields returned by ``Field.as_local_field()``:
+the result is computed without any operator creation, connection or
+evaluation, and only the output fields are sent to the server. The
+functions of :mod:`ansys.dpf.core.help` and ``Field.min``/``Field.max``
+use them automatically for such fields, or on request with ``local=True``.
+
+Each function takes a :class:`ansys.dpf.core.Field` or a
+:class:`ansys.dpf.core.FieldsContainer` and returns the same type, like
+the server operator of the same name.
+"""
+import numpy as np
+
+from ansys.dpf.core.common import locations
+
+
+def _create_field(n_entities, n_components, location, server):
+    """Create an empty field of ``n_components`` components"""
+    from ansys.dpf.core import fields_factory
+    if n_components == 1:
+        return fields_factory.create_scalar_field(n_entities, location, server)
+    if n_components == 3:
+        return fields_factory.create_3d_vector_field(n_entities, location, server)
+    if n_components == 6:
+        return fields_factory.create_tensor_field(n_entities, location, server)
+    return fields_factory.create_vector_field(n_entities, n_components, location, server)
+
+
+def _is_local(entity):
+    from ansys.dpf.core.field_base import _LocalFieldBase
+    return isinstance(entity, _LocalFieldBase)
+
+
+def _use_local(local, *entities):
+    """Whether an operation is evaluated on the client: as requested with
+    ``local``, else when all its inputs hold their data on the client"""
+    if local is None:
+        return all(_is_local(entity) for entity in entities)
+    return bool(local)
+
+
+class _FieldArrays:
+    """Data of a field held on the client, received from the server unless
+    the field is a local field"""
+
+    def __init__(self, field):
+        self.server = field._server
+        self.n_components = field.component_count
+        self.location = field.location
+        self.unit = field.unit
+        if _is_local(field):
+            self.data = field._data_copy.view
+            self.data_pointer = field._data_pointer_copy.view
+            self.ids = field._scoping_ids_copy.view
+            self.scoping = None
+        else:
+            self.data = field.get_data().reshape(-1)
+            self.data_pointer = np.asarray(field._data_pointer, dtype=np.int32)
+            self.ids = None
+            # the output fields share the scoping of the input on the server
+            self.scoping = field.scoping
+
+    @property
+    def values(self):
+        """Data with one row per elementary data"""
+        return self.data.reshape(-1, self.n_components)
+
+    def same_scoping(self, other):
+        """Whether the scopings of the two fields are known to be equal
+        without receiving their ids"""
+        return (self.scoping is not None and other.scoping is not None
+                and self.scoping._message.id == other.scoping._message.id)
+
+    def scoping_ids(self):
+        if self.ids is None:
+            self.ids = self.scoping.ids
+        return np.asarray(self.ids)
+
+    def new_field(self, values, location=None, unit=None):
+        """Create a field on the server with the scoping of this field and
+        ``values`` as data, of shape ``(n_elementary_data, n_components)``"""
+        from ansys.dpf.core.scoping import Scoping
+        n_components = values.shape[1]
+        location = location or self.location
+        n_entities = len(self.data_pointer) or values.shape[0]
+        field = _create_field(n_entities, n_components, location, self.server)
+        if self.scoping is not None:
+            field.scoping = self.scoping
+        else:
+            field.scoping = Scoping(ids=self.ids, location=location, server=self.server)
+        field.data = np.ascontiguousarray(values).reshape(-1)
+        if len(self.data_pointer):
+            field._data_pointer = (self.data_pointer // self.n_components) * n_components
+        if unit:
+            field.unit = unit
+        return field
+
+
+def _new_overall_field(server, values, unit=None):
+    """Create a field of one entity holding ``values``"""
+    from ansys.dpf.core.scoping import Scoping
+    values = np.asarray(values, dtype=np.float64).reshape(1, -1)
+    field = _create_field(1, values.shape[1], locations.overall, server)
+    field.scoping = Scoping(ids=[0], location=locations.overall, server=server)
+    field.data = values.reshape(-1)
+    if unit:
+        field.unit = unit
+    return field
+
+
+def _map_fields(function, fields_container, *args):
+    """Apply ``function`` on each field of a fields container, and return
+    the container of the output fields"""
+    from ansys.dpf.core.fields_container import FieldsContainer
+    out = FieldsContainer(server=fields_container._server)
+    out.labels = fields_container.labels
+    fields, label_spaces = fields_container.get_all_entries()
+    for field, label_space in zip(fields, label_spaces):
+        out.add_field(label_space, function(field, *args))
+    return out
+
+
+def _apply(function, entity, *args):
+    from ansys.dpf.core.fields_container import FieldsContainer
+    if isinstance(entity, FieldsContainer):
+        return _map_fields(function, entity, *args)
+    return function(entity, *args)
+
+
+def _check_symmatrix(arrays, operation):
+    if arrays.n_components != 6:
+        raise ValueError(f"{operation} requires a symmetrical tensor field of 6 components, "
+                         f"the field has {arrays.n_components} components")
+
+
+def _norm(field):
+    arrays = _FieldArrays(field)
+    return arrays.new_field(np.linalg.norm(arrays.values, axis=1)[:, None], unit=arrays.unit)
+
+
+def norm(field):
+    """Euclidean norm of each elementary data, like the ``norm`` operator.
+
+    Parameters
+    ----------
+    field : Field or FieldsContainer
+
+    Returns
+    -------
+    norm : Field or FieldsContainer
+        Scalar field(s).
+
+    Examples
+    --------
+    >>> from ansys.dpf import core as dpf
+    >>> from ansys.dpf.core import local_operators
+    >>> field = dpf.fields_factory.create_3d_vector_field(2)
+    >>> field.data = [3., 4., 0., 0., 0., 1.]
+    >>> with field.as_local_field() as local_field:
+    ...     norm = local_operators.norm(local_field)
+    >>> norm.data
+    array([5., 1.])
+
+    """
+    return _apply(_norm, field)
+
+
+def _add(field_a, field_b):
+    arrays = _FieldArrays(field_a)
+    if isinstance(field_b, (int, float)):
+        return arrays.new_field(arrays.values + field_b, unit=arrays.unit)
+    arrays_b = _FieldArrays(field_b)
+    if arrays_b.n_components != arrays.n_components:
+        raise ValueError(f"Fields of {arrays.n_components} and {arrays_b.n_components} "
+                         f"components can't be added")
+    values_b = arrays_b.values
+    if values_b.shape[0] == 1 and arrays.values.shape[0] != 1:
+        # a field of one elementary data is added to all the others
+        return arrays.new_field(arrays.values + values_b, unit=arrays.unit)
+    if arrays.same_scoping(arrays_b) and np.array_equal(arrays.data_pointer,
+                                                        arrays_b.data_pointer):
+        return arrays.new_field(arrays.values + values_b, unit=arrays.unit)
+    if len(arrays.data_pointer) or len(arrays_b.data_pointer):
+        if (not np.array_equal(arrays.data_pointer, arrays_b.data_pointer)
+                or not np.array_equal(arrays.scoping_ids(), arrays_b.scoping_ids())):
+            raise ValueError("Fields of several elementary data per entity can only be "
+                             "added when they have the same scoping")
+        return arrays.new_field(arrays.values + values_b, unit=arrays.unit)
+    ids_a, ids_b = arrays.scoping_ids(), arrays_b.scoping_ids()
+    if np.array_equal(ids_a, ids_b):
+        return arrays.new_field(arrays.values + values_b, unit=arrays.unit)
+    # entities of ``field_a`` missing in ``field_b`` are kept unchanged
+    order = np.argsort(ids_b, kind="stable")
+    positions = np.searchsorted(ids_b, ids_a, sorter=order).clip(0, max(ids_b.size - 1, 0))
+    indices = order[positions] if ids_b.size else positions
+    found = ids_b[indices] == ids_a if ids_b.size else np.zeros(ids_a.size, dtype=bool)
+    values = arrays.values.copy()
+    values[found] += values_b[indices[found]]
+    return arrays.new_field(values, unit=arrays.unit)
+
+
+def add(field_a, field_b):
+    """Sum of two fields, or of a field and a number, like the ``add`` and
+    ``add_constant`` operators.
+
+    The entities are matched by their ids, the entities of ``field_a``
+    missing in ``field_b`` are kept unchanged. A field of one elementary
+    data is added to all the elementary data of ``field_a``.
+
+    Parameters
+    ----------
+    field_a : Field or FieldsContainer
+
+    field_b : Field, float
+        Field with the components of ``field_a``, or number.
+
+    Returns
+    -------
+    sum : Field or FieldsContainer
+
+    Examples
+    --------
+    >>> from ansys.dpf import core as dpf
+    >>> from ansys.dpf.core import local_operators
+    >>> field = dpf.fields_factory.create_3d_vector_field(2)
+    >>> field.data = [1., 2., 3., 4., 5., 6.]
+    >>> local_operators.add(field, 1.).data
+    array([[2., 3., 4.],
+           [5., 6., 7.]])
+
+    """
+    return _apply(_add, field_a, field_b)
+
+
+def _scale(field, factor):
+    arrays = _FieldArrays(field)
+    return arrays.new_field(arrays.values * factor, unit=arrays.unit)
+
+
+def scale(field, factor):
+    """Field multiplied by a number, like the ``scale`` operator.
+
+    Parameters
+    ----------
+    field : Field or FieldsContainer
+
+    factor : float
+
+    Returns
+    -------
+    scaled : Field or FieldsContainer
+    """
+    return _apply(_scale, field, float(factor))
+
+
+def _sqr(field):
+    arrays = _FieldArrays(field)
+    return arrays.new_field(np.square(arrays.values))
+
+
+def sqr(field):
+    """Square of each value, like the ``sqr`` operator.
+
+    Parameters
+    ----------
+    field : Field or FieldsContainer
+
+    Returns
+    -------
+    square : Field or FieldsContainer
+    """
+    return _apply(_sqr, field)
+
+
+def _sqrt(field):
+    arrays = _FieldArrays(field)
+    return arrays.new_field(np.sqrt(arrays.values))
+
+
+def sqrt(field):
+    """Square root of each value, like the ``sqrt`` operator.
+
+    Parameters
+    ----------
+    field : Field or FieldsContainer
+
+    Returns
+    -------
+    square_root : Field or FieldsContainer
+    """
+    return _apply(_sqrt, field)
+
+
+def min_max(field):
+    """Component-wise minimum and maximum over all the elementary data,
+    like the ``min_max`` and ``min_max_fc`` operators.
+
+    Parameters
+    ----------
+    field : Field or FieldsContainer
+        The minimum and maximum of a fields container are computed over
+        all its fields.
+
+    Returns
+    -------
+    min : Field
+        Field of one elementary data holding the minimum of each component.
+
+    max : Field
+        Field of one elementary data holding the maximum of each component.
+
+    Examples
+    --------
+    >>> from ansys.dpf import core as dpf
+    >>> from ansys.dpf.core import local_operators
+    >>> field = dpf.fields_factory.create_3d_vector_field(3)
+    >>> field.data = [1., 2., 3., 4., 5., 6., 7., 8., 9.]
+    >>> field_min, field_max = local_operators.min_max(field)
+    >>> field_max.data
+    array([[7., 8., 9.]])
+
+    """
+    from ansys.dpf.core.fields_container import FieldsContainer
+    fields = field.get_all_entries()[0] if isinstance(field, FieldsContainer) else [field]
+    if not fields:
+        raise ValueError("The minimum and maximum of an empty fields container are undefined")
+    all_arrays = [_FieldArrays(field) for field in fields]
+    if len({arrays.n_components for arrays in all_arrays}) > 1:
+        raise ValueError("The fields don't have the same number of components")
+    values = np.concatenate([arrays.values for arrays in all_arrays])
+    if not values.size:
+        raise ValueError("The minimum and maximum of an empty field are undefined")
+    arrays = all_arrays[0]
+    return (_new_overall_field(arrays.server, values.min(axis=0), arrays.unit),
+            _new_overall_field(arrays.server, values.max(axis=0), arrays.unit))
+
+
+def _eqv(field):
+    arrays = _FieldArrays(field)
+    _check_symmatrix(arrays, "The von Mises equivalent")
+    xx, yy, zz, xy, yz, xz = arrays.values.T
+    eqv = np.sqrt(0.5 * ((xx - yy) ** 2 + (yy - zz) ** 2 + (zz - xx) ** 2)
+                  + 3. * (xy ** 2 + yz ** 2 + xz ** 2))
+    return arrays.new_field(eqv[:, None], unit=arrays.unit)
+
+
+def eqv(field):
+    """Von Mises equivalent of a symmetrical tensor field, like the ``eqv``
+    operator.
+
+    The components are ordered ``XX, YY, ZZ, XY, YZ, XZ``.
+
+    Parameters
+    ----------
+    field : Field or FieldsContainer
+        Field(s) of 6 components, for example stresses.
+
+    Returns
+    -------
+    eqv : Field or FieldsContainer
+        Scalar field(s).
+    """
+    return _apply(_eqv, field)
+
+
+def _tensors(values):
+    """Symmetric 3x3 matrices of the ``XX, YY, ZZ, XY, YZ, XZ`` rows"""
+    xx, yy, zz, xy, yz, xz = values.T
+    return np.stack([np.stack([xx, xy, xz], -1),
+                     np.stack([xy, yy, yz], -1),
+                     np.stack([xz, yz, zz], -1)], -2)
+
+
+def principal_invariants(field):
+    """Eigen values of a symmetrical tensor field, like the ``invariants``
+    operator (``principal_invariants``).
+
+    Parameters
+    ----------
+    field : Field
+        Field of 6 components ordered ``XX, YY, ZZ, XY, YZ, XZ``.
+
+    Returns
+    -------
+    field_eig_1 : Field
+        Scalar field of the largest eigen values.
+
+    field_eig_2 : Field
+        Scalar field of the intermediate eigen values.
+
+    field_eig_3 : Field
+        Scalar field of the smallest eigen values.
+    """
+    arrays = _FieldArrays(field)
+    _check_symmatrix(arrays, "The principal invariants")
+    eigen_values = np.linalg.eigvalsh(_tensors(arrays.values))[:, ::-1]
+    return tuple(arrays.new_field(eigen_values[:, i:i + 1], unit=arrays.unit)
+                 for i in range(3))
+
+
+def _component_selector(field, component_number):
+    arrays = _FieldArrays(field)
+    if np.max(component_number) >= arrays.n_components:
+        raise ValueError(f"The field only has {arrays.n_components} components")
+    return arrays.new_field(arrays.values[:, component_number], unit=arrays.unit)
+
+
+def component_selector(field, component_number):
+    """Components of a field, like the ``component_selector`` operator.
+
+    Parameters
+    ----------
+    field : Field or FieldsContainer
+
+    component_number : int, list of int
+        Index or indices of the selected components.
+
+    Returns
+    -------
+    components : Field or FieldsContainer
+
+    Examples
+    --------
+    >>> from ansys.dpf import core as dpf
+    >>> from ansys.dpf.core import local_operators
+    >>> field = dpf.fields_factory.create_3d_vector_field(2)
+    >>> field.data = [1., 2., 3., 4., 5., 6.]
+    >>> local_operators.component_selector(field, 1).data
+    array([2., 5.])
+
+    """
+    component_number = np.atleast_1d(np.asarray(component_number, dtype=np.int64))
+    return _apply(_component_selector, field, component_number)
@@ -2,15 +2,22 @@
 MeshedRegion
 ============
 """
+import numpy as np
+
 from ansys import dpf
-from ansys.grpc.dpf import meshed_region_pb2, meshed_region_pb2_grpc
+from ansys.grpc.dpf import meshed_region_pb2, meshed_region_pb2_grpc, base_pb2
 from ansys.dpf.core import scoping
 from ansys.dpf.core.common import locations, types
 from ansys.dpf.core.plotter import Plotter as _DpfPlotter
 from ansys.dpf.core.errors import protect_grpc
 from ansys.dpf.core.nodes import Nodes
 from ansys.dpf.core.elements import Elements, element_types
-from ansys.dpf.core.check_version import server_meet_version
+from ansys.dpf.core.session_scope import _record
+
+
+# path of the MeshedRegionService.Add method, called with serialized requests
+_ADD_METHOD = "/{}/Add".format(
+    meshed_region_pb2.DESCRIPTOR.services_by_name["MeshedRegionService"].full_name)
 
 
 class MeshedRegion:
@@ -78,11 +85,14 @@ class MeshedRegion:
             self._message = mesh._mesh
         elif isinstance(mesh, meshed_region_pb2.MeshedRegion):
             self._message = mesh
+            _record(self)
         elif mesh==None:
             self.__send_init_request(num_nodes,num_elements)       
+            _record(self)
         else: #support_pb2.Support
             self._message = meshed_region_pb2.MeshedRegion()
             self._message.id = mesh.id
+            _record(self)
         
 
         self._full_grid = None
@@ -200,7 +210,7 @@ class MeshedRegion:
 
     def __del__(self):
         try:
-            self._stub.Delete(self._message)
+            self._server.release_queue.push(self._stub.Delete, self._message)
         except:
             pass
 
@@ -241,7 +251,7 @@ class MeshedRegion:
         -------
         named_selection : Scoping
         """
-        if server_meet_version("2.1", self._server):
+        if self._server.has_capability("named_selection_scoping"):
             request = meshed_region_pb2.GetScopingRequest(mesh=self._message)
             request.named_selection = named_selection
             out = self._stub.GetScoping(request)
@@ -430,23 +440,169 @@ class MeshedRegion:
         >>> deep_copy = meshed_region.deep_copy(server=other_server)
         
         """
-        node_ids = self.nodes.scoping.ids
-        element_ids = self.elements.scoping.ids
-        mesh = MeshedRegion(num_nodes=len(node_ids), num_elements=len(element_ids),server=server)
-        with self.nodes.coordinates_field.as_local_field() as coord:
-            for i,node in enumerate(mesh.nodes.add_nodes(len(node_ids))):
-                node.id = node_ids[i]
-                node.coordinates = coord.get_entity_data(i)
-        with self.elements.connectivities_field.as_local_field() as connect :
-            with self.elements.element_types_field.as_local_field() as types:
-                for i,elem in enumerate(mesh.elements.add_elements(len(element_ids))):
-                    elem.id = element_ids[i]
-                    elem.connectivity = connect.get_entity_data(i)
-                    elem.shape = element_types.shape(types.get_entity_data(i)[0])
-        mesh.unit = self.unit
+        mesh = MeshedRegion.from_arrays(**self.to_arrays(), server=server)
+        return mesh
+
+    def to_arrays(self):
+        """Extract the nodes and elements of the meshed region in numpy arrays.
+
+        Each array is received in one streamed request. The returned
+        dictionary can be given to :func:`MeshedRegion.from_arrays`.
+
+        Returns
+        -------
+        arrays : dict
+            Dictionary with the keys:
+
+            - ``"node_ids"``: ids of the nodes, of shape ``(n_nodes,)``
+            - ``"coordinates"``: coordinates of the nodes, of shape ``(n_nodes, 3)``
+            - ``"element_ids"``: ids of the elements, of shape ``(n_elements,)``
+            - ``"element_types"``: :class:`ansys.dpf.core.elements.element_types`
+              values of the elements
+            - ``"connectivity"``: nodes indices of all the elements
+            - ``"offsets"``: ``n_elements + 1`` offsets in ``connectivity``, the
+              nodes of the element ``i`` are
+              ``connectivity[offsets[i]:offsets[i+1]]``
+            - ``"unit"``: unit of the meshed region
+
+        Examples
+        --------
+        >>> import ansys.dpf.core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.static_rst)
+        >>> meshed_region = model.metadata.meshed_region
+        >>> arrays = meshed_region.to_arrays()
+        >>> arrays["coordinates"].shape
+        (81, 3)
+
+        """
+        connectivities_field = self.elements.connectivities_field
+        connectivity = connectivities_field.data.reshape(-1)
+        element_ids = self.elements.scoping.get_ids()
+        data_pointer = connectivities_field._data_pointer
+        if len(data_pointer):
+            offsets = np.append(data_pointer, connectivity.size)
+        else:
+            offsets = np.arange(element_ids.size + 1) * connectivities_field.component_count
+        return {"node_ids": self.nodes.scoping.get_ids(),
+                "coordinates": self.nodes.coordinates_field.data.reshape(-1, 3),
+                "element_ids": element_ids,
+                "element_types": self.elements.element_types_field.data.reshape(-1),
+                "connectivity": connectivity,
+                "offsets": offsets,
+                "unit": self.unit}
+
+    @staticmethod
+    def from_arrays(node_ids, coordinates, element_ids, element_types,
+                    connectivity, offsets=None, unit=None, server=None):
+        """Create a meshed region from numpy arrays of nodes and elements.
+
+        The nodes and elements are sent in a few requests, each holding as many
+        nodes or elements as fit in the server's ``chunk_size``.
+
+        Parameters
+        ----------
+        node_ids : numpy.ndarray, list of int
+            Ids of the nodes.
+
+        coordinates : numpy.ndarray
+            Coordinates of the nodes, of shape ``(n_nodes, 3)``.
+
+        element_ids : numpy.ndarray, list of int
+            Ids of the elements.
+
+        element_types : numpy.ndarray, list of int
+            :class:`ansys.dpf.core.elements.element_types` values of the
+            elements, used to set their shapes.
+
+        connectivity : numpy.ndarray
+            Nodes indices (not ids) of all the elements, either flat with
+            ``offsets`` or of shape ``(n_elements, n_nodes_per_element)``.
+
+        offsets : numpy.ndarray, optional
+            Offsets of each element in the flat ``connectivity``, with
+            ``n_elements`` or ``n_elements + 1`` values.
+
+        unit : str, optional
+            Unit of the meshed region.
+
+        server : server.DPFServer, optional
+            Server with channel connected to the remote or local instance. When
+            ``None``, attempts to use the the global server.
+
+        Returns
+        -------
+        mesh : MeshedRegion
+
+        Notes
+        -----
+        The element types and material ids can't be set directly on the
+        server: the element types are deduced from the element shapes and
+        connectivity and the materials are not copied.
+
+        Examples
+        --------
+        Create a line of 3 beam elements
+
+        >>> import ansys.dpf.core as dpf
+        >>> import numpy as np
+        >>> coordinates = np.array([[0., 0., 0.], [1., 0., 0.], [2., 0., 0.], [3., 0., 0.]])
+        >>> meshed_region = dpf.MeshedRegion.from_arrays(
+        ...     node_ids=[1, 2, 3, 4],
+        ...     coordinates=coordinates,
+        ...     element_ids=[1, 2, 3],
+        ...     element_types=[dpf.element_types.Line2.value] * 3,
+        ...     connectivity=[[0, 1], [1, 2], [2, 3]])
+
+        """
+        node_ids = np.asarray(node_ids).reshape(-1)
+        element_ids = np.asarray(element_ids).reshape(-1)
+        connectivity = np.asarray(connectivity)
+        if offsets is None:
+            offsets = np.arange(element_ids.size + 1) * (connectivity.size // max(element_ids.size, 1))
+        else:
+            offsets = np.asarray(offsets).reshape(-1)
+            if offsets.size == element_ids.size:
+                offsets = np.append(offsets, connectivity.size)
+        if offsets.size != element_ids.size + 1 or offsets[-1] != connectivity.size:
+            raise ValueError("offsets don't match the number of elements and the connectivity size")
+        shapes = Elements._shapes_from_types(element_types)
+        if shapes.size != element_ids.size:
+            raise ValueError(f"{shapes.size} element types are given for {element_ids.size} elements")
+
+        mesh = MeshedRegion(num_nodes=node_ids.size, num_elements=element_ids.size, server=server)
+        mesh.nodes._add_nodes_from_arrays(node_ids, coordinates)
+        mesh.elements._add_elements_from_arrays(element_ids, shapes, connectivity, offsets)
+        if unit:
+            mesh.unit = unit
         return mesh
     
     
+    def _add_serialized(self, data, ends):
+        """Send serialized nodes or elements in ``Add`` requests of at most
+        the server's chunk size (or of one entity if it is larger).
+
+        Parameters
+        ----------
+        data : numpy.ndarray
+            ``numpy.uint8`` serialized ``nodes`` or ``elements`` fields of
+            an ``AddRequest``.
+
+        ends : numpy.ndarray
+            End offset in ``data`` of each entity.
+        """
+        prefix = meshed_region_pb2.AddRequest(mesh=self._message).SerializeToString()
+        add = self._server.channel.unary_unary(
+            _ADD_METHOD, request_serializer=None,
+            response_deserializer=base_pb2.Empty.FromString)
+        chunk_size = self._server.chunk_size
+        first, begin = 0, 0
+        while first < len(ends):
+            last = max(int(np.searchsorted(ends, begin + chunk_size, side="right")), first + 1)
+            end = int(ends[last - 1])
+            add(prefix + data[begin:end].tobytes())
+            first, begin = last, end
+
     def __send_init_request(self, num_nodes=0, num_elements=0):
         request = meshed_region_pb2.CreateRequest()
         if num_nodes:
@@ -2,11 +2,15 @@
 import platform
 import glob
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pkgutil import iter_modules
 
 
 DEFAULT_FILE_CHUNK_SIZE =65536
 
+# maximum size in bytes of the chunks used to stream arrays to the server
+DEFAULT_DATA_CHUNK_SIZE = 1048576
+
 # ANSYS CPython workbench environment may not have scooby installed
 try:
     from scooby import Report as ScoobyReport
@@ -19,6 +23,34 @@ except ImportError:
                               'this feature')
 
 
+def _prefetch_iter(tasks, prefetch=True):
+    """Yield the items of the lists returned by the callables ``tasks``.
+
+    When ``prefetch`` is ``True``, the next task is run in a background
+    thread while the items of the current one are consumed.
+    """
+    if not prefetch:
+        for task in tasks:
+            yield from task()
+        return
+    executor = ThreadPoolExecutor(1)
+    tasks = iter(tasks)
+    pending = None
+    try:
+        task = next(tasks, None)
+        if task is not None:
+            pending = executor.submit(task)
+        while pending is not None:
+            items = pending.result()
+            task = next(tasks, None)
+            pending = executor.submit(task) if task is not None else None
+            yield from items
+    finally:
+        if pending is not None:
+            pending.cancel()
+        executor.shutdown(wait=False)
+
+
 def module_exists(module_name):
     """Returns True when a module exists"""
     return module_name in (name for loader, name, ispkg in iter_modules())
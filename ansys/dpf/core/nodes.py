@@ -7,9 +7,10 @@ import numpy as np
 
 
 from ansys import dpf
-from ansys.dpf.core import  field, property_field
+from ansys.dpf.core import  field, property_field, scoping
 from ansys.grpc.dpf import meshed_region_pb2
 from ansys.dpf.core.errors import protect_grpc
+from ansys.dpf.core.common import _varints
 
 
 class Node:
@@ -100,6 +101,7 @@ class Nodes():
     def __init__(self, mesh):
         self._mesh = mesh
         self._mapping_id_to_index = None
+        self._scoping_index = None
 
     def __str__(self):
         return f'DPF Node collection with {len(self)} nodes\n'
@@ -228,7 +230,8 @@ class Nodes():
 
     def _build_mapping_id_to_index(self):
         """Return a mapping between ids and indices of the entity."""
-        return {eid: i for i, eid in enumerate(self.scoping.ids)}
+        ids = self.scoping_index.ids.tolist()
+        return dict(zip(ids, range(len(ids))))
 
     @property
     def mapping_id_to_index(self):
@@ -236,6 +239,33 @@ class Nodes():
             self._mapping_id_to_index = self._build_mapping_id_to_index()
         return self._mapping_id_to_index
 
+    @property
+    def scoping_index(self):
+        """Mapping between the ids and indices of the nodes, computed
+        once and used to map the scopings of fields to these nodes.
+
+        Returns
+        -------
+        scoping_index : ScopingIndex
+
+        Examples
+        --------
+        >>> import ansys.dpf.core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.static_rst)
+        >>> nodes = model.metadata.meshed_region.nodes
+        >>> index = nodes.scoping_index
+        >>> indices, mask = index.map(nodes.scoping)
+
+        """
+        if self._scoping_index is None:
+            self._scoping_index = scoping.ScopingIndex(self.scoping)
+        return self._scoping_index
+
+    def _clear_mappings(self):
+        self._mapping_id_to_index = None
+        self._scoping_index = None
+
     def map_scoping(self, external_scope):
         """Return the indices to map the scoping of these elements to
         the scoping of a field.
@@ -275,10 +305,7 @@ class Nodes():
         """
         if external_scope.location in ['Elemental', 'NodalElemental']:
             raise ValueError('Input scope location must be "Nodal"')
-        arr = np.array(list(map(self.mapping_id_to_index.get, external_scope.ids)))
-        mask = arr != None
-        ind = arr[mask].astype(np.int)
-        return ind, mask
+        return self.scoping_index.map(external_scope)
     
     def add_node(self, id, coordinates):
         """Appends a new node in the mesh
@@ -296,6 +323,7 @@ class Nodes():
         node_request.coordinates.extend(coordinates)
         request.nodes.append(node_request)
         self._mesh._stub.Add(request)
+        self._clear_mappings()
         
     def add_nodes(self, num):   
         """Add num new nodes in the mesh. 
@@ -328,6 +356,78 @@ class Nodes():
             node_request.coordinates.extend(add.coordinates)
             request.nodes.append(node_request)
         self._mesh._stub.Add(request)
+        self._clear_mappings()
+
+    def _add_nodes_from_arrays(self, ids, coordinates):
+        """Add nodes in the mesh with a few requests, each of them holding
+        the nodes fitting in the server's chunk size.
+
+        Parameters
+        ----------
+        ids : numpy.ndarray
+            Ids of the nodes.
+
+        coordinates : numpy.ndarray
+            x, y, z coordinates of the nodes, of shape ``(len(ids), 3)``.
+        """
+        ids = np.asarray(ids).reshape(-1)
+        coordinates = np.asarray(coordinates, dtype=np.float64).reshape(ids.size, 3)
+        for start in range(0, ids.size, _ENCODING_BATCH_SIZE):
+            stop = start + _ENCODING_BATCH_SIZE
+            self._mesh._add_serialized(*_encode_nodes(ids[start:stop], coordinates[start:stop]))
+        self._clear_mappings()
+
+
+# number of entities encoded at once to bound the memory used by the encoding
+_ENCODING_BATCH_SIZE = 1 << 20
+
+
+def _tag(message, field_name, wire_type):
+    """Protobuf tag (on one byte) of a field."""
+    return message.DESCRIPTOR.fields_by_name[field_name].number << 3 | wire_type
+
+
+_NODES_TAG = _tag(meshed_region_pb2.AddRequest, "nodes", 2)
+_NODE_ID_TAG = _tag(meshed_region_pb2.NodeRequest, "id", 0)
+_NODE_COORDINATES_TAG = _tag(meshed_region_pb2.NodeRequest, "coordinates", 2)
+
+
+def _encode_nodes(ids, coordinates):
+    """Serialize nodes as the ``nodes`` field of an ``AddRequest``.
+
+    Parameters
+    ----------
+    ids : numpy.ndarray
+
+    coordinates : numpy.ndarray
+        Coordinates of shape ``(len(ids), 3)``.
+
+    Returns
+    -------
+    data : numpy.ndarray
+        ``numpy.uint8`` serialized nodes.
+
+    ends : numpy.ndarray
+        End offset in ``data`` of each node.
+    """
+    varints, id_lengths = _varints(ids)
+    # NodeRequest: id (varint), coordinates (packed doubles)
+    node_lengths = 1 + id_lengths + 2 + 24
+    ends = np.cumsum(2 + node_lengths)
+    starts = ends - (2 + node_lengths)
+    data = np.empty(ends[-1] if ends.size else 0, dtype=np.uint8)
+    data[starts] = _NODES_TAG
+    data[starts + 1] = node_lengths
+    data[starts + 2] = _NODE_ID_TAG
+    width = varints.shape[1]
+    in_varint = np.arange(width) < id_lengths[:, None]
+    data[((starts + 3)[:, None] + np.arange(width))[in_varint]] = varints[in_varint]
+    coordinates_starts = starts + 3 + id_lengths
+    data[coordinates_starts] = _NODE_COORDINATES_TAG
+    data[coordinates_starts + 1] = 24
+    xyz = np.ascontiguousarray(coordinates, dtype="<f8").view(np.uint8).reshape(-1, 24)
+    data[(coordinates_starts + 2)[:, None] + np.arange(24)] = xyz
+    return data, ends
         
 
 class NodeAdder:
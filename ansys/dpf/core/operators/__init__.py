@@ -3,20 +3,26 @@
 
 ansys.dpf.core.operators
 ========================
+The operators subpackages and the operator classes they contain are only
+imported when they are first accessed.
 """
-  
+from ansys.dpf.core._lazy_operators import _lazy_attributes
 
-from . import result
-from . import math
-from . import min_max
-from . import scoping
-from . import utility
-from . import metadata
-from . import logic
-from . import mesh
-from . import filter
-from . import serialization
-from . import averaging
-from . import geo
-from . import invariant
-from . import mapping
+__all__ = [
+    "averaging",
+    "filter",
+    "geo",
+    "invariant",
+    "logic",
+    "mapping",
+    "math",
+    "mesh",
+    "metadata",
+    "min_max",
+    "result",
+    "scoping",
+    "serialization",
+    "utility",
+]
+
+__getattr__, __dir__ = _lazy_attributes(__name__, __all__)
@@ -1,9 +1,15 @@
-from .field_band_pass_fc import field_band_pass_fc 
-from .scoping_low_pass import scoping_low_pass 
-from .field_high_pass import field_high_pass 
-from .scoping_high_pass import scoping_high_pass 
-from .field_high_pass_fc import field_high_pass_fc 
-from .field_low_pass import field_low_pass 
-from .field_low_pass_fc import field_low_pass_fc 
-from .field_band_pass import field_band_pass 
-from .scoping_band_pass import scoping_band_pass 
+from ansys.dpf.core._lazy_operators import _lazy_attributes
+
+__all__ = [
+    "field_band_pass",
+    "field_band_pass_fc",
+    "field_high_pass",
+    "field_high_pass_fc",
+    "field_low_pass",
+    "field_low_pass_fc",
+    "scoping_band_pass",
+    "scoping_high_pass",
+    "scoping_low_pass",
+]
+
+__getattr__, __dir__ = _lazy_attributes(__name__, __all__, classes=True)
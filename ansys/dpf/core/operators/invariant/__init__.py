@@ -1,10 +1,16 @@
-from .eigen_values import eigen_values 
-from .principal_invariants import principal_invariants 
-from .von_mises_eqv import von_mises_eqv 
-from .von_mises_eqv_fc import von_mises_eqv_fc 
-from .invariants import invariants 
-from .eigen_values_fc import eigen_values_fc 
-from .invariants_fc import invariants_fc 
-from .principal_invariants_fc import principal_invariants_fc 
-from .eigen_vectors_fc import eigen_vectors_fc 
-from .eigen_vectors import eigen_vectors 
+from ansys.dpf.core._lazy_operators import _lazy_attributes
+
+__all__ = [
+    "eigen_values",
+    "eigen_values_fc",
+    "eigen_vectors",
+    "eigen_vectors_fc",
+    "invariants",
+    "invariants_fc",
+    "principal_invariants",
+    "principal_invariants_fc",
+    "von_mises_eqv",
+    "von_mises_eqv_fc",
+]
+
+__getattr__, __dir__ = _lazy_attributes(__name__, __all__, classes=True)
@@ -1,10 +1,16 @@
-from .identical_meshes import identical_meshes 
-from .component_selector_fc import component_selector_fc 
-from .component_selector import component_selector 
-from .identical_property_fields import identical_property_fields 
-from .merge_fields_by_label import merge_fields_by_label 
-from .solid_shell_fields import solid_shell_fields 
-from .identical_fields import identical_fields 
-from .included_fields import included_fields 
-from .identical_fc import identical_fc 
-from .enrich_materials import enrich_materials 
+from ansys.dpf.core._lazy_operators import _lazy_attributes
+
+__all__ = [
+    "component_selector",
+    "component_selector_fc",
+    "enrich_materials",
+    "identical_fc",
+    "identical_fields",
+    "identical_meshes",
+    "identical_property_fields",
+    "included_fields",
+    "merge_fields_by_label",
+    "solid_shell_fields",
+]
+
+__getattr__, __dir__ = _lazy_attributes(__name__, __all__, classes=True)
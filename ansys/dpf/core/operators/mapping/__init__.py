@@ -1,3 +1,9 @@
-from .solid_to_skin import solid_to_skin 
-from .on_coordinates import on_coordinates 
-from .scoping_on_coordinates import scoping_on_coordinates 
+from ansys.dpf.core._lazy_operators import _lazy_attributes
+
+__all__ = [
+    "on_coordinates",
+    "scoping_on_coordinates",
+    "solid_to_skin",
+]
+
+__getattr__, __dir__ = _lazy_attributes(__name__, __all__, classes=True)
@@ -1,12 +1,18 @@
-from .node_coordinates import node_coordinates 
-from .from_field import from_field 
-from .mesh_provider import mesh_provider 
-from .points_from_coordinates import points_from_coordinates 
-from .split_mesh import split_mesh 
-from .from_scoping import from_scoping 
-from .split_fields import split_fields 
-from .tri_mesh_skin import tri_mesh_skin 
-from .mesh_cut import mesh_cut 
-from .external_layer import external_layer 
-from .skin import skin 
-from .stl_export import stl_export 
+from ansys.dpf.core._lazy_operators import _lazy_attributes
+
+__all__ = [
+    "external_layer",
+    "from_field",
+    "from_scoping",
+    "mesh_cut",
+    "mesh_provider",
+    "node_coordinates",
+    "points_from_coordinates",
+    "skin",
+    "split_fields",
+    "split_mesh",
+    "stl_export",
+    "tri_mesh_skin",
+]
+
+__getattr__, __dir__ = _lazy_attributes(__name__, __all__, classes=True)
@@ -1,135 +1,141 @@
-from .plastic_strain_principal_1 import plastic_strain_principal_1 
-from .plastic_strain_principal_3 import plastic_strain_principal_3 
-from .rigid_transformation import rigid_transformation 
-from .elastic_strain_Y import elastic_strain_Y 
-from .nodal_moment import nodal_moment 
-from .elemental_mass import elemental_mass 
-from .heat_flux import heat_flux 
-from .co_energy import co_energy 
-from .plastic_strain_principal_2 import plastic_strain_principal_2 
-from .elastic_strain_Z import elastic_strain_Z 
-from .stress import stress 
-from .stress_X import stress_X 
-from .stress_Y import stress_Y 
-from .stress_Z import stress_Z 
-from .stress_XY import stress_XY 
-from .stress_YZ import stress_YZ 
-from .modal_basis import modal_basis 
-from .stress_XZ import stress_XZ 
-from .stress_principal_1 import stress_principal_1 
-from .stress_principal_2 import stress_principal_2 
-from .stress_principal_3 import stress_principal_3 
-from .elastic_strain import elastic_strain 
-from .elastic_strain_X import elastic_strain_X 
-from .elastic_strain_XY import elastic_strain_XY 
-from .elastic_strain_YZ import elastic_strain_YZ 
-from .elastic_strain_XZ import elastic_strain_XZ 
-from .elastic_strain_principal_1 import elastic_strain_principal_1 
-from .elastic_strain_principal_2 import elastic_strain_principal_2 
-from .elastic_strain_principal_3 import elastic_strain_principal_3 
-from .plastic_strain import plastic_strain 
-from .plastic_strain_X import plastic_strain_X 
-from .plastic_strain_Y import plastic_strain_Y 
-from .plastic_strain_Z import plastic_strain_Z 
-from .hydrostatic_pressure import hydrostatic_pressure 
-from .plastic_strain_XY import plastic_strain_XY 
-from .plastic_strain_YZ import plastic_strain_YZ 
-from .plastic_strain_XZ import plastic_strain_XZ 
-from .acceleration import acceleration 
-from .acceleration_X import acceleration_X 
-from .acceleration_Y import acceleration_Y 
-from .element_centroids import element_centroids 
-from .acceleration_Z import acceleration_Z 
-from .reaction_force import reaction_force 
-from .velocity import velocity 
-from .velocity_X import velocity_X 
-from .velocity_Y import velocity_Y 
-from .velocity_Z import velocity_Z 
-from .displacement import displacement 
-from .displacement_X import displacement_X 
-from .displacement_Y import displacement_Y 
-from .displacement_Z import displacement_Z 
-from .heat_flux_X import heat_flux_X 
-from .electric_field import electric_field 
-from .heat_flux_Y import heat_flux_Y 
-from .heat_flux_Z import heat_flux_Z 
-from .element_nodal_forces import element_nodal_forces 
-from .structural_temperature import structural_temperature 
-from .incremental_energy import incremental_energy 
-from .stiffness_matrix_energy import stiffness_matrix_energy 
-from .thermal_strain import thermal_strain 
-from .eqv_stress_parameter import eqv_stress_parameter 
-from .stress_ratio import stress_ratio 
-from .accu_eqv_plastic_strain import accu_eqv_plastic_strain 
-from .plastic_state_variable import plastic_state_variable 
-from .accu_eqv_creep_strain import accu_eqv_creep_strain 
-from .plastic_strain_energy_density import plastic_strain_energy_density 
-from .material_property_of_element import material_property_of_element 
-from .creep_strain_energy_density import creep_strain_energy_density 
-from .elastic_strain_energy_density import elastic_strain_energy_density 
-from .contact_status import contact_status 
-from .contact_penetration import contact_penetration 
-from .contact_pressure import contact_pressure 
-from .contact_friction_stress import contact_friction_stress 
-from .contact_total_stress import contact_total_stress 
-from .contact_sliding_distance import contact_sliding_distance 
-from .contact_gap_distance import contact_gap_distance 
-from .contact_surface_heat_flux import contact_surface_heat_flux 
-from .num_surface_status_changes import num_surface_status_changes 
-from .contact_fluid_penetration_pressure import contact_fluid_penetration_pressure 
-from .elemental_volume import elemental_volume 
-from .artificial_hourglass_energy import artificial_hourglass_energy 
-from .kinetic_energy import kinetic_energy 
-from .thermal_dissipation_energy import thermal_dissipation_energy 
-from .nodal_force import nodal_force 
-from .temperature import temperature 
-from .raw_displacement import raw_displacement 
-from .raw_reaction_force import raw_reaction_force 
-from .electric_potential import electric_potential 
-from .thickness import thickness 
-from .element_orientations import element_orientations 
-from .custom import custom 
-from .stress_von_mises import stress_von_mises 
-from .cyclic_expansion import cyclic_expansion 
-from .equivalent_radiated_power import equivalent_radiated_power 
-from .torque import torque 
-from .cyclic_analytic_usum_max import cyclic_analytic_usum_max 
-from .cyclic_analytic_seqv_max import cyclic_analytic_seqv_max 
-from .recombine_harmonic_indeces_cyclic import recombine_harmonic_indeces_cyclic 
-from .poynting_vector import poynting_vector 
-from .poynting_vector_surface import poynting_vector_surface 
-from .nodal_averaged_elastic_strains import nodal_averaged_elastic_strains 
-from .add_rigid_body_motion import add_rigid_body_motion 
-from .nodal_averaged_equivalent_elastic_strain import nodal_averaged_equivalent_elastic_strain 
-from .run import run 
-from .cyclic_expanded_velocity import cyclic_expanded_velocity 
-from .cyclic_expanded_el_strain import cyclic_expanded_el_strain 
-from .nodal_averaged_thermal_swelling_strains import nodal_averaged_thermal_swelling_strains 
-from .nodal_averaged_stresses import nodal_averaged_stresses 
-from .nodal_averaged_thermal_strains import nodal_averaged_thermal_strains 
-from .nodal_averaged_plastic_strains import nodal_averaged_plastic_strains 
-from .nodal_averaged_creep_strains import nodal_averaged_creep_strains 
-from .nodal_averaged_equivalent_thermal_strains import nodal_averaged_equivalent_thermal_strains 
-from .nodal_averaged_equivalent_plastic_strain import nodal_averaged_equivalent_plastic_strain 
-from .nodal_averaged_equivalent_creep_strain import nodal_averaged_equivalent_creep_strain 
-from .euler_nodes import euler_nodes 
-from .nmisc import nmisc 
-from .enf_rotation_by_euler_nodes import enf_rotation_by_euler_nodes 
-from .cms_matrices_provider import cms_matrices_provider 
-from .smisc import smisc 
-from .nodal_rotation_by_euler_nodes import nodal_rotation_by_euler_nodes 
-from .stress_rotation_by_euler_nodes import stress_rotation_by_euler_nodes 
-from .elastic_strain_rotation_by_euler_nodes import elastic_strain_rotation_by_euler_nodes 
-from .plastic_strain_rotation_by_euler_nodes import plastic_strain_rotation_by_euler_nodes 
-from .pres_to_field import pres_to_field 
-from .prns_to_field import prns_to_field 
-from .remove_rigid_body_motion import remove_rigid_body_motion 
-from .remove_rigid_body_motion_fc import remove_rigid_body_motion_fc 
-from .add_rigid_body_motion_fc import add_rigid_body_motion_fc 
-from .cyclic_expanded_displacement import cyclic_expanded_displacement 
-from .cyclic_expanded_acceleration import cyclic_expanded_acceleration 
-from .cyclic_expanded_stress import cyclic_expanded_stress 
-from .cyclic_expanded_enf import cyclic_expanded_enf 
-from .cyclic_volume import cyclic_volume 
-from .cyclic_strain_energy import cyclic_strain_energy 
-from .migrate_to_h5dpf import migrate_to_h5dpf 
+from ansys.dpf.core._lazy_operators import _lazy_attributes
+
+__all__ = [
+    "acceleration",
+    "acceleration_X",
+    "acceleration_Y",
+    "acceleration_Z",
+    "accu_eqv_creep_strain",
+    "accu_eqv_plastic_strain",
+    "add_rigid_body_motion",
+    "add_rigid_body_motion_fc",
+    "artificial_hourglass_energy",
+    "cms_matrices_provider",
+    "co_energy",
+    "contact_fluid_penetration_pressure",
+    "contact_friction_stress",
+    "contact_gap_distance",
+    "contact_penetration",
+    "contact_pressure",
+    "contact_sliding_distance",
+    "contact_status",
+    "contact_surface_heat_flux",
+    "contact_total_stress",
+    "creep_strain_energy_density",
+    "custom",
+    "cyclic_analytic_seqv_max",
+    "cyclic_analytic_usum_max",
+    "cyclic_expanded_acceleration",
+    "cyclic_expanded_displacement",
+    "cyclic_expanded_el_strain",
+    "cyclic_expanded_enf",
+    "cyclic_expanded_stress",
+    "cyclic_expanded_velocity",
+    "cyclic_expansion",
+    "cyclic_strain_energy",
+    "cyclic_volume",
+    "displacement",
+    "displacement_X",
+    "displacement_Y",
+    "displacement_Z",
+    "elastic_strain",
+    "elastic_strain_X",
+    "elastic_strain_XY",
+    "elastic_strain_XZ",
+    "elastic_strain_Y",
+    "elastic_strain_YZ",
+    "elastic_strain_Z",
+    "elastic_strain_energy_density",
+    "elastic_strain_principal_1",
+    "elastic_strain_principal_2",
+    "elastic_strain_principal_3",
+    "elastic_strain_rotation_by_euler_nodes",
+    "electric_field",
+    "electric_potential",
+    "element_centroids",
+    "element_nodal_forces",
+    "element_orientations",
+    "elemental_mass",
+    "elemental_volume",
+    "enf_rotation_by_euler_nodes",
+    "equivalent_radiated_power",
+    "eqv_stress_parameter",
+    "euler_nodes",
+    "heat_flux",
+    "heat_flux_X",
+    "heat_flux_Y",
+    "heat_flux_Z",
+    "hydrostatic_pressure",
+    "incremental_energy",
+    "kinetic_energy",
+    "material_property_of_element",
+    "migrate_to_h5dpf",
+    "modal_basis",
+    "nmisc",
+    "nodal_averaged_creep_strains",
+    "nodal_averaged_elastic_strains",
+    "nodal_averaged_equivalent_creep_strain",
+    "nodal_averaged_equivalent_elastic_strain",
+    "nodal_averaged_equivalent_plastic_strain",
+    "nodal_averaged_equivalent_thermal_strains",
+    "nodal_averaged_plastic_strains",
+    "nodal_averaged_stresses",
+    "nodal_averaged_thermal_strains",
+    "nodal_averaged_thermal_swelling_strains",
+    "nodal_force",
+    "nodal_moment",
+    "nodal_rotation_by_euler_nodes",
+    "num_surface_status_changes",
+    "plastic_state_variable",
+    "plastic_strain",
+    "plastic_strain_X",
+    "plastic_strain_XY",
+    "plastic_strain_XZ",
+    "plastic_strain_Y",
+    "plastic_strain_YZ",
+    "plastic_strain_Z",
+    "plastic_strain_energy_density",
+    "plastic_strain_principal_1",
+    "plastic_strain_principal_2",
+    "plastic_strain_principal_3",
+    "plastic_strain_rotation_by_euler_nodes",
+    "poynting_vector",
+    "poynting_vector_surface",
+    "pres_to_field",
+    "prns_to_field",
+    "raw_displacement",
+    "raw_reaction_force",
+    "reaction_force",
+    "recombine_harmonic_indeces_cyclic",
+    "remove_rigid_body_motion",
+    "remove_rigid_body_motion_fc",
+    "rigid_transformation",
+    "run",
+    "smisc",
+    "stiffness_matrix_energy",
+    "stress",
+    "stress_X",
+    "stress_XY",
+    "stress_XZ",
+    "stress_Y",
+    "stress_YZ",
+    "stress_Z",
+    "stress_principal_1",
+    "stress_principal_2",
+    "stress_principal_3",
+    "stress_ratio",
+    "stress_rotation_by_euler_nodes",
+    "stress_von_mises",
+    "structural_temperature",
+    "temperature",
+    "thermal_dissipation_energy",
+    "thermal_strain",
+    "thickness",
+    "torque",
+    "velocity",
+    "velocity_X",
+    "velocity_Y",
+    "velocity_Z",
+]
+
+__getattr__, __dir__ = _lazy_attributes(__name__, __all__, classes=True)
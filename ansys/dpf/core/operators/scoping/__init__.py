@@ -1,12 +1,18 @@
-from .elemental_from_mesh import elemental_from_mesh 
-from .intersect import intersect 
-from .connectivity_ids import connectivity_ids 
-from .on_property import on_property 
-from .transpose import transpose 
-from .rescope_fc import rescope_fc 
-from .splitted_on_property_type import splitted_on_property_type 
-from .rescope import rescope 
-from .on_named_selection import on_named_selection 
-from .nodal_from_mesh import nodal_from_mesh 
-from .change_fc import change_fc 
-from .from_mesh import from_mesh 
+from ansys.dpf.core._lazy_operators import _lazy_attributes
+
+__all__ = [
+    "change_fc",
+    "connectivity_ids",
+    "elemental_from_mesh",
+    "from_mesh",
+    "intersect",
+    "nodal_from_mesh",
+    "on_named_selection",
+    "on_property",
+    "rescope",
+    "rescope_fc",
+    "splitted_on_property_type",
+    "transpose",
+]
+
+__getattr__, __dir__ = _lazy_attributes(__name__, __all__, classes=True)
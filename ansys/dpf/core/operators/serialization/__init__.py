@@ -1,9 +1,15 @@
-from .serializer import serializer 
-from .mechanical_csv_to_field import mechanical_csv_to_field 
-from .field_to_csv import field_to_csv 
-from .deserializer import deserializer 
-from .csv_to_field import csv_to_field 
-from .vtk_export import vtk_export 
-from .vtk_to_fields import vtk_to_fields 
-from .migrate_file_to_vtk import migrate_file_to_vtk 
-from .serialize_to_hdf5 import serialize_to_hdf5 
+from ansys.dpf.core._lazy_operators import _lazy_attributes
+
+__all__ = [
+    "csv_to_field",
+    "deserializer",
+    "field_to_csv",
+    "mechanical_csv_to_field",
+    "migrate_file_to_vtk",
+    "serialize_to_hdf5",
+    "serializer",
+    "vtk_export",
+    "vtk_to_fields",
+]
+
+__getattr__, __dir__ = _lazy_attributes(__name__, __all__, classes=True)
@@ -1,17 +1,23 @@
-from .field_to_fc import field_to_fc 
-from .html_doc import html_doc 
-from .unitary_field import unitary_field 
-from .extract_field import extract_field 
-from .bind_support import bind_support 
-from .scalars_to_field import scalars_to_field 
-from .change_location import change_location 
-from .strain_from_voigt import strain_from_voigt 
-from .set_property import set_property 
-from .forward_field import forward_field 
-from .forward_fields_container import forward_fields_container 
-from .forward_meshes_container import forward_meshes_container 
-from .forward import forward 
-from .txt_file_to_dpf import txt_file_to_dpf 
-from .bind_support_fc import bind_support_fc 
-from .python_generator import python_generator 
-from .change_shell_layers import change_shell_layers 
+from ansys.dpf.core._lazy_operators import _lazy_attributes
+
+__all__ = [
+    "bind_support",
+    "bind_support_fc",
+    "change_location",
+    "change_shell_layers",
+    "extract_field",
+    "field_to_fc",
+    "forward",
+    "forward_field",
+    "forward_fields_container",
+    "forward_meshes_container",
+    "html_doc",
+    "python_generator",
+    "scalars_to_field",
+    "set_property",
+    "strain_from_voigt",
+    "txt_file_to_dpf",
+    "unitary_field",
+]
+
+__getattr__, __dir__ = _lazy_attributes(__name__, __all__, classes=True)
@@ -0,0 +1,279 @@
+"""
+Output cache
+============
+In-memory cache of the fields and fields containers evaluated by the
+operators during a session.
+
+Requesting again an output computed from the same inputs, for example
+with a new operator returned by ``model.results.stress()`` connected to
+the same scoping, returns the entity already evaluated instead of
+evaluating it on the server and receiving it again. The outputs are
+identified by the same fingerprint as in the persistent
+:mod:`ansys.dpf.core.result_cache`, which is read on a miss when enabled,
+and by the server evaluating them.
+
+The cache is off by default. It is enabled with :func:`enable`, or for
+the whole process with the ``DPF_OUTPUT_CACHE_MAX_BYTES`` environment
+variable giving its maximum size.
+
+Notes
+-----
+The entities returned by the hits are shared: copy them before modifying
+them in place. The entities released by a :func:`ansys.dpf.core.session`
+are evaluated again when requested.
+"""
+import collections
+import logging
+import os
+import threading
+import weakref
+
+from ansys.dpf.core.mapping_types import types
+
+LOG = logging.getLogger(__name__)
+
+# environment variable enabling the cache for the process
+_ENV_MAX_BYTES = "DPF_OUTPUT_CACHE_MAX_BYTES"
+
+# maximum size in bytes of the data of the cached outputs
+DEFAULT_MAX_BYTES = 512 * 1024 ** 2
+
+# output types stored in the cache
+_CACHED_TYPES = (types.fields_container, types.field)
+
+
+def _output_bytes(output):
+    """Size in bytes of the data of a field or fields container"""
+    from ansys.dpf.core.fields_container import FieldsContainer
+    if isinstance(output, FieldsContainer):
+        fields, _ = output.get_all_entries()
+    else:
+        fields = [output]
+    return sum(field.size for field in fields) * 8
+
+
+class OutputCache:
+    """Least recently used outputs of the operators, up to a total size of
+    their data.
+
+    Parameters
+    ----------
+    max_bytes : int, optional
+        Maximum size in bytes of the data of the cached outputs, estimated
+        from the number of values of their fields.
+
+    Examples
+    --------
+    >>> from ansys.dpf import core as dpf
+    >>> from ansys.dpf.core import examples
+    >>> cache = dpf.output_cache.enable()
+    >>> model = dpf.Model(examples.static_rst)
+    >>> disp = model.results.displacement().eval()
+    >>> disp = model.results.displacement().eval()
+    >>> cache.stats["hits"]
+    1
+    >>> dpf.output_cache.disable()
+
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._lock = threading.RLock()
+        # output and size of the entries, from the least to the most
+        # recently used
+        self._entries = collections.OrderedDict()
+        # keys of the entries evaluated by each operator
+        self._producers = weakref.WeakKeyDictionary()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._uncacheable = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def get_output(self, operator, pin=0, output_type=types.fields_container):
+        """Returns the output of an operator, already evaluated if its inputs
+        didn't change, else evaluated and kept.
+
+        Parameters
+        ----------
+        operator : Operator
+            Operator to evaluate.
+
+        pin : int, optional
+            Number of the output pin.
+
+        output_type : core.type enum, optional
+            ``types.fields_container`` or ``types.field``.
+
+        Returns
+        -------
+        output : FieldsContainer or Field
+        """
+        from ansys.dpf.core.result_cache import output_fingerprint
+        key = output_fingerprint(operator, pin, output_type)
+        if key is None:
+            with self._lock:
+                self._uncacheable += 1
+            return operator._read_output(pin, output_type)
+        # the entities belong to the server which evaluated them, and keep
+        # it alive: its id is not reused while they are cached
+        key = (id(operator._server), key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0]._message is None:
+                # released by a session, the server no longer has it
+                del self._entries[key]
+                self._bytes -= entry[1]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[0]
+            self._misses += 1
+        output = operator._read_output(pin, output_type)
+        try:
+            size = _output_bytes(output)
+        except Exception as e:
+            # the output is still returned, only not cached
+            LOG.debug(f"Output not cached: {e}")
+            return output
+        if size <= self.max_bytes:
+            self._add(key, output, size, operator)
+        return output
+
+    def invalidate(self, operator):
+        """Remove the outputs evaluated by an operator, for example when its
+        inputs are reconnected.
+
+        Parameters
+        ----------
+        operator : Operator
+        """
+        with self._lock:
+            keys = self._producers.pop(operator, ())
+            for key in keys:
+                if key in self._entries:
+                    self._bytes -= self._entries.pop(key)[1]
+                    self._invalidations += 1
+
+    def clear(self):
+        """Remove all the outputs of the cache."""
+        with self._lock:
+            self._entries.clear()
+            self._producers.clear()
+            self._bytes = 0
+
+    @property
+    def size(self):
+        """Size in bytes of the data of the cached outputs.
+
+        Returns
+        -------
+        size : int
+        """
+        return self._bytes
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    @property
+    def stats(self):
+        """Statistics of the cache since its creation.
+
+        Returns
+        -------
+        stats : dict
+            ``"hits"``, ``"misses"``, ``"uncacheable"`` (evaluations whose
+            inputs can't be fingerprinted), ``"evictions"``,
+            ``"invalidations"``, ``"entries"``, ``"bytes"`` and
+            ``"hit_rate"`` (hits over cacheable requests).
+        """
+        with self._lock:
+            requests = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "uncacheable": self._uncacheable,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hit_rate": self._hits / requests if requests else 0.,
+            }
+
+    def __str__(self):
+        stats = self.stats
+        return (f"DPF output cache: {stats['entries']} entries, "
+                f"{stats['bytes']} / {self.max_bytes} bytes, {stats['hits']} hits, "
+                f"{stats['misses']} misses, hit rate {stats['hit_rate']:.1%}")
+
+    def _add(self, key, output, size, operator):
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (output, size)
+            self._bytes += size
+            self._producers.setdefault(operator, set()).add(key)
+            while self._bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+                self._evictions += 1
+
+
+def _from_environment():
+    max_bytes = os.environ.get(_ENV_MAX_BYTES)
+    return OutputCache(int(max_bytes)) if max_bytes else None
+
+
+_cache = _from_environment()
+
+
+def enable(max_bytes=None):
+    """Keep the fields and fields containers evaluated by the operators of
+    this process in memory.
+
+    Parameters
+    ----------
+    max_bytes : int, optional
+        Maximum size in bytes of the data of the cached outputs. Defaults
+        to the ``DPF_OUTPUT_CACHE_MAX_BYTES`` environment variable, else
+        to 512 MiB.
+
+    Returns
+    -------
+    cache : OutputCache
+
+    Examples
+    --------
+    >>> from ansys.dpf import core as dpf
+    >>> cache = dpf.output_cache.enable(max_bytes=100 * 1024 ** 2)
+    >>> dpf.output_cache.disable()
+
+    """
+    global _cache
+    if max_bytes is None:
+        max_bytes = os.environ.get(_ENV_MAX_BYTES)
+        max_bytes = int(max_bytes) if max_bytes else DEFAULT_MAX_BYTES
+    _cache = OutputCache(max_bytes)
+    return _cache
+
+
+def disable():
+    """Stop caching the evaluated outputs, and release the cached ones."""
+    global _cache
+    _cache = None
+
+
+def get_cache():
+    """Returns the active output cache.
+
+    Returns
+    -------
+    cache : OutputCache
+        ``None`` when the cache is disabled.
+    """
+    return _cache
@@ -2,6 +2,7 @@ from ansys.dpf.core.mapping_types import map_types_to_python
 from ansys.dpf.core.common import types
 from ansys.grpc.dpf import operator_pb2
 import re
+import copy
 
 class Output:
     def __init__(self, spec, pin, operator):
@@ -96,7 +97,7 @@ def _modify_output_spec_with_one_type(output_spec, type):
         _clearRepeatedMessage(spec.type_names)
         spec.type_names.extend([type])
     else:
-        spec = output_spec
+        spec = copy.copy(output_spec) # the generated specifications are shared
         spec.type_names = [type]
     
     return spec
@@ -0,0 +1,393 @@
+"""
+Profiling
+=========
+Record the gRPC calls sent to the DPF servers: number of calls, bytes
+transferred, streamed chunks and latencies, by service and method.
+"""
+import collections
+import contextlib
+import json
+import threading
+import time
+
+import grpc
+import numpy as np
+
+# upper bounds in seconds of the latency histogram buckets, the last bucket
+# gathers the slower calls
+LATENCY_BUCKETS = (1e-4, 2.5e-4, 5e-4, 1e-3, 2.5e-3, 5e-3, 1e-2, 2.5e-2, 5e-2,
+                   0.1, 0.25, 0.5, 1., 2.5, 5., 10.)
+
+CallRecord = collections.namedtuple(
+    "CallRecord", ("service", "method", "start", "duration", "request_bytes",
+                   "response_bytes", "request_chunks", "response_chunks", "error"))
+CallRecord.__doc__ = """Description of a gRPC call given to the recorders and
+to the hooks: names of the service and of the method, start time (as given
+by ``time.time()``) and duration in seconds, bytes and chunks sent and
+received, and gRPC status code name of the error or ``None``."""
+
+_lock = threading.Lock()
+_recorders = []
+_hooks = []
+
+
+def add_hook(hook):
+    """Call ``hook(call_record)`` after each gRPC call to a DPF server.
+
+    This allows to forward the calls to an external tracing system. The
+    hooks are called in the thread which finished the call, their
+    exceptions are ignored.
+
+    Parameters
+    ----------
+    hook : callable
+        Function taking a :class:`CallRecord`.
+
+    Examples
+    --------
+    >>> from ansys.dpf import core as dpf
+    >>> calls = []
+    >>> dpf.profiling.add_hook(calls.append)
+    >>> field = dpf.Field(nentities=10)
+    >>> dpf.profiling.remove_hook(calls.append)
+
+    """
+    with _lock:
+        _hooks.append(hook)
+
+
+def remove_hook(hook):
+    """Stop calling a hook added with :func:`add_hook`.
+
+    Parameters
+    ----------
+    hook : callable
+    """
+    with _lock:
+        _hooks.remove(hook)
+
+
+class _MethodStatistics:
+    """Statistics of the calls of one method"""
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.request_chunks = 0
+        self.response_chunks = 0
+        self.durations = []
+
+    def add(self, call):
+        self.calls += 1
+        self.errors += call.error is not None
+        self.request_bytes += call.request_bytes
+        self.response_bytes += call.response_bytes
+        self.request_chunks += call.request_chunks
+        self.response_chunks += call.response_chunks
+        self.durations.append(call.duration)
+
+    def to_dict(self):
+        durations = np.array(self.durations)
+        counts = np.bincount(np.searchsorted(LATENCY_BUCKETS, durations),
+                             minlength=len(LATENCY_BUCKETS) + 1)
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "request_bytes": self.request_bytes,
+            "response_bytes": self.response_bytes,
+            "request_chunks": self.request_chunks,
+            "response_chunks": self.response_chunks,
+            "total_time": float(durations.sum()),
+            "mean_time": float(durations.mean()),
+            "median_time": float(np.median(durations)),
+            "p95_time": float(np.percentile(durations, 95)),
+            "max_time": float(durations.max()),
+            "histogram": counts.tolist(),
+        }
+
+
+class Report:
+    """Statistics of the gRPC calls recorded by :func:`record`, by
+    ``"Service/Method"``.
+
+    The latency histogram of each method counts the calls whose duration
+    is below each bound of :data:`LATENCY_BUCKETS`, the last count gathers
+    the slower calls.
+
+    Examples
+    --------
+    >>> from ansys.dpf import core as dpf
+    >>> with dpf.profiling.record() as report:
+    ...     field = dpf.Field(nentities=10)
+    ...     field.data = range(30)
+    >>> report.calls()["FieldService/UpdateData"]
+    1
+    >>> json_report = report.to_json()
+
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._methods = collections.defaultdict(_MethodStatistics)
+        self.start = None
+        self.duration = None
+
+    def _add(self, call):
+        with self._lock:
+            self._methods[f"{call.service}/{call.method}"].add(call)
+
+    def calls(self):
+        """Number of calls of each method.
+
+        Returns
+        -------
+        calls : dict[str, int]
+        """
+        with self._lock:
+            return {name: stats.calls for name, stats in sorted(self._methods.items())}
+
+    @property
+    def total_calls(self):
+        """Number of calls recorded.
+
+        Returns
+        -------
+        total_calls : int
+        """
+        with self._lock:
+            return sum(stats.calls for stats in self._methods.values())
+
+    def to_dict(self):
+        """Statistics of each method.
+
+        Returns
+        -------
+        report : dict
+            ``"duration"`` of the recording in seconds and ``"methods"``,
+            the statistics by ``"Service/Method"``: number of ``"calls"``
+            and ``"errors"``, ``"request_bytes"``, ``"response_bytes"``,
+            ``"request_chunks"``, ``"response_chunks"``, ``"total_time"``,
+            ``"mean_time"``, ``"median_time"``, ``"p95_time"`` and
+            ``"max_time"`` in seconds, and the latency ``"histogram"``.
+        """
+        with self._lock:
+            methods = {name: stats.to_dict() for name, stats in sorted(self._methods.items())}
+        return {"duration": self.duration, "latency_buckets": list(LATENCY_BUCKETS),
+                "methods": methods}
+
+    def to_json(self, path=None, indent=2):
+        """Export the report to JSON.
+
+        Parameters
+        ----------
+        path : str, optional
+            File written. The JSON string is returned when not given.
+
+        indent : int, optional
+
+        Returns
+        -------
+        json : str or None
+        """
+        report = self.to_dict()
+        if path is None:
+            return json.dumps(report, indent=indent)
+        with open(path, "w") as file:
+            json.dump(report, file, indent=indent)
+
+    def __str__(self):
+        report = self.to_dict()
+        lines = [f"{'method':<45}{'calls':>8}{'errors':>8}{'sent (kB)':>12}{'received (kB)':>15}"
+                 f"{'total (ms)':>12}{'mean (ms)':>11}"]
+        for name, stats in sorted(report["methods"].items(),
+                                  key=lambda item: -item[1]["total_time"]):
+            lines.append(f"{name:<45}{stats['calls']:>8}{stats['errors']:>8}"
+                         f"{stats['request_bytes'] / 1e3:>12.1f}"
+                         f"{stats['response_bytes'] / 1e3:>15.1f}"
+                         f"{stats['total_time'] * 1e3:>12.2f}{stats['mean_time'] * 1e3:>11.3f}")
+        return "\n".join(lines)
+
+
+@contextlib.contextmanager
+def record():
+    """Record the gRPC calls sent to the DPF servers in the scope.
+
+    Yields
+    ------
+    report : Report
+        Filled with the calls finished in the scope, by all the threads.
+
+    Examples
+    --------
+    >>> from ansys.dpf import core as dpf
+    >>> from ansys.dpf.core import examples
+    >>> model = dpf.Model(examples.static_rst)
+    >>> with dpf.profiling.record() as report:
+    ...     disp = model.results.displacement().outputs.fields_container()
+    ...     data = disp[0].data
+    >>> print(report) # doctest: +SKIP
+
+    """
+    report = Report()
+    report.start = time.time()
+    start = time.perf_counter()
+    with _lock:
+        _recorders.append(report)
+    try:
+        yield report
+    finally:
+        with _lock:
+            _recorders.remove(report)
+        report.duration = time.perf_counter() - start
+
+
+def _split_method(method):
+    """Return the service and method names of a gRPC method path such as
+    ``/ansys.api.dpf.field.v0.FieldService/List``"""
+    if isinstance(method, bytes):
+        method = method.decode()
+    service, _, name = method.rpartition("/")
+    return service.rpartition(".")[2], name
+
+
+def _message_size(message):
+    """Size in bytes of a request or response, already serialized for the
+    calls made without serializer"""
+    if isinstance(message, memoryview):
+        return message.nbytes
+    if isinstance(message, (bytes, bytearray)):
+        return len(message)
+    return message.ByteSize()
+
+
+def _error_code(error):
+    try:
+        return error.code().name
+    except Exception:
+        return type(error).__name__
+
+
+class _Call:
+    """Measures of a call in progress"""
+
+    def __init__(self, method):
+        self.service, self.method = _split_method(method)
+        self.start = time.time()
+        self.perf_start = time.perf_counter()
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.request_chunks = 0
+        self.response_chunks = 0
+        self._finished = False
+
+    def count_requests(self, request_iterator):
+        for request in request_iterator:
+            self.request_bytes += _message_size(request)
+            self.request_chunks += 1
+            yield request
+
+    def finish(self, error=None):
+        if self._finished:
+            return
+        self._finished = True
+        call = CallRecord(self.service, self.method, self.start,
+                          time.perf_counter() - self.perf_start,
+                          self.request_bytes, self.response_bytes,
+                          self.request_chunks, self.response_chunks,
+                          None if error is None else _error_code(error))
+        with _lock:
+            recorders = list(_recorders)
+            hooks = list(_hooks)
+        for recorder in recorders:
+            recorder._add(call)
+        for hook in hooks:
+            try:
+                hook(call)
+            except Exception:
+                pass
+
+    def finish_unary(self, outcome):
+        """Record the call once its response is received"""
+        def done(future):
+            error = future.exception()
+            if error is None:
+                self.response_bytes += _message_size(future.result())
+                self.response_chunks += 1
+            self.finish(error)
+        outcome.add_done_callback(done)
+        return outcome
+
+
+class _StreamingResponse:
+    """Iterator over the responses of a streaming call recording them,
+    which gives access to the other attributes of the call"""
+
+    def __init__(self, response, call):
+        self._response = response
+        self._call = call
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            response = next(self._response)
+        except StopIteration:
+            self._call.finish()
+            raise
+        except grpc.RpcError as error:
+            self._call.finish(error)
+            raise
+        self._call.response_bytes += _message_size(response)
+        self._call.response_chunks += 1
+        return response
+
+    def __getattr__(self, name):
+        return getattr(self._response, name)
+
+    def __del__(self):
+        # streams which are not read until their end
+        self._call.finish()
+
+
+class _ProfilingInterceptor(grpc.UnaryUnaryClientInterceptor,
+                            grpc.UnaryStreamClientInterceptor,
+                            grpc.StreamUnaryClientInterceptor,
+                            grpc.StreamStreamClientInterceptor):
+    """Record the calls when a recorder or a hook is active, else pass them
+    through"""
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        if not _recorders and not _hooks:
+            return continuation(client_call_details, request)
+        call = _Call(client_call_details.method)
+        call.request_bytes = _message_size(request)
+        call.request_chunks = 1
+        return call.finish_unary(continuation(client_call_details, request))
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        if not _recorders and not _hooks:
+            return continuation(client_call_details, request)
+        call = _Call(client_call_details.method)
+        call.request_bytes = _message_size(request)
+        call.request_chunks = 1
+        return _StreamingResponse(continuation(client_call_details, request), call)
+
+    def intercept_stream_unary(self, continuation, client_call_details, request_iterator):
+        if not _recorders and not _hooks:
+            return continuation(client_call_details, request_iterator)
+        call = _Call(client_call_details.method)
+        return call.finish_unary(continuation(client_call_details,
+                                              call.count_requests(request_iterator)))
+
+    def intercept_stream_stream(self, continuation, client_call_details, request_iterator):
+        if not _recorders and not _hooks:
+            return continuation(client_call_details, request_iterator)
+        call = _Call(client_call_details.method)
+        return _StreamingResponse(continuation(client_call_details,
+                                               call.count_requests(request_iterator)), call)
+
+
+_INTERCEPTOR = _ProfilingInterceptor()
@@ -0,0 +1,265 @@
+"""
+ReleaseQueue
+============
+Deferred deletion of the server side objects whose python wrappers are
+garbage collected.
+"""
+import collections
+import logging
+import sys
+import threading
+import time
+
+LOG = logging.getLogger(__name__)
+
+# number of deletions sent to the server before waiting for their answers
+DEFAULT_BATCH_SIZE = 256
+
+# maximum time in seconds a deletion waits in the queue
+DEFAULT_INTERVAL = 0.05
+
+# maximum time in seconds waited for a deletion while the interpreter exits
+_FINALIZING_TIMEOUT = 1.
+
+
+class ReleaseQueue:
+    """Queue of the server side objects to delete, filled by the finalizers
+    of the python wrappers (:class:`Field`, :class:`Scoping`,
+    :class:`Operator`...).
+
+    Instead of blocking the interpreter on one ``Delete`` call per garbage
+    collected wrapper, the finalizers only push the object on the queue of
+    its server. The queue is emptied by a background thread, which sends
+    the deletions of a batch without waiting and then waits for all their
+    answers, or by :func:`ReleaseQueue.flush`. The thread stops when the
+    queue is empty.
+
+    Each server has its own queue: ``server.release_queue``.
+
+    Parameters
+    ----------
+    batch_size : int, optional
+        Maximum number of deletions in flight.
+
+    interval : float, optional
+        Maximum time in seconds a deletion waits before being sent, unless
+        a batch is full first.
+
+    Examples
+    --------
+    >>> from ansys.dpf import core as dpf
+    >>> fields = [dpf.Field(nentities=10) for i in range(100)]
+    >>> del fields
+    >>> released = dpf.flush()
+
+    """
+
+    def __init__(self, batch_size=DEFAULT_BATCH_SIZE, interval=DEFAULT_INTERVAL):
+        self.batch_size = batch_size
+        self.interval = interval
+        self.enabled = True
+        self._pending = collections.deque()
+        # reentrant: a finalizer can run in a thread holding the lock
+        self._lock = threading.Condition(threading.RLock())
+        self._wake = threading.Event()
+        self._worker = None
+        self._in_flight = 0
+        self._released = 0
+        self._failed = 0
+        self._last_error = None
+
+    def push(self, delete, message):
+        """Queue the deletion of an object.
+
+        Parameters
+        ----------
+        delete : grpc.UnaryUnaryMultiCallable
+            ``Delete`` call of the object's service.
+
+        message : protobuf message
+            Message identifying the object, ``None`` if it was already
+            released.
+        """
+        if message is None:
+            return
+        if sys.is_finalizing():
+            # no thread can be started while the interpreter exits, and
+            # asynchronous calls start one
+            try:
+                delete(message, timeout=_FINALIZING_TIMEOUT)
+            except Exception:
+                pass
+            return
+        if not self.enabled:
+            self._release_batch([(delete, message)])
+            return
+        self._pending.append((delete, message))
+        if len(self._pending) >= self.batch_size:
+            self._wake.set()
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="dpf-release",
+                                                daemon=True)
+                self._worker.start()
+
+    def flush(self, timeout=None):
+        """Send the queued deletions and wait for the server to process them.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum time in seconds waited for the deletions sent by the
+            background thread. Wait without limit by default.
+
+        Returns
+        -------
+        released : int
+            Number of objects released by this call.
+        """
+        released = self._release_pending()
+        end = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            while self._in_flight:
+                remaining = None if end is None else end - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    break
+                self._lock.wait(remaining)
+        return released
+
+    def clear(self):
+        """Forget the queued deletions, for example when the server is shut
+        down."""
+        self._pending.clear()
+
+    @property
+    def pending(self):
+        """Number of objects queued or being deleted.
+
+        Returns
+        -------
+        pending : int
+        """
+        with self._lock:
+            return len(self._pending) + self._in_flight
+
+    @property
+    def released(self):
+        """Number of objects deleted by the server.
+
+        Returns
+        -------
+        released : int
+        """
+        return self._released
+
+    @property
+    def failed(self):
+        """Number of deletions which failed.
+
+        Returns
+        -------
+        failed : int
+        """
+        return self._failed
+
+    @property
+    def last_error(self):
+        """Error raised by the last failed deletion, ``None`` if none failed.
+
+        Returns
+        -------
+        error : Exception
+        """
+        return self._last_error
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            self._release_pending()
+            with self._lock:
+                if not self._pending:
+                    self._worker = None
+                    return
+
+    def _release_pending(self):
+        released = 0
+        while self._pending:
+            batch = []
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._pending.popleft())
+                except IndexError:
+                    break
+            released += self._release_batch(batch)
+        return released
+
+    def _release_batch(self, batch):
+        with self._lock:
+            self._in_flight += len(batch)
+        futures = []
+        errors = []
+        for delete, message in batch:
+            try:
+                futures.append(delete.future(message))
+            except Exception as e:
+                errors.append(e)
+        released = 0
+        for future in futures:
+            try:
+                future.result()
+                released += 1
+            except Exception as e:
+                errors.append(e)
+        if errors:
+            LOG.debug(f"{len(errors)} server objects could not be deleted: {errors[-1]}")
+        with self._lock:
+            self._in_flight -= len(batch)
+            self._released += released
+            self._failed += len(errors)
+            if errors:
+                self._last_error = errors[-1]
+            self._lock.notify_all()
+        return released
+
+
+def flush(server=None, timeout=None):
+    """Send the deletions of the server side objects queued by the garbage
+    collected python wrappers, and wait for them.
+
+    Parameters
+    ----------
+    server : DpfServer, optional
+        Server whose queue is flushed. All the servers of the session by
+        default.
+
+    timeout : float, optional
+        Maximum time in seconds waited for each server.
+
+    Returns
+    -------
+    released : int
+        Number of objects released.
+
+    Examples
+    --------
+    >>> from ansys.dpf import core as dpf
+    >>> field = dpf.Field(nentities=10)
+    >>> del field
+    >>> released = dpf.flush()
+
+    """
+    if server is not None:
+        return server.release_queue.flush(timeout)
+    from ansys.dpf import core
+    servers = [instance() for instance in core._server_instances]
+    if core.SERVER is not None:
+        servers.append(core.SERVER)
+    released = 0
+    flushed = set()
+    for srv in servers:
+        if srv is None or id(srv) in flushed:
+            continue
+        flushed.add(id(srv))
+        released += srv.release_queue.flush(timeout)
+    return released
@@ -0,0 +1,559 @@
+"""
+Result cache
+============
+Persistent cache of the fields and fields containers evaluated by the
+operators, stored on the client's disk and reused across sessions and
+server restarts.
+
+An output is identified by a fingerprint of the operator computing it:
+its name, its configuration and its inputs, recursively through the
+connected operators. The data sources are identified by the path, size
+and modification time (or content hash) of their files, which must be
+accessible from the client. Outputs depending on inputs which can't be
+fingerprinted, such as fields or meshes, or on operators added to a
+workflow, whose inputs can be connected by the workflow, are evaluated
+without cache.
+
+The cache is off by default. It is enabled with :func:`enable`, or for
+the whole process with the ``DPF_RESULT_CACHE`` environment variable
+giving its directory. Only ``Operator.get_output`` (and the outputs and
+results evaluated through it) reads the cache.
+
+Notes
+-----
+The fields read from the cache have no mesh support: use the mesh of the
+model instead of ``field.meshed_region``.
+"""
+import collections
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+
+import numpy as np
+
+from ansys.dpf.core.common import natures, shell_layers
+from ansys.dpf.core.mapping_types import types
+
+LOG = logging.getLogger(__name__)
+
+# environment variables enabling the cache for the process
+_ENV_PATH = "DPF_RESULT_CACHE"
+_ENV_MAX_BYTES = "DPF_RESULT_CACHE_MAX_BYTES"
+
+# maximum size in bytes of the cache directory
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3
+
+# bumped when the content of the files changes
+_FORMAT_VERSION = 1
+
+_EXTENSION = ".npz"
+
+# output types stored in the cache
+_CACHED_TYPES = (types.fields_container, types.field)
+
+# content hashes of the files, by path, size and modification time
+_file_hashes = {}
+
+
+class _Uncacheable(Exception):
+    """Raised when an input or an output can't be cached"""
+
+
+class ResultCache:
+    """Directory of evaluated fields and fields containers, with a maximum
+    size.
+
+    The least recently used entries are removed when the size of the
+    directory exceeds ``max_bytes``. Several processes can share the same
+    directory.
+
+    Parameters
+    ----------
+    path : str
+        Directory of the cache, created if needed.
+
+    max_bytes : int, optional
+        Maximum size in bytes of the files of the cache.
+
+    hash_files : bool, optional
+        Identify the files of the data sources by a hash of their content
+        instead of their size and modification time. Reading the files on
+        first use is slower, but the cache is shared by copies of the
+        result files.
+
+    Examples
+    --------
+    >>> from ansys.dpf import core as dpf
+    >>> from ansys.dpf.core import examples
+    >>> cache = dpf.result_cache.enable("/tmp/dpf_cache")
+    >>> model = dpf.Model(examples.static_rst)
+    >>> disp = model.results.displacement().eval()
+    >>> disp = model.results.displacement().eval()
+    >>> cache.stats["hits"]
+    1
+    >>> dpf.result_cache.disable()
+
+    """
+
+    def __init__(self, path, max_bytes=DEFAULT_MAX_BYTES, hash_files=False):
+        self.path = os.path.abspath(path)
+        self.max_bytes = max_bytes
+        self.hash_files = hash_files
+        os.makedirs(self.path, exist_ok=True)
+        self._lock = threading.RLock()
+        # size of the entries, from the least to the most recently used
+        self._entries = collections.OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._uncacheable = 0
+        self._stores = 0
+        self._evictions = 0
+        self._scan()
+
+    def get_output(self, operator, pin=0, output_type=types.fields_container):
+        """Returns the output of an operator, read from the cache if it was
+        already evaluated, else evaluated and stored.
+
+        Parameters
+        ----------
+        operator : Operator
+            Operator to evaluate.
+
+        pin : int, optional
+            Number of the output pin.
+
+        output_type : core.type enum, optional
+            ``types.fields_container`` or ``types.field``.
+
+        Returns
+        -------
+        output : FieldsContainer or Field
+        """
+        key = output_fingerprint(operator, pin, output_type, self.hash_files)
+        if key is None:
+            with self._lock:
+                self._uncacheable += 1
+            return operator._evaluate(pin, output_type)
+        output = self._load(key, operator._server)
+        if output is not None:
+            with self._lock:
+                self._hits += 1
+            return output
+        with self._lock:
+            self._misses += 1
+        output = operator._evaluate(pin, output_type)
+        self._store(key, output)
+        return output
+
+    def clear(self):
+        """Remove all the entries of the cache."""
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+
+    @property
+    def size(self):
+        """Size in bytes of the files of the cache.
+
+        Returns
+        -------
+        size : int
+        """
+        return self._bytes
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    @property
+    def stats(self):
+        """Statistics of the cache since its creation.
+
+        Returns
+        -------
+        stats : dict
+            ``"hits"``, ``"misses"``, ``"uncacheable"`` (evaluations whose
+            inputs can't be fingerprinted), ``"stores"``, ``"evictions"``,
+            ``"entries"``, ``"bytes"`` and ``"hit_rate"`` (hits over
+            cacheable requests).
+        """
+        with self._lock:
+            requests = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "uncacheable": self._uncacheable,
+                "stores": self._stores,
+                "evictions": self._evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hit_rate": self._hits / requests if requests else 0.,
+            }
+
+    def __str__(self):
+        stats = self.stats
+        return (f"DPF result cache in {self.path}: {stats['entries']} entries, "
+                f"{stats['bytes']} / {self.max_bytes} bytes, {stats['hits']} hits, "
+                f"{stats['misses']} misses, hit rate {stats['hit_rate']:.1%}")
+
+    def _file(self, key):
+        return os.path.join(self.path, key + _EXTENSION)
+
+    def _scan(self):
+        """Index the entries written by previous sessions, ordered by last
+        access"""
+        entries = []
+        for name in os.listdir(self.path):
+            if not name.endswith(_EXTENSION):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.path, name))
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, name[:-len(_EXTENSION)], stat.st_size))
+        for _, key, size in sorted(entries):
+            self._entries[key] = size
+            self._bytes += size
+
+    def _load(self, key, server):
+        path = self._file(key)
+        try:
+            with np.load(path) as npz:
+                output = _read_output(npz, server)
+            # the modification time orders the entries by last access
+            os.utime(path)
+        except FileNotFoundError:
+            with self._lock:
+                if key in self._entries:
+                    self._bytes -= self._entries.pop(key)
+            return None
+        except Exception as e:
+            LOG.debug(f"Invalid result cache entry {path}: {e}")
+            with self._lock:
+                self._remove(key)
+            return None
+        with self._lock:
+            if key not in self._entries:
+                # written by another process
+                self._entries[key] = os.path.getsize(path)
+                self._bytes += self._entries[key]
+            self._entries.move_to_end(key)
+        return output
+
+    def _store(self, key, output):
+        try:
+            arrays = _write_output(output)
+        except Exception as e:
+            # the output is still returned, only not cached
+            LOG.debug(f"Output not cached: {e}")
+            return
+        path = self._file(key)
+        try:
+            fd, tmp = tempfile.mkstemp(suffix=".tmp", dir=self.path)
+            with os.fdopen(fd, "wb") as file:
+                np.savez(file, **arrays)
+            size = os.path.getsize(tmp)
+            if size > self.max_bytes:
+                os.remove(tmp)
+                return
+            # readers never see a partially written entry
+            os.replace(tmp, path)
+        except OSError as e:
+            LOG.debug(f"Output not cached: {e}")
+            return
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)
+            self._entries[key] = size
+            self._bytes += size
+            self._stores += 1
+            while self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def _remove(self, key):
+        self._bytes -= self._entries.pop(key, 0)
+        try:
+            os.remove(self._file(key))
+        except OSError:
+            pass
+
+
+def _write_field(field, name, arrays):
+    """Add the arrays of a field to ``arrays``, and return its metadata"""
+    data = field.get_data()
+    if data.dtype.kind != "f":
+        raise _Uncacheable(f"data of type {data.dtype}")
+    scoping = field.scoping
+    dimensionnality = field.dimensionnality
+    arrays[name + "_data"] = data
+    arrays[name + "_ids"] = np.asarray(scoping.ids, dtype=np.int32)
+    data_pointer = field._data_pointer
+    if data_pointer is not None and len(data_pointer):
+        arrays[name + "_data_pointer"] = np.asarray(data_pointer, dtype=np.int32)
+    return {
+        "location": field.location,
+        "unit": field.unit,
+        "nature": dimensionnality.nature.name,
+        "dim": [int(size) for size in dimensionnality.dim],
+        "shell_layers": field.shell_layers.name,
+        "scoping_location": scoping.location,
+    }
+
+
+def _read_field(metadata, name, npz, server):
+    from ansys.dpf.core import fields_factory
+    from ansys.dpf.core.scoping import Scoping
+    ids = npz[name + "_ids"]
+    field = fields_factory._create_field(server, natures[metadata["nature"]], len(ids),
+                                         metadata["location"], *metadata["dim"])
+    definition = field.field_definition
+    definition.unit = metadata["unit"]
+    definition.shell_layers = shell_layers[metadata["shell_layers"]]
+    field.field_definition = definition
+    field.scoping = Scoping(ids=ids.tolist(), location=metadata["scoping_location"],
+                            server=server)
+    data = npz[name + "_data"]
+    if data.size:
+        field.data = data
+    if name + "_data_pointer" in npz:
+        field._data_pointer = npz[name + "_data_pointer"]
+    return field
+
+
+def _write_output(output):
+    """Arrays of the npz file of an output"""
+    from ansys.dpf.core.fields_container import FieldsContainer
+    arrays = {}
+    metadata = {"version": _FORMAT_VERSION}
+    if isinstance(output, FieldsContainer):
+        fields, label_spaces = output.get_all_entries()
+        metadata["labels"] = list(output.labels)
+        metadata["label_spaces"] = [{label: int(value) for label, value in space.items()}
+                                    for space in label_spaces]
+        metadata["fields"] = [_write_field(field, f"field{i}", arrays)
+                              for i, field in enumerate(fields)]
+        try:
+            frequencies = output.time_freq_support.time_frequencies
+        except Exception:
+            frequencies = None
+        if frequencies is not None:
+            metadata["time_frequencies"] = _write_field(frequencies, "time_frequencies",
+                                                        arrays)
+    else:
+        metadata["field"] = _write_field(output, "field", arrays)
+    arrays["metadata"] = np.array(json.dumps(metadata))
+    return arrays
+
+
+def _read_output(npz, server):
+    from ansys.dpf.core.fields_container import FieldsContainer
+    from ansys.dpf.core.time_freq_support import TimeFreqSupport
+    metadata = json.loads(str(npz["metadata"]))
+    if metadata["version"] != _FORMAT_VERSION:
+        raise ValueError(f"format version {metadata['version']}")
+    if "field" in metadata:
+        return _read_field(metadata["field"], "field", npz, server)
+    fc = FieldsContainer(server=server)
+    fc.labels = metadata["labels"]
+    for i, (label_space, field_metadata) in enumerate(zip(metadata["label_spaces"],
+                                                          metadata["fields"])):
+        fc.add_field(label_space, _read_field(field_metadata, f"field{i}", npz, server))
+    if "time_frequencies" in metadata:
+        support = TimeFreqSupport(server=server)
+        support.time_frequencies = _read_field(metadata["time_frequencies"],
+                                               "time_frequencies", npz, server)
+        fc.time_freq_support = support
+    return fc
+
+
+def _file_fingerprint(path, hash_files):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        raise _Uncacheable(f"file {path} not accessible from the client") from None
+    if not hash_files:
+        return (path, stat.st_size, stat.st_mtime_ns)
+    key = (path, stat.st_size, stat.st_mtime_ns)
+    if key not in _file_hashes:
+        digest = hashlib.sha256()
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(1 << 20), b""):
+                digest.update(chunk)
+        _file_hashes[key] = digest.hexdigest()
+    return (stat.st_size, _file_hashes[key])
+
+
+def _data_sources_fingerprint(data_sources, hash_files):
+    info = data_sources._info
+    paths = tuple(sorted((key, tuple(_file_fingerprint(path, hash_files) for path in paths))
+                         for key, paths in info["paths"].items()))
+    return ("data_sources", info["result_key"], paths)
+
+
+def _scoping_fingerprint(scoping):
+    # computed once per scoping, until it is modified
+    if scoping._ids_digest is None:
+        ids = np.ascontiguousarray(scoping.ids, dtype=np.int32)
+        scoping._ids_digest = hashlib.blake2b(ids.tobytes(), digest_size=16).hexdigest()
+    return ("scoping", scoping.location, scoping._ids_digest)
+
+
+def _config_fingerprint(operator):
+    if operator._config_options is None:
+        operator._config_options = tuple(sorted(operator.config.options.items()))
+    return operator._config_options
+
+
+def _input_fingerprint(inpt, pin_out, hash_files, memo):
+    from ansys.dpf.core.data_sources import DataSources
+    from ansys.dpf.core.dpf_operator import Operator
+    from ansys.dpf.core.model import Model
+    from ansys.dpf.core.outputs import Output
+    from ansys.dpf.core.scoping import Scoping
+    if isinstance(inpt, (str, bool, int, float)):
+        return (type(inpt).__name__, inpt)
+    if isinstance(inpt, (list, tuple)):
+        return ("list", tuple(inpt))
+    if isinstance(inpt, Scoping):
+        return _scoping_fingerprint(inpt)
+    if isinstance(inpt, DataSources):
+        return _data_sources_fingerprint(inpt, hash_files)
+    if isinstance(inpt, Model):
+        return _data_sources_fingerprint(inpt.metadata.data_sources, hash_files)
+    if isinstance(inpt, Operator):
+        return (_operator_fingerprint(inpt, hash_files, memo), pin_out)
+    if isinstance(inpt, Output):
+        return (_operator_fingerprint(inpt._operator, hash_files, memo), inpt._pin)
+    raise _Uncacheable(f"input of type {type(inpt).__name__}")
+
+
+def _operator_fingerprint(operator, hash_files, memo):
+    # an operator can be connected to several consumers of the graph
+    if id(operator) not in memo:
+        if operator._connections is None:
+            raise _Uncacheable(f"inputs of {operator.name} connected by a workflow")
+        inputs = tuple(sorted(
+            (pin, _input_fingerprint(inpt, pin_out, hash_files, memo))
+            for pin, (inpt, pin_out) in operator._connections.items()))
+        memo[id(operator)] = (operator.name, _config_fingerprint(operator), inputs)
+    return memo[id(operator)]
+
+
+def output_fingerprint(operator, pin=0, output_type=None, hash_files=False):
+    """Fingerprint identifying an output of an operator by what it is
+    computed from.
+
+    Parameters
+    ----------
+    operator : Operator
+        Operator computing the output.
+
+    pin : int, optional
+        Number of the output pin.
+
+    output_type : core.type enum, optional
+        Requested type of the output.
+
+    hash_files : bool, optional
+        Identify the files of the data sources by a hash of their content
+        instead of their size and modification time.
+
+    Returns
+    -------
+    fingerprint : str
+        Hexadecimal digest, ``None`` if an input of the operator or of the
+        operators it depends on can't be fingerprinted.
+
+    Examples
+    --------
+    >>> from ansys.dpf import core as dpf
+    >>> from ansys.dpf.core import examples
+    >>> model = dpf.Model(examples.static_rst)
+    >>> disp = model.results.displacement()
+    >>> key = dpf.result_cache.output_fingerprint(disp, 0, dpf.types.fields_container)
+
+    """
+    try:
+        graph = _operator_fingerprint(operator, hash_files, {})
+    except _Uncacheable as e:
+        LOG.debug(f"{operator.name} output can't be fingerprinted: {e}")
+        return None
+    output = getattr(output_type, "name", output_type)
+    key = repr((_FORMAT_VERSION, operator._server.version, graph, pin, output))
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def _from_environment():
+    path = os.environ.get(_ENV_PATH)
+    if not path:
+        return None
+    max_bytes = os.environ.get(_ENV_MAX_BYTES)
+    return ResultCache(path, int(max_bytes) if max_bytes else DEFAULT_MAX_BYTES)
+
+
+_cache = _from_environment()
+
+
+def enable(path=None, max_bytes=None, hash_files=False):
+    """Cache the fields and fields containers evaluated by the operators of
+    this process in a directory.
+
+    Parameters
+    ----------
+    path : str, optional
+        Directory of the cache. Defaults to the ``DPF_RESULT_CACHE``
+        environment variable, else to ``dpf_result_cache`` in the
+        temporary directory.
+
+    max_bytes : int, optional
+        Maximum size in bytes of the files of the cache. Defaults to the
+        ``DPF_RESULT_CACHE_MAX_BYTES`` environment variable, else to 2 GiB.
+
+    hash_files : bool, optional
+        Identify the files of the data sources by a hash of their content
+        instead of their size and modification time.
+
+    Returns
+    -------
+    cache : ResultCache
+
+    Examples
+    --------
+    >>> from ansys.dpf import core as dpf
+    >>> cache = dpf.result_cache.enable(max_bytes=10 * 1024 ** 2)
+    >>> dpf.result_cache.disable()
+
+    """
+    global _cache
+    if path is None:
+        path = os.environ.get(_ENV_PATH) or os.path.join(tempfile.gettempdir(),
+                                                        "dpf_result_cache")
+    if max_bytes is None:
+        max_bytes = os.environ.get(_ENV_MAX_BYTES)
+        max_bytes = int(max_bytes) if max_bytes else DEFAULT_MAX_BYTES
+    _cache = ResultCache(path, max_bytes, hash_files)
+    return _cache
+
+
+def disable():
+    """Stop caching the evaluated outputs. The files of the cache are kept."""
+    global _cache
+    _cache = None
+
+
+def get_cache():
+    """Returns the active result cache.
+
+    Returns
+    -------
+    cache : ResultCache
+        ``None`` when the cache is disabled.
+    """
+    return _cache
@@ -7,12 +7,50 @@ Module contains the Results and Result class that are created by the Model
 to easily access results in result files."""
 import functools
 
+import numpy as np
 
 from ansys.dpf.core import Operator
 from ansys.dpf.core import errors
+from ansys.dpf.core.common import types
+from ansys.dpf.core.fields_container import FieldsContainer, _download_batch
+from ansys.dpf.core.misc import _prefetch_iter
 from ansys.dpf.core.scoping import Scoping
 from ansys.dpf.core.custom_fields_container import ElShapeFieldsContainer, BodyFieldsContainer
 
+def _operator_doc(server, operator_name, operator=None):
+    """Return the description of an operator, fetched from the server
+    the first time and then cached on the server instance.
+
+    The description of ``operator`` is requested when it is given,
+    instead of creating an operator only to describe it."""
+    docs = server._operator_docs
+    if operator_name not in docs:
+        try:
+            if operator is None:
+                operator = Operator(operator_name, server=server)
+            docs[operator_name] = operator.__str__()
+        except errors.DPFServerException:
+            docs[operator_name] = None
+    return docs[operator_name]
+
+
+class _ResultProperty(property):
+    """Property returning a ``Result`` whose docstring is only computed on
+    access (for example by ``help``)."""
+
+    def __init__(self, fget, doc_getter):
+        self._doc_getter = doc_getter
+        super().__init__(fget)
+
+    @property
+    def __doc__(self):
+        return self._doc_getter()
+
+    @__doc__.setter
+    def __doc__(self, value):
+        pass
+
+
 class Results:
     """Organize the results from DPF into accessible methods. All the available
     results are dynamically created depending on the model's 'ResultInfo'
@@ -118,24 +156,19 @@ class Results:
         """
         if self._result_info is None:
             return
-        # dynamically add function based on input type
+        # dynamically add function based on input type, the operators are
+        # only created when the results are used or their doc is requested
         self._op_map_rev = {}
         for result_type in self._result_info:
-            try:                   
-                doc =  Operator(result_type.operator_name, server=self._model._server).__str__()
-                bound_method = self.__result__
-                method2 = functools.partial(bound_method,
-                                            result_type)
-                setattr(self.__class__, result_type.name,property(method2,  doc=doc))
-                
-                self._op_map_rev[result_type.name] = result_type.name
-            except errors.DPFServerException:
-                pass            
-            except Exception as e:
-                print(result_type.name)
-                raise e
-        
-   
+            bound_method = self.__result__
+            method2 = functools.partial(bound_method,
+                                        result_type)
+            doc = functools.partial(_operator_doc, self._model._server,
+                                    result_type.operator_name)
+            setattr(self.__class__, result_type.name, _ResultProperty(method2, doc))
+
+            self._op_map_rev[result_type.name] = result_type.name
+
     def __str__(self):
         return str(self._result_info)
     
@@ -197,26 +230,32 @@ class Result:
         self._location = None
         self._result_info = result_info
         self._specific_fc_type = None
-        from ansys.dpf.core import operators
         try:
-            #create the operator to read its documentation
-            #if the operator doesn't exist, the method will not be added                
-            doc =  Operator(self._result_info.operator_name, server=self._model._server).__str__()
-            self.__doc__=doc
-            if hasattr(operators, "result") and  hasattr(operators.result, self._result_info.name) :
-                self._operator= getattr(operators.result, self._result_info.name)(server = self._model._server)
-            else :
-                self._operator= Operator(self._result_info.operator_name,server = self._model._server)
+            #if the operator doesn't exist, the method will not be added
+            self._operator = self._new_operator()
             self._operator._add_sub_res_operators(self._result_info.sub_results)
-            self._model.__connect_op__(self._operator)
+            self.__doc__ = _operator_doc(self._model._server, self._result_info.operator_name,
+                                         self._operator)
         except errors.DPFServerException:
             pass            
         except Exception as e:
             print(self._result_info.name)
             raise e
     
+    def _new_operator(self):
+        """Create a result provider connected to the model's streams"""
+        from ansys.dpf.core import operators
+        if hasattr(operators, "result") and  hasattr(operators.result, self._result_info.name) :
+            op = getattr(operators.result, self._result_info.name)(server = self._model._server)
+        else :
+            op = Operator(self._result_info.operator_name,server = self._model._server)
+        self._model.__connect_op__(op)
+        return op
+
     def __call__(self,time_scoping=None, mesh_scoping=None):
-        op= self._operator
+        return self._connect_inputs(self._operator, time_scoping, mesh_scoping)
+
+    def _connect_inputs(self, op, time_scoping=None, mesh_scoping=None):
         if time_scoping:
             op.inputs.time_scoping(time_scoping)            
         elif self._time_scoping:
@@ -232,9 +271,19 @@ class Result:
             
         return op
     
-    def eval(self):
+    def eval(self, parallel=None):
         """Evaluate the result provider with the inputs specified before 
         and returns its result fields container
+
+        Parameters
+        ----------
+        parallel : int, optional
+            Number of chunks the time sets are split into. The chunks are
+            evaluated concurrently by the server, each with its own result
+            provider, and merged in one fields container in the order of the
+            requested time sets. Only used when time sets ids are requested
+            (for example with ``on_all_time_freqs``), time values are
+            evaluated in one request.
         
         Returns
         -------
@@ -249,15 +298,139 @@ class Result:
         >>> model = dpf.Model(examples.msup_transient)
         >>> disp = model.results.displacement
         >>> fc = disp.on_all_time_freqs.eval()
+
+        Evaluate the time sets in 4 concurrent requests
+
+        >>> fc = disp.on_all_time_freqs.eval(parallel=4)
         
         """
-        fc = self.__call__().outputs.fields_container()
+        time_scopings = None
+        if parallel is not None and parallel > 1:
+            time_scopings = self._split_time_scoping(parallel)
+        if time_scopings is None:
+            fc = self.__call__().outputs.fields_container()
+        else:
+            fc = self._eval_time_scopings(time_scopings)
         if self._specific_fc_type =="shape":
             fc = ElShapeFieldsContainer(fields_container=fc,server=fc._server)
         elif self._specific_fc_type =="body":
             fc = BodyFieldsContainer(fields_container=fc,server=fc._server)
         return fc
 
+    def _requested_time_scoping(self):
+        """Return the requested time sets ids or time values as a list, and
+        the location of the time scoping"""
+        time_scoping = self._time_scoping
+        if isinstance(time_scoping, Scoping):
+            return list(time_scoping.ids), time_scoping.location
+        elif isinstance(time_scoping, (list, tuple, np.ndarray)):
+            return list(time_scoping), None
+        elif time_scoping is None:
+            return None, None
+        return [time_scoping], None
+
+    def _time_scopings(self, values, location, bounds):
+        """Time scopings of the ``values`` between consecutive bounds"""
+        chunks = [values[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+        if location is None:
+            return chunks
+        return [Scoping(ids=chunk, location=location, server=self._model._server)
+                for chunk in chunks]
+
+    def _split_time_scoping(self, n_chunks):
+        """Split the requested time sets ids in ``n_chunks`` contiguous
+        time scopings, or return ``None`` if they cannot be split"""
+        ids, location = self._requested_time_scoping()
+        if ids is None or len(ids) < 2 or not all(isinstance(i, (int, np.integer)) for i in ids):
+            return None
+        ids = [int(i) for i in ids]
+        n_chunks = min(n_chunks, len(ids))
+        bounds = [len(ids) * i // n_chunks for i in range(n_chunks + 1)]
+        return self._time_scopings(ids, location, bounds)
+
+    def iter_time_steps(self, batch=1, prefetch=True):
+        """Iterate over the requested time sets, all of them by default,
+        evaluating ``batch`` sets at a time.
+
+        The fields of a batch are released once their data is downloaded,
+        so that only one batch is kept on the server and on the client at a
+        time. With ``prefetch``, the next batch is evaluated and downloaded
+        in a background thread while the current one is processed, and two
+        batches are then held at a time.
+
+        Parameters
+        ----------
+        batch : int, optional
+            Number of time sets evaluated at a time.
+
+        prefetch : bool, optional
+            Evaluate and download the next batch in the background.
+
+        Yields
+        ------
+        time_value : float
+            Time or frequency of the field.
+
+        label_space : dict[str,int]
+            Label space of the field, for example: ``{"time": 1}``
+
+        data : numpy.ndarray
+            Data of the field.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.msup_transient)
+        >>> disp = model.results.displacement
+        >>> for time_value, label_space, data in disp.iter_time_steps(batch=5):
+        ...     max_disp = data.max()
+
+        """
+        values, location = self._requested_time_scoping()
+        if values is None:
+            n_sets = len(self._model.metadata.time_freq_support.time_frequencies)
+            values = list(range(1, n_sets + 1))
+        bounds = list(range(0, len(values), batch)) + [len(values)]
+        time_scopings = self._time_scopings(values, location, bounds)
+        if not time_scopings:
+            return iter(())
+        # one operator evaluates all the batches, which run one after the other
+        op = self._connect_inputs(self._new_operator(), time_scoping=time_scopings[0])
+        return _prefetch_iter([functools.partial(self._eval_batch, op, time_scoping)
+                               for time_scoping in time_scopings], prefetch)
+
+    def _eval_batch(self, op, time_scoping):
+        """Evaluate the result operator on a time scoping and download its
+        fields"""
+        op.inputs.time_scoping(time_scoping)
+        fc = op.outputs.fields_container()
+        fields, label_spaces = fc.get_all_entries()
+        time_values = fc._get_time_values(label_spaces)
+        entries = list(zip(time_values, label_spaces, fields))
+        del fc, fields
+        return _download_batch(entries)
+
+    def _eval_time_scopings(self, time_scopings):
+        """Evaluate the result on each time scoping concurrently and merge
+        the fields containers"""
+        futures = []
+        for time_scoping in time_scopings:
+            op = self._connect_inputs(self._new_operator(), time_scoping=time_scoping)
+            futures.append(op.get_output_async(0, types.fields_container))
+        fields_containers = [future.result() for future in futures]
+        fc = FieldsContainer(server=self._model._server)
+        fc.labels = fields_containers[0].labels
+        for chunk_fc in fields_containers:
+            fields, label_spaces = chunk_fc.get_all_entries()
+            for label_space, field in zip(label_spaces, fields):
+                fc.add_field(label_space, field)
+        try:
+            fc.time_freq_support = fields_containers[0].time_freq_support
+        except errors.DPFServerException:
+            pass
+        return fc
+
     @property
     def on_all_time_freqs(self):
         """Sets the time scoping to all the time frequencies available in the time freq support
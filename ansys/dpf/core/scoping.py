@@ -7,14 +7,19 @@ Scoping
 
 from ansys.grpc.dpf import scoping_pb2, scoping_pb2_grpc, base_pb2
 from ansys.dpf.core.common import locations,_common_progress_bar
-from ansys.dpf.core.misc import DEFAULT_FILE_CHUNK_SIZE
+from ansys.dpf.core.misc import DEFAULT_DATA_CHUNK_SIZE
 from ansys.dpf.core import errors as dpf_errors
-from ansys.dpf.core.check_version import version_requires, server_meet_version
+from ansys.dpf.core.check_version import version_requires
+from ansys.dpf.core.session_scope import _record
+from ansys.dpf.core.buffer_pool import BufferPool
 import numpy as np
 import array
 
 
-import sys
+
+# servers before 2.1 receive at most 285714 ids, sent in a single message
+_LEGACY_IDS_CHUNK_SIZE = int(8.0e6 // 28) * 4
+
 
 class Scoping:
     """A class used to represent a Scoping which is a subset of a
@@ -63,14 +68,19 @@ class Scoping:
 
         self._server = server
         self._stub = self._connect()
+        # metadata cache of the field owning this scoping, if any
+        self._owner_cache = None
+        # digest of the ids, computed by the result cache
+        self._ids_digest = None
 
         if scoping is None:
             request = base_pb2.Empty()
             self._message = self._stub.Create(request)
         else:
             self._message = scoping
+        _record(self)
         
-        if ids:
+        if ids is not None and len(ids):
             self.ids=ids
         if location:
             self.location=location
@@ -109,6 +119,7 @@ class Scoping:
         request.location.location = loc
         request.scoping.CopyFrom(self._message)
         self._stub.Update(request)
+        self._invalidate_owner_cache()
         
     @version_requires("2.1")
     def _set_ids(self, ids):
@@ -122,25 +133,32 @@ class Scoping:
         -----
         Print a progress bar
         """
-        # must convert to a list for gRPC
+        # sent as a contiguous int32 buffer
         if isinstance(ids, range):
-            ids = np.array(list(ids), dtype=np.int32)
-        elif not isinstance(ids,(np.ndarray, np.generic)):            
-            ids= np.array(ids, dtype=np.int32)
+            ids = np.arange(ids.start, ids.stop, ids.step, dtype=np.int32)
         else:
-            ids = np.array(list(ids), dtype=np.int32)
+            ids = np.ascontiguousarray(ids, dtype=np.int32).reshape(-1)
         
         metadata=[(u"size_int", f"{len(ids)}")]
         request = scoping_pb2.UpdateIdsRequest()
         request.scoping.CopyFrom(self._message)
-        if server_meet_version("2.1", self._server):
-            self._stub.UpdateIds(_data_chunk_yielder(request, ids), metadata=metadata)
+        if self._server.has_capability("streaming_ids"):
+            self._stub.UpdateIds(_data_chunk_yielder(request, ids, self._server.chunk_size), metadata=metadata)
         else:
-            self._stub.UpdateIds(_data_chunk_yielder(request, ids, 8.0e6), metadata=metadata)
+            self._stub.UpdateIds(_data_chunk_yielder(request, ids, _LEGACY_IDS_CHUNK_SIZE), metadata=metadata)
+        self._invalidate_owner_cache()
         
 
-    def _get_ids(self, np_array=False):
+    def _get_ids(self, np_array=False, out=None):
         """
+        Parameters
+        ----------
+        np_array : bool, optional
+            Return a numpy array instead of a list.
+
+        out : numpy.ndarray or BufferPool, optional
+            Buffer receiving the ids when ``np_array`` is ``True``.
+
         Returns
         -------
         ids : list[int], numpy.array (if np_array==True)
@@ -150,20 +168,63 @@ class Scoping:
         -----
         Print a progress bar
         """
-        if server_meet_version("2.1", self._server):  
+        if self._server.has_capability("streaming_ids"):
             service = self._stub.List(self._message)
             dtype = np.int32
-            return _data_get_chunk_(dtype, service,np_array)
+            return _data_get_chunk_(dtype, service,np_array, out)
         else:
-            out = []
+            out_list = []
                     
             service = self._stub.List(self._message)
             for chunk in service:
-                out.extend(chunk.ids.rep_int)
+                out_list.extend(chunk.ids.rep_int)
             if np_array:
-                return np.array(out, dtype = np.int32)
+                arr = _get_receive_buffer(len(out_list), np.int32, out)
+                arr[:] = out_list
+                return arr
             else:
-                return out
+                return out_list
+
+    def get_ids(self, out=None, read_only=False):
+        """Get the ids of the scoping in a numpy array.
+
+        The ids are written chunk by chunk in the final array, which can be
+        provided by the caller.
+
+        Parameters
+        ----------
+        out : numpy.ndarray or BufferPool, optional
+            Buffer in which the ids are received: either a C-contiguous
+            ``numpy.int32`` array with at least ``len(scoping)`` items,
+            or a :class:`ansys.dpf.core.BufferPool` providing one.
+            The returned array is a view on its first items.
+
+        read_only : bool, optional
+            Return a read only view on the received ids.
+
+        Returns
+        -------
+        ids : numpy.ndarray
+
+        Notes
+        -----
+        Print a progress bar
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> import numpy as np
+        >>> scoping = dpf.Scoping(ids=[1, 2, 3])
+        >>> buffer = np.empty(10, dtype=np.int32)
+        >>> scoping.get_ids(out=buffer)
+        array([1, 2, 3], dtype=int32)
+
+        """
+        ids = self._get_ids(np_array=True, out=out)
+        if read_only:
+            ids = ids.view()
+            ids.flags.writeable = False
+        return ids
 
     def set_id(self, index, scopingid):
         """Set the id of an index of the scoping
@@ -179,6 +240,13 @@ class Scoping:
         request.index_id.index = index
         request.scoping.CopyFrom(self._message)
         self._stub.Update(request)
+        self._invalidate_owner_cache()
+
+    def _invalidate_owner_cache(self):
+        """Clear the metadata cache of the field owning this scoping"""
+        self._ids_digest = None
+        if self._owner_cache is not None:
+            self._owner_cache.clear()
 
     def _get_id(self, index):
         """Returns on which index is located an id in the scoping
@@ -276,7 +344,7 @@ class Scoping:
 
     def __del__(self):
         try:
-            self._stub.Delete(self._message)
+            self._server.release_queue.push(self._stub.Delete, self._message)
         except:
             pass
         
@@ -328,29 +396,161 @@ class Scoping:
         return scop
 
 
-def _data_chunk_yielder(request, data, chunk_size=DEFAULT_FILE_CHUNK_SIZE): 
+
+class ScopingIndex:
+    """Mapping between the ids of a scoping and their indices, computed
+    on the client with numpy.
+
+    It is built once for a reference scoping (typically the nodes or
+    elements scoping of a mesh) and can then map any number of scopings
+    (typically the scopings of fields) on it. The indices of the ids are
+    found in a dense lookup table when the ids are compact, or with a
+    binary search in the sorted ids otherwise.
+
+    Parameters
+    ----------
+    scoping : Scoping, numpy.ndarray, list of int
+        Reference scoping or ids.
+
+    Examples
+    --------
+    >>> import ansys.dpf.core as dpf
+    >>> index = dpf.ScopingIndex([10, 20, 30, 40])
+    >>> indices, mask = index.map([30, 50, 10])
+    >>> indices
+    array([2, 0])
+    >>> mask
+    array([ True, False,  True])
+
+    """
+
+    # a dense lookup table is used when it holds less than this ratio of
+    # unused values per id
+    _max_dense_ratio = 4
+
+    def __init__(self, scoping):
+        if isinstance(scoping, Scoping):
+            ids = scoping.get_ids()
+        else:
+            ids = np.asarray(scoping)
+        self._ids = np.asarray(ids, dtype=np.int64).reshape(-1)
+        self._table = None
+        self._sorter = None
+        self._sorted_ids = None
+        self._min_id = 0
+        if self._ids.size == 0:
+            return
+        self._min_id = int(self._ids.min())
+        span = int(self._ids.max()) - self._min_id + 1
+        if span <= self._max_dense_ratio * self._ids.size + 1024:
+            self._table = np.full(span, -1, dtype=np.int64)
+            # for duplicated ids, the last index is kept
+            self._table[self._ids - self._min_id] = np.arange(self._ids.size)
+        else:
+            self._sorter = np.argsort(self._ids, kind="stable")
+            self._sorted_ids = self._ids[self._sorter]
+
+    @property
+    def ids(self):
+        """Ids of the reference scoping.
+
+        Returns
+        -------
+        ids : numpy.ndarray
+        """
+        return self._ids
+
+    def __len__(self):
+        return self._ids.size
+
+    def indices(self, ids):
+        """Index of each id in the reference scoping.
+
+        Parameters
+        ----------
+        ids : Scoping, numpy.ndarray, list of int
+
+        Returns
+        -------
+        indices : numpy.ndarray
+            Index of each id, -1 for the ids which are not in the reference
+            scoping.
+        """
+        if isinstance(ids, Scoping):
+            ids = ids.get_ids()
+        ids = np.asarray(ids, dtype=np.int64).reshape(-1)
+        indices = np.full(ids.size, -1, dtype=np.int64)
+        if self._ids.size == 0:
+            return indices
+        if self._table is not None:
+            positions = ids - self._min_id
+            in_table = (positions >= 0) & (positions < self._table.size)
+            indices[in_table] = self._table[positions[in_table]]
+        else:
+            positions = np.searchsorted(self._sorted_ids, ids, side="right") - 1
+            found = positions >= 0
+            found[found] = self._sorted_ids[positions[found]] == ids[found]
+            indices[found] = self._sorter[positions[found]]
+        return indices
+
+    def map(self, ids):
+        """Return the indices to map the given ids to the reference scoping.
+
+        Parameters
+        ----------
+        ids : Scoping, numpy.ndarray, list of int
+
+        Returns
+        -------
+        indices : numpy.ndarray
+            Indices in the reference scoping of the ids which are in it.
+
+        mask : numpy.ndarray
+            Boolean array set to ``True`` for the ids which are in the
+            reference scoping.
+        """
+        indices = self.indices(ids)
+        mask = indices >= 0
+        return indices[mask], mask
+
+def _data_chunk_yielder(request, data, chunk_size=DEFAULT_DATA_CHUNK_SIZE):
+    """Yield the requests streaming an array in chunks.
+
+    Parameters
+    ----------
+    request : protobuf message
+        Request with an ``array`` bytes field, filled and yielded for
+        each chunk.
+
+    data : numpy.ndarray
+        Array to send. It is sent without copy if it is contiguous.
+
+    chunk_size : int, optional
+        Maximum size in bytes of each chunk.
+    """
+    data = np.ascontiguousarray(data)
     length = data.size
     need_progress_bar = length>1e6
     if need_progress_bar:
         bar =_common_progress_bar("Sending data...", unit=data.dtype.name, tot_size =length)
         bar.start()
-    sent_length =0
     if length == 0:
         yield request
         return
-    unitary_size =int(chunk_size//sys.getsizeof(data[0]))
-    if length-sent_length<unitary_size:
-        unitary_size= length-sent_length
-    while sent_length<length:
-        currentcopy = data.take(range(sent_length,sent_length+unitary_size))
-        request.array= currentcopy.tobytes()
-        sent_length=sent_length+unitary_size
-        if length-sent_length<unitary_size:
-            unitary_size= length-sent_length
+    itemsize = data.itemsize
+    # keep whole items in each chunk
+    chunk_size = max(int(chunk_size) // itemsize, 1) * itemsize
+    buffer = memoryview(data.reshape(-1)).cast('B')
+    nbytes = len(buffer)
+    sent = 0
+    while sent<nbytes:
+        # protobuf only accepts bytes: the slice is copied once here
+        request.array = buffer[sent:sent+chunk_size].tobytes()
+        sent += chunk_size
         yield request
         try:
             if need_progress_bar:
-                bar.update(sent_length)
+                bar.update(min(sent, nbytes)//itemsize)
         except:
             pass
     try:
@@ -358,11 +558,28 @@ def _data_chunk_yielder(request, data, chunk_size=DEFAULT_FILE_CHUNK_SIZE):
             bar.finish()
     except:
         pass
-    
-    
 
 
-def _data_get_chunk_(dtype, service, np_array=True):
+def _data_get_chunk_(dtype, service, np_array=True, out=None):
+    """Receive the chunks of a streamed array.
+
+    Parameters
+    ----------
+    dtype : numpy.dtype
+        Type of the items sent by the server.
+
+    service : grpc stream
+        Response of a streaming call sending its total size in bytes in
+        the ``size_tot`` initial metadata.
+
+    np_array : bool, optional
+        Return a numpy array, else a list.
+
+    out : numpy.ndarray or BufferPool, optional
+        Buffer in which the chunks are directly written. It must be a
+        C-contiguous array of type ``dtype`` with enough items to hold the
+        whole data, a view on its first items is returned.
+    """
     tupleMetaData = service.initial_metadata()
     
     need_progress_bar = False
@@ -374,29 +591,28 @@ def _data_get_chunk_(dtype, service, np_array=True):
     itemsize = np.dtype(dtype).itemsize
     need_progress_bar = size//itemsize>1e6
     if need_progress_bar:
-        bar =_common_progress_bar("Receiving data...", unit=dtype.__name__+"s", tot_size = size//itemsize)
+        bar =_common_progress_bar("Receiving data...", unit=np.dtype(dtype).name+"s", tot_size = size//itemsize)
         bar.start()
         
         
     if np_array:
-        arr = np.empty(size//itemsize, dtype)
+        arr = _get_receive_buffer(size//itemsize, dtype, out)
+        # write the chunks' bytes in place, without intermediate arrays
+        buffer = memoryview(arr).cast('B')
         i = 0
         for chunk in service:
-            curr_size = len(chunk.array)//itemsize
-            arr[i:i + curr_size] = np.frombuffer(chunk.array, dtype)
+            curr_size = len(chunk.array)
+            buffer[i:i + curr_size] = chunk.array
             i += curr_size
             try:
                 if need_progress_bar:
-                    bar.update(i)
+                    bar.update(i//itemsize)
             except:
                 pass
 
     else:
         arr=[]
-        if dtype==np.float:
-            dtype = 'd'
-        else:
-            dtype='i'
+        dtype = np.dtype(dtype).char
         for chunk in service:
             arr.extend(array.array(dtype,chunk.array))
             try:
@@ -409,4 +625,22 @@ def _data_get_chunk_(dtype, service, np_array=True):
             bar.finish()
     except:
         pass
-    return arr
\ No newline at end of file
+    return arr
+
+
+def _get_receive_buffer(size, dtype, out=None):
+    """Return a contiguous array of ``size`` items receiving streamed data,
+    either allocated, taken from a BufferPool or checked from ``out``."""
+    if out is None:
+        return np.empty(size, dtype)
+    if isinstance(out, BufferPool):
+        return out.get(size, dtype)
+    if not isinstance(out, np.ndarray):
+        raise TypeError("out must be a numpy.ndarray or a BufferPool")
+    if out.dtype != np.dtype(dtype):
+        raise ValueError(f"out must be of type {np.dtype(dtype).name}, not {out.dtype.name}")
+    if not out.flags.c_contiguous or not out.flags.writeable:
+        raise ValueError("out must be a writeable C-contiguous array")
+    if out.size < size:
+        raise ValueError(f"out has {out.size} items while {size} are received")
+    return out.reshape(-1)[:size]
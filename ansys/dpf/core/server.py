@@ -8,18 +8,26 @@ import io
 import platform
 import logging
 import time
+import collections
 import os
 import socket
 import subprocess
+import asyncio
 import grpc
+import grpc.aio
 import psutil
 import weakref
 import atexit
 import copy
 
+import numpy as np
+
 from ansys import dpf
-from ansys.dpf.core.misc import find_ansys, is_ubuntu
+from ansys.dpf.core.misc import find_ansys, is_ubuntu, DEFAULT_DATA_CHUNK_SIZE
 from ansys.dpf.core import errors
+from ansys.dpf.core.common import _float_or_double
+from ansys.dpf.core.channel import ChannelOptions, _open_channel
+from ansys.dpf.core.release_queue import ReleaseQueue, flush
 
 from ansys.dpf.core._version import __ansys_version__
 
@@ -41,6 +49,15 @@ def shutdown_global_server():
         
 atexit.register(shutdown_global_server)
 
+def _flush_session_servers():
+    try:
+        flush(timeout=1)
+    except:
+        pass
+
+# registered last to run first, before the global server is shut down
+atexit.register(_flush_session_servers)
+
 def has_local_server():
     """Returns True when a local DPF gRPC server has been created"""
     return dpf.core.SERVER is not None
@@ -102,8 +119,35 @@ def shutdown_all_session_servers():
             pass
 
 
+def _check_ansys_path(ansys_path=None):
+    """Return the Ansys path used to launch servers, the latest install
+    of Ansys by default, and verify that it supports DPF."""
+    if ansys_path is None:
+        ansys_path = os.environ.get('AWP_ROOT'+__ansys_version__, find_ansys())
+    if ansys_path is None:
+        raise ValueError('Unable to automatically locate the Ansys path.  '
+                         'Manually enter one when starting the server or set it '
+                         'as the environment variable "ANSYS_PATH"')
+
+    # verify path exists
+    if not os.path.isdir(ansys_path):
+        raise NotADirectoryError(f'Invalid Ansys path "{ansys_path}"')
+
+    # parse the version to an int and check for supported
+    try:
+        ver = int(ansys_path[-3:])
+        if ver < 211:
+            raise errors.InvalidANSYSVersionError(f'Ansys v{ver} does not support DPF')
+        if ver == 211 and is_ubuntu():
+            raise OSError('DPF on v211 does not support Ubuntu')
+    except ValueError:
+        pass
+    return ansys_path
+
+
 def start_local_server(ip=LOCALHOST, port=DPF_DEFAULT_PORT,
-                       ansys_path=None, as_global=True, load_operators=True):
+                       ansys_path=None, as_global=True, load_operators=True,
+                       channel_options=None):
     """Starts a new local DPF server at a given port and ip.
     Requires Windows and ANSYS v211 or newer be installed.
     If as_global is set to True (default) then the server is stored in the module
@@ -130,31 +174,15 @@ def start_local_server(ip=LOCALHOST, port=DPF_DEFAULT_PORT,
     load_operators : bool, optional
         Automatically load the math operators
 
+    channel_options : ChannelOptions, optional
+        Options of the gRPC channels opened to the server. Defaults to the
+        options set with environment variables.
+
     Returns
     -------
     server : server.DpfServer
     """
-    if ansys_path is None:
-        ansys_path = os.environ.get('AWP_ROOT'+__ansys_version__, find_ansys())
-    if ansys_path is None:
-        raise ValueError('Unable to automatically locate the Ansys path.  '
-                         'Manually enter one when starting the server or set it '
-                         'as the environment variable "ANSYS_PATH"')
-
-    # verify path exists
-    if not os.path.isdir(ansys_path):
-        raise NotADirectoryError(f'Invalid Ansys path "{ansys_path}"')
-
-    # parse the version to an int and check for supported
-    try:
-        ver = int(ansys_path[-3:])
-        if ver < 211:
-            raise errors.InvalidANSYSVersionError(f'Ansys v{ver} does not support DPF')
-        if ver == 211 and is_ubuntu():
-            raise OSError('DPF on v211 does not support Ubuntu')
-    except ValueError:
-        pass
-    
+    ansys_path = _check_ansys_path(ansys_path)
 
     # avoid using any ports in use from existing servers    
     used_ports=[]
@@ -174,7 +202,8 @@ def start_local_server(ip=LOCALHOST, port=DPF_DEFAULT_PORT,
     n_attempts = 10
     for _ in range(n_attempts):
         try:
-            server = DpfServer(ansys_path, ip, port,as_global= as_global, load_operators = load_operators)
+            server = DpfServer(ansys_path, ip, port,as_global= as_global, load_operators = load_operators,
+                               channel_options=channel_options)
             break
         except errors.InvalidPortError:  # allow socket in use errors
             port += 1
@@ -188,7 +217,8 @@ def start_local_server(ip=LOCALHOST, port=DPF_DEFAULT_PORT,
     return server
 
 
-def connect_to_server(ip=LOCALHOST, port=DPF_DEFAULT_PORT, as_global=True, timeout=5):
+def connect_to_server(ip=LOCALHOST, port=DPF_DEFAULT_PORT, as_global=True, timeout=5,
+                      channel_options=None):
     """Connect to an existing dpf server.
 
     Set this as the global default channel that will be used for the
@@ -210,6 +240,10 @@ def connect_to_server(ip=LOCALHOST, port=DPF_DEFAULT_PORT, as_global=True, timeo
     timeout : float
         Maximum timeout to connect to the DPF server.
 
+    channel_options : ChannelOptions, optional
+        Options of the gRPC channels opened to the server. Defaults to the
+        options set with environment variables.
+
     Examples
     --------
     
@@ -229,7 +263,8 @@ def connect_to_server(ip=LOCALHOST, port=DPF_DEFAULT_PORT, as_global=True, timeo
     >>> #unspecified_server = dpf.connect_to_server(as_global=False)
     
     """
-    server = DpfServer(ip=ip, port=port, as_global=as_global, launch_server=False)
+    server = DpfServer(ip=ip, port=port, as_global=as_global, launch_server=False,
+                       channel_options=channel_options)
     dpf.core._server_instances.append(weakref.ref(server))
     return server
 
@@ -265,10 +300,15 @@ class DpfServer:
         
    launch_server : bool, optional
         Launch the server on windows
+
+    channel_options : ChannelOptions, optional
+        Options of the gRPC channels opened to the server. Defaults to the
+        options set with environment variables.
     """
 
     def __init__(self, ansys_path="", ip=LOCALHOST, port=DPF_DEFAULT_PORT,
-                 timeout=10, as_global=True, load_operators=True, launch_server=True):
+                 timeout=10, as_global=True, load_operators=True, launch_server=True,
+                 channel_options=None):
         """Start the dpf server server"""
         # check valid ip and port
         check_valid_ip(ip)
@@ -280,7 +320,10 @@ class DpfServer:
         elif launch_server:
             launch_dpf(ansys_path, ip, port)        
 
-        self.channel = grpc.insecure_channel('%s:%d' % (ip, port))
+        if channel_options is None:
+            channel_options = ChannelOptions()
+        self._channel_options = channel_options
+        self.channel = _open_channel('%s:%d' % (ip, port), channel_options)
         
         if launch_server is False:
             state = grpc.channel_ready_future(self.channel)
@@ -306,17 +349,66 @@ class DpfServer:
         self._input_ip = ip
         self._input_port = port
         self._own_process = launch_server
+        self._chunk_size = DEFAULT_DATA_CHUNK_SIZE
+        if channel_options.max_send_message_length is not None:
+            # keep room for the other fields of the streamed requests
+            self._chunk_size = max(min(self._chunk_size,
+                                       channel_options.max_send_message_length - 1024), 1024)
+        self._float_dtype = np.dtype(np.float64)
+        # deletions of the objects whose wrappers are garbage collected
+        self._release_queue = ReleaseQueue()
+        # server information and capabilities, requested once
+        self._base_service_instance = None
+        self._info = None
+        self._info_requests = 0
+        self._capabilities = None
+        self._version_checks = {}
+        # operators descriptions by operator name
+        self._operator_docs = {}
+        # workflows of the lazy expressions by expression shape
+        self._compiled_expressions = collections.OrderedDict()
+        # grpc.aio channel and the event loop it is bound to
+        self._aio_channel_loop = None
+        self._aio_channel_instance = None
         
     @property
     def _base_service(self):
-        if not hasattr(self,"__base_service"):            
+        if self._base_service_instance is None:
             from ansys.dpf.core.core import BaseService
-            self.__base_service = BaseService(self, timeout=1)
-        return self.__base_service
+            self._base_service_instance = BaseService(self, timeout=1)
+        return self._base_service_instance
     
+    def _aio_channel(self):
+        """Return a ``grpc.aio`` channel to the server bound to the running
+        event loop. It must be called from a coroutine."""
+        loop = asyncio.get_running_loop()
+        if self._aio_channel_loop is not loop:
+            self._close_aio_channel()
+            self._aio_channel_instance = grpc.aio.insecure_channel(
+                '%s:%d' % (self._input_ip, self._input_port),
+                options=self._channel_options.grpc_options(),
+                compression=self._channel_options.compression)
+            self._aio_channel_loop = loop
+        return self._aio_channel_instance
+
+    def _close_aio_channel(self):
+        """Close the ``grpc.aio`` channel bound to a previous event loop"""
+        channel, loop = self._aio_channel_instance, self._aio_channel_loop
+        self._aio_channel_instance = None
+        self._aio_channel_loop = None
+        if channel is None:
+            return
+        if not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(channel.close(), loop)
+        # else the channel can't be awaited anymore: its finalizer closes it
+        # when this last reference is dropped
+
     @property
     def info(self):
         """Recover server information
+
+           The information is requested from the server on first access
+           only, and then kept for the lifetime of this object.
            
            Returns
            -------
@@ -324,7 +416,46 @@ class DpfServer:
                dictionary with "server_ip", "server_port", "server_process_id"
                "server_version" keys
         """
-        return self._base_service.server_info
+        if self._info is None:
+            self._info_requests += 1
+            self._info = self._base_service.server_info
+        return dict(self._info)
+
+    @property
+    def release_queue(self):
+        """Queue of the server side objects whose python wrappers were
+        garbage collected, deleted in batches in the background.
+
+        Returns
+        -------
+        release_queue : ReleaseQueue
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> server = dpf.start_local_server(as_global=False)
+        >>> field = dpf.Field(nentities=10, server=server)
+        >>> del field
+        >>> released = server.release_queue.flush()
+        >>> server.release_queue.pending
+        0
+
+        """
+        return self._release_queue
+
+    @property
+    def info_requests(self):
+        """Number of server information requests sent to the server by this
+        object.
+
+        It stays at ``1`` after the connection: the version checks and the
+        capabilities are then resolved on the client.
+
+        Returns
+        -------
+        info_requests : int
+        """
+        return self._info_requests
     
     @property
     def ip(self):
@@ -335,7 +466,7 @@ class DpfServer:
         ip : str
         """
         try:
-            return self._base_service.server_info["server_ip"]
+            return self.info["server_ip"]
         except:
             return ""
     
@@ -348,7 +479,7 @@ class DpfServer:
         port : int
         """
         try:
-            return self._base_service.server_info["server_port"]
+            return self.info["server_port"]
         except:
             return 0
     
@@ -360,15 +491,153 @@ class DpfServer:
         -------
         version : str
         """
-        return self._base_service.server_info["server_version"]
+        return self.info["server_version"]
+
+    @property
+    def capabilities(self):
+        """Features supported by the server, by name.
+
+        They are deduced from the server version once, without other
+        requests to the server. See
+        :data:`ansys.dpf.core.check_version.CAPABILITIES` for the list of
+        features.
+
+        Returns
+        -------
+        capabilities : dict[str, bool]
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> server = dpf.start_local_server(as_global=False)
+        >>> server.capabilities["streaming_ids"]
+        True
+
+        """
+        if self._capabilities is None:
+            from ansys.dpf.core.check_version import CAPABILITIES
+            self._capabilities = {name: self.meet_version(required_version)
+                                  for name, required_version in CAPABILITIES.items()}
+        return dict(self._capabilities)
+
+    def has_capability(self, name):
+        """Whether the server supports a feature.
+
+        Parameters
+        ----------
+        name : str
+            Name of the feature, a key of
+            :data:`ansys.dpf.core.check_version.CAPABILITIES`.
+
+        Returns
+        -------
+        bool
+        """
+        if self._capabilities is None:
+            self.capabilities
+        try:
+            return self._capabilities[name]
+        except KeyError:
+            raise ValueError(f'Unknown capability "{name}", expected one of '
+                             f'{list(self._capabilities)}') from None
+
+    def meet_version(self, required_version):
+        """Check if the server version is at least a required version.
+
+        The result is kept for the next checks of the same version.
+
+        Parameters
+        ----------
+        required_version : str
+            For example ``"2.1"``.
+
+        Returns
+        -------
+        bool
+            ``True`` if the server version meets the requirement.
+        """
+        meets = self._version_checks.get(required_version)
+        if meets is None:
+            from ansys.dpf.core.check_version import meets_version, version_tuple
+            meets = meets_version(self.version, version_tuple(required_version))
+            self._version_checks[required_version] = meets
+        return meets
+
+    @property
+    def channel_options(self):
+        """Options of the gRPC channels opened to the server.
+
+        Returns
+        -------
+        channel_options : ChannelOptions
+        """
+        return self._channel_options
+
+    @property
+    def chunk_size(self):
+        """Maximum size in bytes of the chunks used to stream arrays
+        (field data, scoping ids) to this server.
+
+        Larger chunks reduce the number of messages sent for big arrays
+        but must stay below the maximum message size accepted by the server.
+
+        Returns
+        -------
+        chunk_size : int
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> server = dpf.start_local_server(as_global=False)
+        >>> server.chunk_size = 4 * 1024 * 1024
+
+        """
+        return self._chunk_size
+
+    @chunk_size.setter
+    def chunk_size(self, value):
+        value = int(value)
+        if value <= 0:
+            raise ValueError("chunk_size must be a positive number of bytes")
+        self._chunk_size = value
+
+    @property
+    def float_dtype(self):
+        """Precision in which the data of the fields is received from this
+        server by default: ``numpy.float64`` or ``numpy.float32``.
+
+        With ``numpy.float32``, the server converts the data before sending
+        it, which halves the volume transferred and the memory used by the
+        client. A precision set on a :class:`FieldsContainer` or requested
+        with :func:`Field.get_data` takes precedence.
+
+        Returns
+        -------
+        float_dtype : numpy.dtype
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> import numpy as np
+        >>> server = dpf.start_local_server(as_global=False)
+        >>> server.float_dtype = np.float32
+
+        """
+        return self._float_dtype
+
+    @float_dtype.setter
+    def float_dtype(self, value):
+        _float_or_double(value)
+        self._float_dtype = np.dtype(value)
 
     def __str__(self): 
         return f'DPF Server: {self.info}'
 
     def shutdown(self):
         if self._own_process and self.live and self._base_service:
+            self._release_queue.clear()
             self._base_service._prepare_shutdown()
-            p = psutil.Process(self._base_service.server_info["server_process_id"])
+            p = psutil.Process(self.info["server_process_id"])
             p.kill()
             time.sleep(0.1)
             self.live = False
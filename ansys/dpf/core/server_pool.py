@@ -0,0 +1,313 @@
+"""
+ServerPool
+==========
+Launch several local DPF servers and distribute work between them.
+"""
+import contextlib
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+import grpc
+
+from ansys import dpf
+from ansys.dpf.core import errors
+from ansys.dpf.core.server import (DpfServer, LOCALHOST, DPF_DEFAULT_PORT,
+                                   port_in_use, _check_ansys_path)
+
+
+class ServerPool:
+    """Pool of DPF servers handed out by least outstanding requests.
+
+    The servers are launched in parallel on free ports and registered like
+    the servers started with :func:`start_local_server`, so that
+    ``shutdown_all_session_servers`` also shuts them down. None of them is
+    set as the global server: the objects must be created with the
+    ``server`` argument.
+
+    Parameters
+    ----------
+    n_servers : int, optional
+        Number of local servers to launch.
+
+    ip : str, optional
+        IP address of the local servers.
+
+    port : int, optional
+        First port tried for the servers.
+
+    ansys_path : str, optional
+        Root path containing ansys.  For example ``/ansys_inc/v212/``.
+        Defaults to the latest install of ANSYS.
+
+    load_operators : bool, optional
+        Automatically load the math operators.
+
+    channel_options : ChannelOptions, optional
+        Options of the gRPC channels opened to the launched servers.
+
+    servers : list[DpfServer], optional
+        Existing servers (for example connected to remote machines) used
+        instead of launching local ones. They are not shut down by the pool.
+
+    Examples
+    --------
+    Read the displacement of several result files with 4 servers
+
+    >>> from ansys.dpf import core as dpf
+    >>> from ansys.dpf.core import examples
+    >>> def max_disp(path, server):
+    ...     model = dpf.Model(path, server=server)
+    ...     disp = model.results.displacement().outputs.fields_container()
+    ...     return disp[0].data.max()
+    >>> with dpf.ServerPool(4) as pool:
+    ...     maxima = pool.map(max_disp, [examples.static_rst, examples.simple_bar])
+
+    """
+
+    def __init__(self, n_servers=None, ip=LOCALHOST, port=DPF_DEFAULT_PORT,
+                 ansys_path=None, load_operators=True, channel_options=None, servers=None):
+        self._lock = threading.Condition()
+        if servers is not None:
+            self._servers = list(servers)
+            self._own_servers = False
+        else:
+            if n_servers is None or n_servers < 1:
+                raise ValueError("n_servers must be a positive number of servers")
+            self._servers = self._launch(n_servers, ip, port, _check_ansys_path(ansys_path),
+                                         load_operators, channel_options)
+            self._own_servers = True
+        self._outstanding = [0] * len(self._servers)
+        self._alive = [True] * len(self._servers)
+
+    def _launch(self, n_servers, ip, port, ansys_path, load_operators, channel_options):
+        """Launch the servers in parallel on distinct free ports"""
+        used_ports = set()
+        for srv in dpf.core._server_instances:
+            if srv():
+                used_ports.add(srv()._input_port)
+        port_lock = threading.Lock()
+        next_port = [port]
+
+        def free_port():
+            with port_lock:
+                candidate = next_port[0]
+                while candidate in used_ports or port_in_use(candidate, ip):
+                    candidate += 1
+                used_ports.add(candidate)
+                next_port[0] = candidate + 1
+                return candidate
+
+        def launch(_):
+            n_attempts = 10
+            for _ in range(n_attempts):
+                try:
+                    return DpfServer(ansys_path, ip, free_port(), as_global=False,
+                                     load_operators=load_operators,
+                                     channel_options=channel_options)
+                except errors.InvalidPortError:  # allow socket in use errors
+                    pass
+            raise OSError(f'Unable to launch a server after {n_attempts} attempts.')
+
+        with ThreadPoolExecutor(n_servers) as executor:
+            futures = [executor.submit(launch, i) for i in range(n_servers)]
+        servers = []
+        failures = []
+        for future in futures:
+            try:
+                servers.append(future.result())
+            except Exception as e:
+                failures.append(e)
+        for server in servers:
+            dpf.core._server_instances.append(weakref.ref(server))
+        if failures:
+            for server in servers:
+                server.shutdown()
+            raise failures[0]
+        return servers
+
+    @property
+    def servers(self):
+        """Servers of the pool.
+
+        Returns
+        -------
+        servers : list[DpfServer]
+        """
+        return list(self._servers)
+
+    @property
+    def alive_servers(self):
+        """Servers of the pool not found dead yet.
+
+        Returns
+        -------
+        servers : list[DpfServer]
+        """
+        with self._lock:
+            return [server for server, alive in zip(self._servers, self._alive) if alive]
+
+    def check_liveness(self, timeout=1.0):
+        """Check that the servers still answer and stop handing out the
+        ones which do not.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum time to wait for each server, in seconds.
+
+        Returns
+        -------
+        n_alive : int
+            Number of servers alive.
+        """
+        for index in range(len(self._servers)):
+            self._check_server(index, timeout)
+        return len(self.alive_servers)
+
+    def _check_server(self, index, timeout=1.0):
+        server = self._servers[index]
+        alive = server.live
+        if alive:
+            try:
+                grpc.channel_ready_future(server.channel).result(timeout=timeout)
+            except grpc.FutureTimeoutError:
+                alive = False
+        with self._lock:
+            self._alive[index] = alive
+            self._lock.notify_all()
+        return alive
+
+    def acquire(self):
+        """Return the alive server with the least outstanding requests.
+
+        The server must be given back with :func:`ServerPool.release` once
+        the request is done, or obtained with :func:`ServerPool.server`.
+
+        Returns
+        -------
+        server : DpfServer
+        """
+        return self._servers[self._acquire_index()]
+
+    def _acquire_index(self):
+        with self._lock:
+            candidates = [i for i, alive in enumerate(self._alive) if alive]
+            if not candidates:
+                raise errors.DPFServerException("No server of the pool is alive.")
+            index = min(candidates, key=lambda i: self._outstanding[i])
+            self._outstanding[index] += 1
+            return index
+
+    def release(self, server):
+        """Give back a server obtained with :func:`ServerPool.acquire`.
+
+        Parameters
+        ----------
+        server : DpfServer
+        """
+        self._release_index(self._index(server))
+
+    def _release_index(self, index):
+        with self._lock:
+            self._outstanding[index] -= 1
+            self._lock.notify_all()
+
+    def _index(self, server):
+        for index, pool_server in enumerate(self._servers):
+            if pool_server is server:
+                return index
+        raise ValueError("The server is not part of the pool.")
+
+    @contextlib.contextmanager
+    def server(self):
+        """Context manager handing out the server with the least
+        outstanding requests.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> pool = dpf.ServerPool(2)
+        >>> with pool.server() as server:
+        ...     field = dpf.Field(server=server)
+
+        """
+        index = self._acquire_index()
+        try:
+            yield self._servers[index]
+        finally:
+            self._release_index(index)
+
+    def outstanding_requests(self):
+        """Number of requests in progress on each server.
+
+        Returns
+        -------
+        counts : list[int]
+        """
+        with self._lock:
+            return list(self._outstanding)
+
+    def map(self, fn, items, max_workers=None):
+        """Call ``fn(item, server)`` for each item, concurrently, each call
+        receiving the least busy server of the pool.
+
+        When a call fails because its server died, the item is retried on
+        another server.
+
+        Parameters
+        ----------
+        fn : callable
+            Function called with an item and a server.
+
+        items : iterable
+
+        max_workers : int, optional
+            Maximum number of concurrent calls. Defaults to the number of
+            servers.
+
+        Returns
+        -------
+        results : list
+            Results of the calls, in the order of the items.
+        """
+        if max_workers is None:
+            max_workers = max(len(self._servers), 1)
+
+        def task(item):
+            while True:
+                index = self._acquire_index()
+                try:
+                    return fn(item, self._servers[index])
+                except Exception:
+                    if self._check_server(index):
+                        raise
+                finally:
+                    self._release_index(index)
+
+        with ThreadPoolExecutor(max_workers) as executor:
+            return list(executor.map(task, items))
+
+    def shutdown(self):
+        """Shut down the servers launched by the pool."""
+        if not self._own_servers:
+            return
+        for server in self._servers:
+            try:
+                server.shutdown()
+            except Exception:
+                pass
+        with self._lock:
+            self._alive = [False] * len(self._servers)
+
+    def __len__(self):
+        return len(self._servers)
+
+    def __iter__(self):
+        return iter(self.servers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
@@ -0,0 +1,197 @@
+"""
+Session
+=======
+Scope releasing all the server side objects created in it.
+"""
+import contextlib
+import threading
+import weakref
+
+# sessions entered by each thread, innermost last
+_local = threading.local()
+
+
+def _active_sessions():
+    sessions = getattr(_local, "sessions", None)
+    if sessions is None:
+        sessions = _local.sessions = []
+    return sessions
+
+
+def _record(entity, message_attribute="_message"):
+    """Record an entity in the innermost session of its server entered by
+    the current thread, if any. Called by the constructors of the
+    entities with the name of the attribute holding their message."""
+    sessions = getattr(_local, "sessions", None)
+    if not sessions:
+        return
+    for session in reversed(sessions):
+        if session.server is entity._server:
+            session._add(entity, message_attribute)
+            return
+
+
+@contextlib.contextmanager
+def _unrecorded():
+    """Scope in which the sessions entered by the current thread don't
+    record the entities created, for the entities cached across the
+    sessions."""
+    sessions = _active_sessions()
+    _local.sessions = []
+    try:
+        yield
+    finally:
+        _local.sessions = sessions
+
+
+class Session:
+    """Scope recording the fields, scopings, operators, collections,
+    meshed regions, workflows, data sources, time freq supports and field
+    definitions created on a server, and releasing them all at once on
+    exit.
+
+    The objects of the server are released even if their python wrappers
+    are still referenced, for example by reference cycles, so that the
+    memory used by the server does not grow across the sessions. The
+    wrappers released are unusable after the session, the ones to use
+    afterwards must be kept with :func:`Session.keep`.
+
+    Only the entities created by the thread which entered the session are
+    recorded. It is created with :func:`ansys.dpf.core.session`.
+
+    Parameters
+    ----------
+    server : DpfServer, optional
+        Server whose entities are recorded. Defaults to the global server.
+
+    Examples
+    --------
+    >>> from ansys.dpf import core as dpf
+    >>> from ansys.dpf.core import examples
+    >>> with dpf.session() as s:
+    ...     model = dpf.Model(examples.static_rst)
+    ...     disp = model.results.displacement().outputs.fields_container()
+    ...     norm = dpf.operators.math.norm_fc(disp).outputs.fields_container()
+    ...     max_disp = s.keep(norm[0]).data.max()
+
+    """
+
+    def __init__(self, server=None):
+        if server is None:
+            from ansys.dpf.core import server as serverlib
+            server = serverlib._global_server()
+        self.server = server
+        # weak references to the recorded entities and name of their message
+        # attribute, by id of the wrapper
+        self._entities = {}
+        self._released = 0
+
+    def _add(self, entity, message_attribute):
+        key = id(entity)
+        # an entity collected during the session is deleted by its finalizer
+        ref = weakref.ref(entity, lambda _: self._entities.pop(key, None))
+        self._entities[key] = (ref, message_attribute)
+
+    def keep(self, entity):
+        """Keep an entity created in the session alive after its exit.
+
+        The recorded entities held by its attributes, for example the field
+        definition of a field, are kept as well.
+
+        Parameters
+        ----------
+        entity : Field, Scoping, Operator, Collection, MeshedRegion, ...
+
+        Returns
+        -------
+        entity
+            The entity given.
+        """
+        if not self._discard(entity):
+            raise ValueError(f"The {type(entity).__name__} was not created in this session.")
+        return entity
+
+    def _discard(self, entity):
+        """Stop recording an entity and the entities held by its attributes"""
+        ref, _ = self._entities.get(id(entity), (None, None))
+        if ref is None or ref() is not entity:
+            return False
+        del self._entities[id(entity)]
+        for value in vars(entity).values():
+            if id(value) in self._entities:
+                self._discard(value)
+        return True
+
+    def release(self):
+        """Release the server side objects of all the entities recorded and
+        not kept, and wait for the server to delete them.
+
+        Returns
+        -------
+        released : int
+            Number of entities released.
+        """
+        entities = [(ref(), message_attribute)
+                    for ref, message_attribute in list(self._entities.values())]
+        self._entities.clear()
+        queue = self.server.release_queue
+        released = 0
+        for entity, message_attribute in entities:
+            message = getattr(entity, message_attribute, None)
+            if message is None:
+                continue
+            queue.push(entity._stub.Delete, message)
+            # the finalizer of the wrapper no longer deletes anything
+            setattr(entity, message_attribute, None)
+            released += 1
+        queue.flush()
+        self._released += released
+        return released
+
+    @property
+    def released(self):
+        """Number of entities released by the session.
+
+        Returns
+        -------
+        released : int
+        """
+        return self._released
+
+    def __len__(self):
+        return len(self._entities)
+
+    def __enter__(self):
+        _active_sessions().append(self)
+        return self
+
+    def __exit__(self, *args):
+        sessions = _active_sessions()
+        if self in sessions:
+            sessions.remove(self)
+        self.release()
+
+
+def session(server=None):
+    """Return a scope releasing all the fields, scopings, operators,
+    collections, meshed regions, workflows, data sources, time freq
+    supports and field definitions created in it on exit.
+
+    Parameters
+    ----------
+    server : DpfServer, optional
+        Server whose entities are recorded. Defaults to the global server.
+
+    Returns
+    -------
+    session : Session
+
+    Examples
+    --------
+    >>> from ansys.dpf import core as dpf
+    >>> with dpf.session() as s:
+    ...     field = s.keep(dpf.Field(nentities=10))
+    ...     temporary = dpf.Field(nentities=10)
+
+    """
+    return Session(server)
@@ -10,6 +10,7 @@ from ansys.grpc.dpf import base_pb2, support_pb2
 from ansys.dpf.core.errors import protect_grpc
 from ansys.dpf import core
 from ansys.dpf.core import errors as dpf_errors
+from ansys.dpf.core.session_scope import _record
 
 
 class TimeFreqSupport:
@@ -56,6 +57,7 @@ class TimeFreqSupport:
         else:
             request = base_pb2.Empty()
             self._message = self._stub.Create(request)
+        _record(self)
 
     def __str__(self):
         """describe the entity
@@ -527,6 +529,6 @@ class TimeFreqSupport:
 
     def __del__(self):
         try:
-            self._stub.Delete(self._message)
+            self._server.release_queue.push(self._stub.Delete, self._message)
         except:
             pass
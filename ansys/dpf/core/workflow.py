@@ -12,11 +12,18 @@ from ansys.grpc.dpf import workflow_pb2, workflow_pb2_grpc, base_pb2
 from ansys.dpf.core import (dpf_operator, inputs, outputs)
 from ansys.dpf.core.common import types
 from ansys.dpf.core.errors import protect_grpc
+from ansys.dpf.core.session_scope import _record
 
 LOG = logging.getLogger(__name__)
 LOG.setLevel('DEBUG')
 
 
+def _connected_by_workflow(operator):
+    """Mark an operator whose inputs can be connected by a workflow, and
+    are then unknown to the output caches."""
+    operator._connections = None
+
+
 class Workflow:
     """A class used to represent a Workflow:
         a workflow is a black box containing operators and exposing only the necessary operator's
@@ -66,6 +73,7 @@ class Workflow:
         
         if workflow is None:
             self.__send_init_request()
+        _record(self)
 
 
     @protect_grpc
@@ -128,17 +136,79 @@ class Workflow:
         output_type : core.type enum
             The requested type of the output.
         """
-        
+        request = self._get_output_request(pin_name, output_type)
+        out = self._stub.Get(request)
+        return dpf_operator._convertOutputMessageToPythonInstance(out, output_type, self._server)
+
+    def get_output_async(self, pin_name, output_type):
+        """Requests the output of the workflow on the pin name without
+        waiting for its evaluation.
+
+        Parameters
+        ----------
+        pin_name : str
+            Name of the pin to get. This name should be 
+            exposed before with wf.set_output_name
+
+        output_type : core.type enum
+            The requested type of the output.
+
+        Returns
+        -------
+        future : OutputFuture
+            Future whose ``result()`` is the output.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> disp_op = dpf.operators.result.displacement()
+        >>> max_fc_op = dpf.operators.min_max.min_max_fc(disp_op)
+        >>> workflow = dpf.Workflow()
+        >>> workflow.add_operators([disp_op,max_fc_op])
+        >>> workflow.set_input_name("data_sources", disp_op.inputs.data_sources)
+        >>> workflow.set_output_name("min", max_fc_op.outputs.field_min)
+        >>> workflow.connect("data_sources", dpf.DataSources(examples.multishells_rst))
+        >>> future = workflow.get_output_async("min", dpf.types.field)
+        >>> min_field = future.result()
+
+        """
+        from ansys.dpf.core.futures import OutputFuture
+        request = self._get_output_request(pin_name, output_type)
+        return OutputFuture(self._stub.Get.future(request),
+                            functools.partial(dpf_operator._convertOutputMessageToPythonInstance,
+                                              output_type=output_type, server=self._server),
+                            owner=self)
+
+    @protect_grpc
+    async def get_output_aio(self, pin_name, output_type):
+        """Coroutine returning the output of the workflow on the pin name.
+
+        The evaluation request is sent with the ``grpc.aio`` API on the
+        running event loop.
+
+        Parameters
+        ----------
+        pin_name : str
+            Name of the pin to get. This name should be 
+            exposed before with wf.set_output_name
+
+        output_type : core.type enum
+            The requested type of the output.
+        """
+        request = self._get_output_request(pin_name, output_type)
+        stub = workflow_pb2_grpc.WorkflowServiceStub(self._server._aio_channel())
+        out = await stub.Get(request)
+        return dpf_operator._convertOutputMessageToPythonInstance(out, output_type, self._server)
+
+    def _get_output_request(self, pin_name, output_type):
+        if output_type is None:
+            raise ValueError("please specify an output type to get the workflow's output")
         request = workflow_pb2.WorkflowEvaluationRequest()
         request.wf.CopyFrom(self._message)
         request.pin_name = pin_name
-        
-        if output_type is not None:
-            dpf_operator._write_output_type_to_proto_style(output_type, request)
-            out = self._stub.Get(request)
-            return dpf_operator._convertOutputMessageToPythonInstance(out, output_type, self._server)
-        else:
-            raise ValueError("please specify an output type to get the workflow's output")
+        dpf_operator._write_output_type_to_proto_style(output_type, request)
+        return request
         
         
     def set_input_name(self, name, *args):
@@ -175,8 +245,10 @@ class Workflow:
             if isinstance(arg, inputs.Input):
                 input_request.pin = arg._pin
                 input_request.operator.CopyFrom(arg._operator._message)
+                _connected_by_workflow(arg._operator)
             elif isinstance(arg, dpf_operator.Operator):
                 input_request.operator.CopyFrom(arg._message)
+                _connected_by_workflow(arg)
             elif isinstance(arg, int):
                 input_request.pin = arg
         request.inputs_naming.extend([input_request])
@@ -243,13 +315,14 @@ class Workflow:
         """
         request = workflow_pb2.AddOperatorsRequest()
         request.wf.CopyFrom(self._message)
-        if isinstance(operators, list):
-            request.operators.extend([op._message for op in operators])
-        elif isinstance(operators, dpf_operator.Operator):
-            request.operators.extend([operators._message])
-        else:
+        if isinstance(operators, dpf_operator.Operator):
+            operators = [operators]
+        elif not isinstance(operators, list):
             raise TypeError(f"operators to add to the workflow are expected to be of type {type(list).__name__} or {type(dpf_operator.Operator).__name__}")
-        self._stub.AddOperators(request)         
+        request.operators.extend([op._message for op in operators])
+        self._stub.AddOperators(request)
+        for op in operators:
+            _connected_by_workflow(op)
             
         
     def add_operator(self, operator):
@@ -437,7 +510,7 @@ class Workflow:
 
     def __del__(self):
         try:
-            self._stub.Delete(self._message)
+            self._server.release_queue.push(self._stub.Delete, self._message)
         except:
             pass
         
@@ -0,0 +1,31 @@
+"""Fixtures of the client benchmarks, run against the in-process fake DPF
+server of ``fake_server.py``.
+
+The simulated network is configured with the environment variables
+``DPF_FAKE_LATENCY`` (seconds added to each call) and
+``DPF_FAKE_BANDWIDTH`` (bytes per second), unlimited by default::
+
+    DPF_FAKE_LATENCY=0.0005 pytest benchmarks
+"""
+import os
+
+import pytest
+
+from fake_server import FakeDpfServer
+
+
+def _env_float(name):
+    value = os.environ.get(name)
+    return float(value) if value else None
+
+
+@pytest.fixture(scope="session")
+def fake_server():
+    with FakeDpfServer(latency=_env_float("DPF_FAKE_LATENCY") or 0.,
+                       bandwidth=_env_float("DPF_FAKE_BANDWIDTH")) as fake:
+        yield fake
+
+
+@pytest.fixture(scope="session")
+def server(fake_server):
+    return fake_server.connect()
@@ -0,0 +1,825 @@
+"""
+Fake DPF server
+===============
+In-process stand-in for a DPF server implementing the Base, Field,
+FieldDefinition, Scoping, Collection, MeshedRegion, Operator, DataSources
+and ResultInfo gRPC services of ``ansys.grpc.dpf`` in pure Python, to
+measure the client hot paths without an Ansys installation.
+
+The server keeps the entities in memory and only implements what the
+client needs to create, fill and read them back. The operators do not
+compute anything: ``ResultInfoProvider`` returns a result info describing
+a displacement and a stress result, the other operators return their
+pin 0 input as a double. A latency added to every call and a bandwidth
+limiting the transfers can be simulated to reproduce a remote server.
+
+Usage::
+
+    python benchmarks/fake_server.py --port 50054 --latency 0.0005 \\
+        --bandwidth 1e9
+
+serves until interrupted, so that the other benchmarks can connect to it
+with ``--port 50054``. In a script or a test:
+
+>>> from ansys.dpf import core as dpf
+>>> from fake_server import FakeDpfServer
+>>> with FakeDpfServer(latency=1e-3) as fake:
+...     server = fake.connect()
+...     field = dpf.Field(nentities=10, server=server)
+"""
+import argparse
+import collections
+import itertools
+import os
+import threading
+import time
+from concurrent import futures
+
+import grpc
+import numpy as np
+
+from ansys.dpf import core as dpf
+from ansys.grpc.dpf import (available_result_pb2, base_pb2, base_pb2_grpc,
+                            collection_pb2, collection_pb2_grpc,
+                            data_sources_pb2, data_sources_pb2_grpc,
+                            field_definition_pb2, field_definition_pb2_grpc,
+                            field_pb2, field_pb2_grpc, meshed_region_pb2,
+                            meshed_region_pb2_grpc, operator_pb2,
+                            operator_pb2_grpc, result_info_pb2,
+                            result_info_pb2_grpc, scoping_pb2,
+                            scoping_pb2_grpc)
+
+# size in bytes of the streamed chunks sent by the fake server
+CHUNK_SIZE = 65536
+
+# number of ids per message of the scoping ids listed without streaming
+_IDS_PER_MESSAGE = 16384
+
+# whether the installed protos stream the scoping ids as bytes
+_STREAMED_IDS = "array" in base_pb2.Ids.DESCRIPTOR.fields_by_name
+
+# version reported by the fake server: the client streams the scoping ids
+# from version 2.1, which the installed protos may not support
+SERVER_VERSION = (2, 1) if _STREAMED_IDS else (2, 0)
+
+# (element shape, number of nodes) -> element type of the elements built by
+# MeshedRegion.from_arrays
+_ELEMENT_TYPES = {(1, 8): 11, (1, 4): 10, (1, 10): 0, (1, 20): 1, (1, 6): 12, (1, 5): 13,
+                  (0, 3): 14, (0, 4): 16, (0, 6): 4, (0, 8): 6, (2, 2): 18, (2, 3): 8,
+                  (3, 1): 9}
+
+# results described by the result info of the fake server:
+# (operator name, physics name, number of components, nature, homogeneity, unit)
+_RESULTS = (("U", "displacement", 3, base_pb2.VECTOR, "LENGTH", "m"),
+            ("S", "stress", 6, base_pb2.SYMMATRIX, "STRESS", "Pa"))
+
+_PinSpec = collections.namedtuple("_PinSpec", ("name", "type_names"))
+
+# specifications of the operators created without a generated class
+_OPERATOR_SPECS = {
+    "stream_provider": (
+        {4: _PinSpec("data_sources", ["data_sources"])},
+        {0: _PinSpec("streams_container", ["streams_container"])}),
+    "ResultInfoProvider": (
+        {3: _PinSpec("streams_container", ["streams_container"]),
+         4: _PinSpec("data_sources", ["data_sources"])},
+        {0: _PinSpec("result_info", ["result_info"])}),
+}
+
+
+class _Entity:
+    """Server side object"""
+
+    def __init__(self, **attributes):
+        self.__dict__.update(attributes)
+
+
+class _Store:
+    """Entities of the server by id"""
+
+    def __init__(self):
+        self._entities = {}
+        self._ids = itertools.count(1)
+
+    def add(self, entity):
+        entity_id = next(self._ids)
+        self._entities[entity_id] = entity
+        return entity_id
+
+    def get(self, entity_id):
+        return self._entities[entity_id]
+
+    def delete(self, entity_id):
+        self._entities.pop(entity_id, None)
+
+    def __len__(self):
+        return len(self._entities)
+
+
+def _new_scoping(ids=(), location=""):
+    return _Entity(ids=np.asarray(ids, dtype=np.int32), location=location)
+
+
+def _new_field_definition(location="Nodal", nature=0, n_components=1):
+    return _Entity(unit="", location=location, nature=nature, size=[n_components],
+                   shell_layers=0)
+
+
+def _new_field(data=(), n_components=1, data_pointer=None, location="Nodal",
+               datatype="double", nature=0):
+    dtype = np.int32 if datatype == "int" else np.float64
+    return _Entity(datatype=datatype, n_components=n_components, dtype=dtype,
+                   data=np.asarray(data, dtype=dtype).reshape(-1),
+                   data_pointer=np.asarray([] if data_pointer is None else data_pointer,
+                                           dtype=np.int32),
+                   scoping=_new_scoping(location=location),
+                   definition=_new_field_definition(location, nature, n_components))
+
+
+def _stream_array(array, context):
+    """Send the size of an array in the initial metadata and yield its
+    bytes in chunks"""
+    data = array.tobytes()
+    context.send_initial_metadata((("size_tot", str(len(data))),))
+    for begin in range(0, len(data), CHUNK_SIZE):
+        yield data[begin:begin + CHUNK_SIZE]
+
+
+def _join_arrays(request_iterator, entity_attribute):
+    """Return the id of the entity and the bytes of a streamed array"""
+    parts = []
+    entity_id = None
+    for request in request_iterator:
+        entity_id = getattr(request, entity_attribute).id
+        parts.append(request.array)
+    return entity_id, b"".join(parts)
+
+
+def _requests_float(context):
+    return dict(context.invocation_metadata()).get("float_or_double") == "float"
+
+
+class _BaseService(base_pb2_grpc.BaseServiceServicer):
+    def __init__(self, store):
+        self._store = store
+
+    def GetServerInfo(self, request, context):
+        return base_pb2.ServerInfoResponse(majorVersion=SERVER_VERSION[0],
+                                           minorVersion=SERVER_VERSION[1],
+                                           processId=os.getpid(), ip="127.0.0.1")
+
+    def Describe(self, request, context):
+        return base_pb2.DescribeResponse(description=f"DPF entity {request.dpf_type_id}")
+
+    def PrepareShutdown(self, request, context):
+        return base_pb2.Empty()
+
+
+class _FieldService(field_pb2_grpc.FieldServiceServicer):
+    def __init__(self, store):
+        self._store = store
+
+    def Create(self, request, context):
+        datatype = request.datatype or "double"
+        n_components = {base_pb2.VECTOR: 3, base_pb2.MATRIX: 9,
+                        base_pb2.SYMMATRIX: 6}.get(request.nature, 1)
+        field = _new_field(n_components=n_components, location=request.location.location,
+                           datatype=datatype, nature=request.nature)
+        return field_pb2.Field(id=self._store.add(field), datatype=datatype)
+
+    def Count(self, request, context):
+        field = self._store.get(request.field.id)
+        if request.entity == base_pb2.NUM_COMPONENT:
+            return base_pb2.CountResponse(count=field.n_components)
+        return base_pb2.CountResponse(count=field.data.size // field.n_components)
+
+    def UpdateData(self, request_iterator, context):
+        field_id, data = _join_arrays(request_iterator, "field")
+        field = self._store.get(field_id)
+        field.data = np.frombuffer(data, dtype=field.dtype).copy()
+        return base_pb2.Empty()
+
+    def UpdateDataPointer(self, request_iterator, context):
+        field_id, data = _join_arrays(request_iterator, "field")
+        self._store.get(field_id).data_pointer = np.frombuffer(data, dtype=np.int32).copy()
+        return base_pb2.Empty()
+
+    def AddData(self, request, context):
+        field = self._store.get(request.field.id)
+        container = request.elemdata_containers
+        if field.datatype == "int":
+            values = container.data.dataint.rep_int
+        else:
+            values = container.data.datadouble.rep_double
+        values = np.array(values, dtype=field.dtype)
+        if field.data_pointer.size or values.size != field.n_components:
+            if not field.data_pointer.size:
+                field.data_pointer = (np.arange(field.scoping.ids.size, dtype=np.int32)
+                                      * field.n_components)
+            field.data_pointer = np.append(field.data_pointer, np.int32(field.data.size))
+        field.data = np.concatenate([field.data, values])
+        field.scoping.ids = np.append(field.scoping.ids, np.int32(container.scoping_id))
+        return base_pb2.Empty()
+
+    def UpdateScoping(self, request, context):
+        self._store.get(request.field.id).scoping = self._store.get(request.scoping.id)
+        return base_pb2.Empty()
+
+    def UpdateSize(self, request, context):
+        return base_pb2.Empty()
+
+    def UpdateFieldDefinition(self, request, context):
+        field = self._store.get(request.field.id)
+        field.definition.__dict__.update(self._store.get(request.field_def.id).__dict__)
+        return base_pb2.Empty()
+
+    def List(self, request, context):
+        field = self._store.get(request.field.id)
+        data = field.data
+        if field.datatype != "int" and _requests_float(context):
+            data = data.astype(np.float32)
+        for chunk in _stream_array(data, context):
+            yield field_pb2.ListResponse(array=chunk)
+
+    def ListDataPointer(self, request, context):
+        field = self._store.get(request.field.id)
+        for chunk in _stream_array(field.data_pointer, context):
+            yield field_pb2.ListResponse(array=chunk)
+
+    def GetScoping(self, request, context):
+        field = self._store.get(request.field.id)
+        return field_pb2.GetScopingResponse(
+            scoping=scoping_pb2.Scoping(id=self._store.add(field.scoping)))
+
+    def GetFieldDefinition(self, request, context):
+        field = self._store.get(request.field.id)
+        definition = field_definition_pb2.FieldDefinition(id=self._store.add(field.definition))
+        return field_pb2.GetFieldDefinitionResponse(field_definition=definition)
+
+    def GetElementaryData(self, request, context):
+        field = self._store.get(request.field.id)
+        index = request.index
+        if field.data_pointer.size:
+            begin = field.data_pointer[index]
+            end = (field.data_pointer[index + 1] if index + 1 < field.data_pointer.size
+                   else field.data.size)
+        else:
+            begin, end = index * field.n_components, (index + 1) * field.n_components
+        values = field.data[begin:end].tolist()
+        response = field_pb2.GetElementaryDataResponse()
+        data = response.elemdata_containers.data
+        if field.datatype == "int":
+            data.dataint.rep_int.extend(values)
+        elif _requests_float(context):
+            data.datafloat.rep_float.extend(values)
+        else:
+            data.datadouble.rep_double.extend(values)
+        return response
+
+    def Delete(self, request, context):
+        self._store.delete(request.id)
+        return base_pb2.Empty()
+
+
+class _FieldDefinitionService(field_definition_pb2_grpc.FieldDefinitionServiceServicer):
+    def __init__(self, store):
+        self._store = store
+
+    def Create(self, request, context):
+        return field_definition_pb2.FieldDefinition(id=self._store.add(_new_field_definition()))
+
+    def Update(self, request, context):
+        definition = self._store.get(request.field_definition.id)
+        if request.HasField("unit_symbol"):
+            definition.unit = request.unit_symbol.symbol
+        if request.HasField("location"):
+            definition.location = request.location.location
+        if request.HasField("dimensionnality"):
+            definition.nature = request.dimensionnality.nature
+            definition.size = list(request.dimensionnality.size)
+        if request.shell_layers:
+            definition.shell_layers = request.shell_layers
+        return base_pb2.Empty()
+
+    def List(self, request, context):
+        definition = self._store.get(request.id)
+        response = field_definition_pb2.FieldDefinitionData(shell_layers=definition.shell_layers)
+        response.unit.symbol = definition.unit
+        response.location.location = definition.location
+        response.dimensionnality.nature = definition.nature
+        response.dimensionnality.size.extend(definition.size)
+        return response
+
+    def Delete(self, request, context):
+        self._store.delete(request.id)
+        return base_pb2.Empty()
+
+
+class _ScopingService(scoping_pb2_grpc.ScopingServiceServicer):
+    def __init__(self, store):
+        self._store = store
+
+    def Create(self, request, context):
+        return scoping_pb2.Scoping(id=self._store.add(_new_scoping()))
+
+    def Update(self, request, context):
+        scoping = self._store.get(request.scoping.id)
+        if request.HasField("location"):
+            scoping.location = request.location.location
+        if request.HasField("index_id"):
+            index = request.index_id.index
+            if index >= scoping.ids.size:
+                scoping.ids = np.resize(scoping.ids, index + 1)
+            scoping.ids[index] = request.index_id.id
+        return base_pb2.Empty()
+
+    def UpdateIds(self, request_iterator, context):
+        scoping_id, data = _join_arrays(request_iterator, "scoping")
+        self._store.get(scoping_id).ids = np.frombuffer(data, dtype=np.int32).copy()
+        return base_pb2.Empty()
+
+    def List(self, request, context):
+        ids = self._store.get(request.id).ids
+        if _STREAMED_IDS:
+            for chunk in _stream_array(ids, context):
+                yield base_pb2.Ids(array=chunk)
+            return
+        context.send_initial_metadata((("size_tot", str(ids.nbytes)),))
+        for begin in range(0, ids.size, _IDS_PER_MESSAGE):
+            response = base_pb2.Ids()
+            response.ids.rep_int.extend(ids[begin:begin + _IDS_PER_MESSAGE].tolist())
+            yield response
+
+    def Count(self, request, context):
+        return base_pb2.CountResponse(count=self._store.get(request.scoping.id).ids.size)
+
+    def GetLocation(self, request, context):
+        location = base_pb2.Location(location=self._store.get(request.id).location)
+        return scoping_pb2.GetLocationResponse(loc=location)
+
+    def Get(self, request, context):
+        ids = self._store.get(request.scoping.id).ids
+        if request.id:
+            indices = np.nonzero(ids == request.id)[0]
+            return scoping_pb2.GetResponse(index=int(indices[0]) if indices.size else -1)
+        return scoping_pb2.GetResponse(id=int(ids[request.index]))
+
+    def Delete(self, request, context):
+        self._store.delete(request.id)
+        return base_pb2.Empty()
+
+
+class _CollectionService(collection_pb2_grpc.CollectionServiceServicer):
+    def __init__(self, store):
+        self._store = store
+
+    def Create(self, request, context):
+        collection = _Entity(type=request.type, labels=[], entries=[])
+        return collection_pb2.Collection(id=self._store.add(collection), type=request.type)
+
+    def UpdateLabels(self, request, context):
+        collection = self._store.get(request.collection.id)
+        for label in request.labels:
+            if label.label not in collection.labels:
+                collection.labels.append(label.label)
+                for label_space, _ in collection.entries:
+                    label_space[label.label] = label.default_value.default_value
+        return base_pb2.Empty()
+
+    def _entry_message(self, collection):
+        if collection.type == base_pb2.FIELD:
+            return field_pb2.Field()
+        return scoping_pb2.Scoping()
+
+    def UpdateEntry(self, request, context):
+        collection = self._store.get(request.collection.id)
+        label_space = dict(request.label_space.label_space)
+        message = self._entry_message(collection)
+        request.entry.dpf_type.Unpack(message)
+        entity = self._store.get(message.id)
+        for index, (entry_label_space, _) in enumerate(collection.entries):
+            if entry_label_space == label_space:
+                collection.entries[index] = (label_space, entity)
+                break
+        else:
+            collection.entries.append((label_space, entity))
+        return base_pb2.Empty()
+
+    def List(self, request, context):
+        collection = self._store.get(request.id)
+        response = collection_pb2.ListResponse(count_entries=len(collection.entries))
+        response.labels.labels.extend(collection.labels)
+        return response
+
+    def GetEntries(self, request, context):
+        collection = self._store.get(request.collection.id)
+        if request.HasField("label_space"):
+            label_space = dict(request.label_space.label_space)
+            entries = [(entry_label_space, entity)
+                       for entry_label_space, entity in collection.entries
+                       if all(entry_label_space.get(key) == value
+                              for key, value in label_space.items())]
+        else:
+            entries = [collection.entries[request.index]]
+        response = collection_pb2.GetEntriesResponse()
+        for label_space, entity in entries:
+            message = self._entry_message(collection)
+            message.id = self._store.add(entity)
+            if collection.type == base_pb2.FIELD:
+                message.datatype = entity.datatype
+            entry = response.entries.add()
+            entry.dpf_type.Pack(message)
+            entry.label_space.label_space.update(label_space)
+        return response
+
+    def GetLabelScoping(self, request, context):
+        collection = self._store.get(request.collection.id)
+        values = []
+        for label_space, _ in collection.entries:
+            value = label_space.get(request.label)
+            if value is not None and value not in values:
+                values.append(value)
+        scoping = _new_scoping(values, request.label)
+        return collection_pb2.LabelScopingResponse(
+            label_scoping=scoping_pb2.Scoping(id=self._store.add(scoping)))
+
+    def GetSupport(self, request, context):
+        context.abort(grpc.StatusCode.NOT_FOUND, "the collection has no support")
+
+    def Describe(self, request, context):
+        return base_pb2.DescribeResponse(description="DPF collection")
+
+    def Delete(self, request, context):
+        self._store.delete(request.id)
+        return base_pb2.Empty()
+
+
+class _MeshedRegionService(meshed_region_pb2_grpc.MeshedRegionServiceServicer):
+    def __init__(self, store):
+        self._store = store
+
+    def Create(self, request, context):
+        mesh = _Entity(node_ids=[], coordinates=[], element_ids=[], shapes=[],
+                       connectivities=[], unit="")
+        return meshed_region_pb2.MeshedRegion(id=self._store.add(mesh))
+
+    def Add(self, request, context):
+        mesh = self._store.get(request.mesh.id)
+        for node in request.nodes:
+            mesh.node_ids.append(node.id)
+            mesh.coordinates.append(list(node.coordinates))
+        for element in request.elements:
+            mesh.element_ids.append(element.id)
+            mesh.shapes.append(element.shape)
+            mesh.connectivities.append(list(element.connectivity))
+        return base_pb2.Empty()
+
+    def GetScoping(self, request, context):
+        mesh = self._store.get(request.mesh.id)
+        location = request.loc.location
+        ids = mesh.element_ids if location == dpf.locations.elemental else mesh.node_ids
+        return scoping_pb2.Scoping(id=self._store.add(_new_scoping(ids, location)))
+
+    def ListProperty(self, request, context):
+        mesh = self._store.get(request.mesh.id)
+        if request.WhichOneof("property_type") == "nodal_property":
+            field = _new_field(np.array(mesh.coordinates, dtype=np.float64), 3,
+                               nature=base_pb2.VECTOR)
+            field.scoping.ids = np.array(mesh.node_ids, dtype=np.int32)
+            return field_pb2.Field(id=self._store.add(field), datatype=field.datatype)
+        prop = request.elemental_property
+        if prop == meshed_region_pb2.CONNECTIVITY:
+            sizes = [len(connectivity) for connectivity in mesh.connectivities]
+            data_pointer = np.concatenate(([0], np.cumsum(sizes)[:-1])) if sizes else []
+            values = [index for connectivity in mesh.connectivities for index in connectivity]
+        else:
+            data_pointer = None
+            if prop == meshed_region_pb2.ELEMENT_TYPE:
+                values = [_ELEMENT_TYPES.get((shape, len(connectivity)), 20)
+                          for shape, connectivity in zip(mesh.shapes, mesh.connectivities)]
+            elif prop == meshed_region_pb2.ELEMENT_SHAPE:
+                values = mesh.shapes
+            else:
+                values = np.ones(len(mesh.element_ids))
+        field = _new_field(values, 1, data_pointer, dpf.locations.elemental, "int")
+        field.scoping.ids = np.array(mesh.element_ids, dtype=np.int32)
+        return field_pb2.Field(id=self._store.add(field), datatype=field.datatype)
+
+    def List(self, request, context):
+        mesh = self._store.get(request.id)
+        return meshed_region_pb2.ListResponse(unit=mesh.unit, num_nodes=len(mesh.node_ids),
+                                              num_element=len(mesh.element_ids))
+
+    def UpdateRequest(self, request, context):
+        self._store.get(request.meshed_region.id).unit = request.unit
+        return base_pb2.Empty()
+
+    def Delete(self, request, context):
+        self._store.delete(request.id)
+        return base_pb2.Empty()
+
+
+class _OperatorService(operator_pb2_grpc.OperatorServiceServicer):
+    def __init__(self, store):
+        self._store = store
+
+    def Create(self, request, context):
+        operator = _Entity(name=request.name, inputs={})
+        message = operator_pb2.Operator(id=self._store.add(operator), name=request.name)
+        inputs, outputs = _OPERATOR_SPECS.get(request.name, ({}, {}))
+        for pins, spec_map in ((inputs, message.spec.map_input_pin_spec),
+                               (outputs, message.spec.map_output_pin_spec)):
+            for pin, pin_spec in pins.items():
+                spec_map[pin].name = pin_spec.name
+                spec_map[pin].type_names.extend(pin_spec.type_names)
+        message.spec.description = f"fake {request.name} operator"
+        return message
+
+    def Update(self, request, context):
+        operator = self._store.get(request.op.id)
+        which = request.WhichOneof("input")
+        operator.inputs[request.pin] = getattr(request, which) if which else None
+        return base_pb2.Empty()
+
+    def UpdateConfig(self, request, context):
+        return base_pb2.Empty()
+
+    def Get(self, request, context):
+        operator = self._store.get(request.op.id)
+        if operator.name == "ResultInfoProvider":
+            info = result_info_pb2.ResultInfo(id=self._store.add(_Entity()))
+            return operator_pb2.OperatorResponse(result_info=info)
+        value = operator.inputs.get(0, 0.)
+        return operator_pb2.OperatorResponse(double=value if isinstance(value, float) else 0.)
+
+    def List(self, request, context):
+        return operator_pb2.ListResponse(op_name=self._store.get(request.id).name)
+
+    def Delete(self, request, context):
+        self._store.delete(request.id)
+        return base_pb2.Empty()
+
+
+class _DataSourcesService(data_sources_pb2_grpc.DataSourcesServiceServicer):
+    def __init__(self, store):
+        self._store = store
+
+    def Create(self, request, context):
+        return data_sources_pb2.DataSources(id=self._store.add(_Entity(paths={})))
+
+    def Update(self, request, context):
+        data_sources = self._store.get(request.data_sources.id)
+        data_sources.paths.setdefault(request.key, []).append(request.path)
+        return base_pb2.Empty()
+
+    def UpdateUpstream(self, request, context):
+        return base_pb2.Empty()
+
+    def List(self, request, context):
+        data_sources = self._store.get(request.id)
+        response = data_sources_pb2.ListResponse(result_key=next(iter(data_sources.paths), ""))
+        for key, paths in data_sources.paths.items():
+            response.paths[key].paths.extend(paths)
+        return response
+
+    def Delete(self, request, context):
+        self._store.delete(request.id)
+        return base_pb2.Empty()
+
+
+class _ResultInfoService(result_info_pb2_grpc.ResultInfoServiceServicer):
+    def __init__(self, store):
+        self._store = store
+
+    def List(self, request, context):
+        return result_info_pb2.ResultInfoResponse(
+            analysis_type=result_info_pb2.STATIC, physics_type=result_info_pb2.MECANIC,
+            unit_system=11, unit_system_name="Metric (m, kg, N, s, V, A)",
+            nresult=len(_RESULTS), solver_major_version=21, solver_minor_version=2,
+            main_title="fake result file")
+
+    def ListResult(self, request, context):
+        name, physics_name, n_components, nature, homogeneity, unit = _RESULTS[request.numres]
+        return available_result_pb2.AvailableResultResponse(
+            name=name, physicsname=physics_name, ncomp=n_components, dimensionality=nature,
+            homogeneity=available_result_pb2.Homogeneity.Value(homogeneity), unit=unit)
+
+    def Delete(self, request, context):
+        self._store.delete(request.id)
+        return base_pb2.Empty()
+
+
+def _wrap_requests(request_iterator, delay):
+    for request in request_iterator:
+        delay(request)
+        yield request
+
+
+def _wrap_responses(responses, delay):
+    for response in responses:
+        delay(response)
+        yield response
+
+
+class _NetworkInterceptor(grpc.ServerInterceptor):
+    """Count the calls by ``"Service/Method"`` and delay them like a
+    network of the given latency and bandwidth would"""
+
+    def __init__(self, fake_server):
+        self._fake_server = fake_server
+
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        if handler is None:
+            return None
+        service, _, method = handler_call_details.method.rpartition("/")
+        self._fake_server._count(f"{service.rpartition('.')[2]}/{method}")
+        start, transfer = self._fake_server._wait_latency, self._fake_server._wait_transfer
+        kwargs = dict(request_deserializer=handler.request_deserializer,
+                      response_serializer=handler.response_serializer)
+        if handler.unary_unary:
+            def unary_unary(request, context):
+                start()
+                transfer(request)
+                response = handler.unary_unary(request, context)
+                transfer(response)
+                return response
+            return grpc.unary_unary_rpc_method_handler(unary_unary, **kwargs)
+        if handler.unary_stream:
+            def unary_stream(request, context):
+                start()
+                transfer(request)
+                return _wrap_responses(handler.unary_stream(request, context), transfer)
+            return grpc.unary_stream_rpc_method_handler(unary_stream, **kwargs)
+        if handler.stream_unary:
+            def stream_unary(request_iterator, context):
+                start()
+                response = handler.stream_unary(_wrap_requests(request_iterator, transfer),
+                                                context)
+                transfer(response)
+                return response
+            return grpc.stream_unary_rpc_method_handler(stream_unary, **kwargs)
+
+        def stream_stream(request_iterator, context):
+            start()
+            return _wrap_responses(handler.stream_stream(_wrap_requests(request_iterator,
+                                                                        transfer), context),
+                                   transfer)
+        return grpc.stream_stream_rpc_method_handler(stream_stream, **kwargs)
+
+
+class FakeDpfServer:
+    """In-process fake DPF server listening on a local port.
+
+    Parameters
+    ----------
+    port : int, optional
+        Port listened to, a free port by default.
+
+    latency : float, optional
+        Time in seconds added to each call.
+
+    bandwidth : float, optional
+        Bytes per second transferred between the client and the server,
+        each message of a call is delayed by its size divided by the
+        bandwidth. Unlimited by default.
+
+    max_workers : int, optional
+        Number of calls processed concurrently.
+
+    Examples
+    --------
+    >>> from fake_server import FakeDpfServer
+    >>> fake = FakeDpfServer(latency=1e-3, bandwidth=1e8).start()
+    >>> server = fake.connect()
+    >>> fake.stop()
+
+    """
+
+    def __init__(self, port=0, latency=0., bandwidth=None, max_workers=8):
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self._requested_port = port
+        self._max_workers = max_workers
+        self._store = _Store()
+        self._calls = collections.Counter()
+        self._lock = threading.Lock()
+        self._grpc_server = None
+        self.port = None
+
+    def start(self):
+        """Start serving.
+
+        Returns
+        -------
+        fake_server : FakeDpfServer
+        """
+        server = grpc.server(futures.ThreadPoolExecutor(max_workers=self._max_workers),
+                             interceptors=[_NetworkInterceptor(self)])
+        for add_servicer, servicer in (
+                (base_pb2_grpc.add_BaseServiceServicer_to_server, _BaseService),
+                (field_pb2_grpc.add_FieldServiceServicer_to_server, _FieldService),
+                (field_definition_pb2_grpc.add_FieldDefinitionServiceServicer_to_server,
+                 _FieldDefinitionService),
+                (scoping_pb2_grpc.add_ScopingServiceServicer_to_server, _ScopingService),
+                (collection_pb2_grpc.add_CollectionServiceServicer_to_server,
+                 _CollectionService),
+                (meshed_region_pb2_grpc.add_MeshedRegionServiceServicer_to_server,
+                 _MeshedRegionService),
+                (operator_pb2_grpc.add_OperatorServiceServicer_to_server, _OperatorService),
+                (data_sources_pb2_grpc.add_DataSourcesServiceServicer_to_server,
+                 _DataSourcesService),
+                (result_info_pb2_grpc.add_ResultInfoServiceServicer_to_server,
+                 _ResultInfoService)):
+            add_servicer(servicer(self._store), server)
+        self.port = server.add_insecure_port(f"127.0.0.1:{self._requested_port}")
+        server.start()
+        self._grpc_server = server
+        return self
+
+    def stop(self, grace=None):
+        """Stop serving."""
+        if self._grpc_server is not None:
+            self._grpc_server.stop(grace)
+            self._grpc_server = None
+
+    def connect(self, as_global=False, **kwargs):
+        """Connect a client to the fake server.
+
+        Parameters
+        ----------
+        as_global : bool, optional
+            Set the connected server as the global server.
+
+        **kwargs
+            Other arguments of :func:`ansys.dpf.core.connect_to_server`,
+            for example ``channel_options``.
+
+        Returns
+        -------
+        server : DpfServer
+        """
+        return dpf.connect_to_server(port=self.port, as_global=as_global, **kwargs)
+
+    @property
+    def calls(self):
+        """Number of calls received by ``"Service/Method"``.
+
+        Returns
+        -------
+        calls : dict[str, int]
+        """
+        with self._lock:
+            return dict(self._calls)
+
+    def reset_calls(self):
+        """Reset the numbers of calls."""
+        with self._lock:
+            self._calls.clear()
+
+    @property
+    def n_entities(self):
+        """Number of entities held by the server.
+
+        Returns
+        -------
+        n_entities : int
+        """
+        return len(self._store)
+
+    def _count(self, method):
+        with self._lock:
+            self._calls[method] += 1
+
+    def _wait_latency(self):
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _wait_transfer(self, message):
+        if self.bandwidth:
+            time.sleep(message.ByteSize() / self.bandwidth)
+
+    def __enter__(self):
+        if self._grpc_server is None:
+            self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fake DPF server")
+    parser.add_argument("--port", type=int, default=dpf.server.DPF_DEFAULT_PORT)
+    parser.add_argument("--latency", type=float, default=0.,
+                        help="time in seconds added to each call")
+    parser.add_argument("--bandwidth", type=float, default=None,
+                        help="bytes per second transferred")
+    args = parser.parse_args()
+
+    with FakeDpfServer(args.port, args.latency, args.bandwidth) as fake:
+        print(f"fake DPF server listening on 127.0.0.1:{fake.port}")
+        try:
+            fake._grpc_server.wait_for_termination()
+        except KeyboardInterrupt:
+            pass
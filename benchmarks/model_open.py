@@ -0,0 +1,94 @@
+"""
+Model open latency
+==================
+Measure the time needed to open a model and to access its results.
+
+Usage::
+
+    python benchmarks/model_open.py --repeat 20
+    python benchmarks/model_open.py --path file.rst --ip 127.0.0.1 --port 50054
+
+Without ``--path``, the ``examples.static_rst`` result file is opened.
+Without ``--port``, a local server is started.
+"""
+import argparse
+import time
+
+from ansys.dpf import core as dpf
+from ansys.dpf.core import examples
+
+
+def _times(function, repeat):
+    times = []
+    for _ in range(repeat):
+        tstart = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - tstart)
+    return times
+
+
+def _report(name, times):
+    times = sorted(times)
+    print(f"{name:<28} best {times[0] * 1e3:9.2f} ms "
+          f"median {times[len(times) // 2] * 1e3:9.2f} ms")
+
+
+def run(server, path, repeat=10):
+    """Run the model open benchmarks.
+
+    Parameters
+    ----------
+    server : DpfServer
+        Server opening the models.
+
+    path : str
+        Result file path on the server.
+
+    repeat : int, optional
+        Number of runs of each benchmark.
+
+    Returns
+    -------
+    results : dict
+        Best time in seconds by benchmark name.
+    """
+    results = {}
+
+    def open_model():
+        dpf.Model(path, server=server)
+
+    def open_and_list_results():
+        model = dpf.Model(path, server=server)
+        for result in model.results:
+            pass
+
+    def results_doc():
+        model = dpf.Model(path, server=server)
+        for name in model.results._op_map_rev:
+            getattr(type(model.results), name).__doc__
+
+    for name, function in [("open model", open_model),
+                           ("open and list results", open_and_list_results),
+                           ("open and read results doc", results_doc)]:
+        times = _times(function, repeat)
+        results[name] = min(times)
+        _report(name, times)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="DPF model open latency")
+    parser.add_argument("--path", default=None)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--ip", default=dpf.server.LOCALHOST)
+    parser.add_argument("--port", type=int, default=None)
+    args = parser.parse_args()
+
+    if args.port is None:
+        server = dpf.start_local_server(ip=args.ip, as_global=False)
+    else:
+        server = dpf.connect_to_server(ip=args.ip, port=args.port, as_global=False)
+    path = args.path
+    if path is None:
+        path = examples.static_rst
+    run(server, path, args.repeat)
@@ -0,0 +1,87 @@
+"""
+Parallel result evaluation
+==========================
+Compare the serial evaluation of a result on all the time sets with its
+evaluation in concurrent chunks of time sets.
+
+Usage::
+
+    python benchmarks/result_parallel_eval.py --parallel 2 4 8
+    python benchmarks/result_parallel_eval.py --path file.rst --result stress \\
+        --ip 127.0.0.1 --port 50054
+
+Without ``--path``, the ``examples.msup_transient`` result file is used.
+Without ``--port``, a local server is started.
+"""
+import argparse
+import time
+
+from ansys.dpf import core as dpf
+from ansys.dpf.core import examples
+
+
+def _best_time(function, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        tstart = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - tstart)
+    return best
+
+
+def run(server, path, result="displacement", parallel=(2, 4), repeat=3):
+    """Run the serial and parallel evaluations.
+
+    Parameters
+    ----------
+    server : DpfServer
+        Server evaluating the result.
+
+    path : str
+        Result file path on the server.
+
+    result : str, optional
+        Name of the result evaluated.
+
+    parallel : list[int], optional
+        Numbers of chunks benchmarked.
+
+    repeat : int, optional
+        Number of runs of each benchmark, the best time is reported.
+
+    Returns
+    -------
+    results : dict
+        Best time in seconds by number of chunks, ``1`` for the serial path.
+    """
+    model = dpf.Model(path, server=server)
+    n_sets = len(model.metadata.time_freq_support.time_frequencies)
+    results = {}
+    for n_chunks in [1] + list(parallel):
+        def evaluate():
+            getattr(model.results, result).on_all_time_freqs.eval(
+                parallel=n_chunks if n_chunks > 1 else None)
+        results[n_chunks] = _best_time(evaluate, repeat)
+        print(f"{result} on {n_sets} sets, {n_chunks:3d} chunk(s) "
+              f"{results[n_chunks]:9.3f} s  speedup {results[1] / results[n_chunks]:5.2f}")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="DPF parallel result evaluation")
+    parser.add_argument("--path", default=None)
+    parser.add_argument("--result", default="displacement")
+    parser.add_argument("--parallel", type=int, nargs="+", default=[2, 4])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--ip", default=dpf.server.LOCALHOST)
+    parser.add_argument("--port", type=int, default=None)
+    args = parser.parse_args()
+
+    if args.port is None:
+        server = dpf.start_local_server(ip=args.ip, as_global=False)
+    else:
+        server = dpf.connect_to_server(ip=args.ip, port=args.port, as_global=False)
+    path = args.path
+    if path is None:
+        path = examples.msup_transient
+    run(server, path, args.result, args.parallel, args.repeat)
@@ -0,0 +1,145 @@
+"""
+Client hot paths
+================
+pytest-benchmark suite of the client hot paths, run against the in-process
+fake DPF server so that it needs no Ansys installation::
+
+    pytest benchmarks --benchmark-autosave
+    pytest benchmarks --benchmark-compare --benchmark-compare-fail=mean:10%
+
+The fake server does no computation, the measured times are the client
+overhead plus the transfers, delayed by ``DPF_FAKE_LATENCY`` and
+``DPF_FAKE_BANDWIDTH`` when they are set.
+"""
+import numpy as np
+import pytest
+
+from ansys.dpf import core as dpf
+
+pytest.importorskip("pytest_benchmark")
+
+# number of values of the transferred arrays
+N_VALUES = 1_000_000
+
+# number of fields of the iterated fields containers
+N_FIELDS = 50
+
+# number of ids of the scopings sent to a server which doesn't stream the
+# ids, below the limit of one call to such a server
+N_LEGACY_IDS = 200_000
+
+
+@pytest.fixture(scope="module")
+def data():
+    return np.random.random(N_VALUES)
+
+
+@pytest.fixture(scope="module")
+def ids(server):
+    n_ids = N_VALUES if server.has_capability("streaming_ids") else N_LEGACY_IDS
+    return np.arange(1, n_ids + 1, dtype=np.int32)
+
+
+@pytest.fixture(scope="module")
+def fields_container(server):
+    fields_container = dpf.FieldsContainer(server=server)
+    fields_container.labels = ["time"]
+    for i in range(N_FIELDS):
+        field = dpf.Field(nentities=100, server=server)
+        field.data = np.random.random(300)
+        fields_container.add_field({"time": i + 1}, field)
+    return fields_container
+
+
+@pytest.fixture(scope="module")
+def mesh_arrays():
+    n = 20
+    grid = np.stack(np.meshgrid(np.arange(n + 1), np.arange(n + 1), np.arange(n + 1),
+                                indexing="ij"), -1).reshape(-1, 3).astype(np.float64)
+    index = np.arange((n + 1) ** 3).reshape(n + 1, n + 1, n + 1)
+    corners = [index[:-1, :-1, :-1], index[1:, :-1, :-1], index[1:, 1:, :-1],
+               index[:-1, 1:, :-1], index[:-1, :-1, 1:], index[1:, :-1, 1:],
+               index[1:, 1:, 1:], index[:-1, 1:, 1:]]
+    connectivity = np.stack([corner.reshape(-1) for corner in corners], -1)
+    return {"node_ids": np.arange(1, grid.shape[0] + 1),
+            "coordinates": grid,
+            "element_ids": np.arange(1, connectivity.shape[0] + 1),
+            "element_types": np.full(connectivity.shape[0], dpf.element_types.Hex8.value),
+            "connectivity": connectivity}
+
+
+def test_field_data_upload(benchmark, server, data):
+    field = dpf.Field(nentities=N_VALUES, nature=dpf.natures.scalar, server=server)
+
+    def upload():
+        field.data = data
+
+    benchmark(upload)
+
+
+def test_field_data_download(benchmark, server, data):
+    field = dpf.Field(nentities=N_VALUES, nature=dpf.natures.scalar, server=server)
+    field.data = data
+    out = np.empty(N_VALUES)
+    benchmark(field.get_data, out=out)
+    assert np.array_equal(out, data)
+
+
+def test_field_data_download_float32(benchmark, server, data):
+    field = dpf.Field(nentities=N_VALUES, nature=dpf.natures.scalar, server=server)
+    field.data = data
+    benchmark(field.get_data, dtype=np.float32)
+
+
+def test_scoping_ids_upload(benchmark, server, ids):
+    scoping = dpf.Scoping(server=server)
+
+    def upload():
+        scoping.ids = ids
+
+    benchmark(upload)
+
+
+def test_scoping_ids_download(benchmark, server, ids):
+    scoping = dpf.Scoping(ids=ids, server=server)
+    out = np.empty(ids.size, dtype=np.int32)
+    benchmark(scoping.get_ids, out=out)
+    assert np.array_equal(out, ids)
+
+
+def test_fields_container_iteration(benchmark, fields_container):
+    fields = benchmark(list, fields_container)
+    assert len(fields) == N_FIELDS
+
+
+def test_fields_container_iter_numpy(benchmark, fields_container):
+    arrays = benchmark(lambda: list(fields_container.iter_numpy(batch=10)))
+    assert len(arrays) == N_FIELDS
+
+
+def test_mesh_from_arrays(benchmark, server, mesh_arrays):
+    mesh = benchmark(dpf.MeshedRegion.from_arrays, **mesh_arrays, server=server)
+    assert len(mesh.elements) == mesh_arrays["element_ids"].size
+
+
+def test_model_open(benchmark, server):
+    def open_model():
+        model = dpf.Model("file.rst", server=server)
+        return model.results
+
+    results = benchmark(open_model)
+    assert len(results) == 2
+
+
+def test_operator_instantiation(benchmark, server):
+    benchmark(dpf.Operator, "ResultInfoProvider", server=server)
+
+
+def test_generated_operator_instantiation(benchmark, server):
+    benchmark(dpf.operators.math.add, server=server)
+
+
+def test_operator_evaluation(benchmark, server):
+    operator = dpf.Operator("forward", server=server)
+    operator.connect(0, 1.5)
+    assert benchmark(operator.get_output, 0, dpf.types.double) == 1.5
@@ -0,0 +1,101 @@
+"""
+Transfer throughput
+===================
+Measure the upload and download throughput of field data and scoping ids
+between the client and a DPF server.
+
+Usage::
+
+    python benchmarks/transfer_throughput.py --size 10000000 --repeat 3
+    python benchmarks/transfer_throughput.py --ip 127.0.0.1 --port 50054 \\
+        --chunk-size 4194304
+
+Without ``--port``, a local server is started.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from ansys.dpf import core as dpf
+
+
+def _best_time(function, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        tstart = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - tstart)
+    return best
+
+
+def _report(name, nbytes, seconds):
+    print(f"{name:<24} {nbytes / 1e6:10.1f} MB {seconds:9.3f} s "
+          f"{nbytes / 1e6 / seconds:10.1f} MB/s")
+
+
+def run(server, size, repeat=3):
+    """Run the upload and download benchmarks.
+
+    Parameters
+    ----------
+    server : DpfServer
+        Server to transfer the data with.
+
+    size : int
+        Number of values transferred.
+
+    repeat : int, optional
+        Number of runs of each benchmark, the best time is reported.
+
+    Returns
+    -------
+    results : dict
+        Best time in seconds by benchmark name.
+    """
+    results = {}
+    data = np.random.random(size)
+    ids = np.arange(1, size + 1, dtype=np.int32)
+    field = dpf.Field(nentities=size, nature=dpf.natures.scalar, server=server)
+    scoping = dpf.Scoping(server=server)
+
+    def set_data():
+        field.data = data
+
+    def get_data():
+        field.get_data(out=out)
+
+    def set_ids():
+        scoping.ids = ids
+
+    def get_ids():
+        scoping.get_ids(out=out_ids)
+
+    out = np.empty(size)
+    out_ids = np.empty(size, dtype=np.int32)
+    for name, function, nbytes in [("field data upload", set_data, data.nbytes),
+                                   ("field data download", get_data, data.nbytes),
+                                   ("scoping ids upload", set_ids, ids.nbytes),
+                                   ("scoping ids download", get_ids, ids.nbytes)]:
+        results[name] = _best_time(function, repeat)
+        _report(name, nbytes, results[name])
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="DPF transfer throughput")
+    parser.add_argument("--size", type=int, default=int(1e7))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--ip", default=dpf.server.LOCALHOST)
+    parser.add_argument("--port", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=None)
+    args = parser.parse_args()
+
+    if args.port is None:
+        server = dpf.start_local_server(ip=args.ip, as_global=False)
+    else:
+        server = dpf.connect_to_server(ip=args.ip, port=args.port, as_global=False)
+    if args.chunk_size is not None:
+        server.chunk_size = args.chunk_size
+    print(f"chunk size: {server.chunk_size} bytes")
+    run(server, args.size, args.repeat)
@@ -156,6 +156,14 @@ def engineering_data_sources():
     ds.add_file_path(resolve_test_file("ds.dat","engineeringData"),"dat")
     return ds
 
+
+@pytest.fixture()
+def stress_field(allkindofcomplexity):
+    """Elemental nodal stress field of the "allKindOfComplexity.rst" result file."""
+    model = core.Model(allkindofcomplexity)
+    stress = model.results.stress()
+    return stress.outputs.fields_container()[0]
+
     
 @pytest.fixture(scope="session", autouse=True)
 def cleanup(request):
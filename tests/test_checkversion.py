@@ -83,4 +83,22 @@ def test_meets_version():
     assert not check_version.meets_version("1.31.1", "1.32.1")
     assert not check_version.meets_version("1.31", "1.32")
     assert not check_version.meets_version("1.31.0", "1.31.1")
-    
\ No newline at end of file
+    
+
+def test_server_capabilities_cached(multishells):
+    model = Model(multishells)
+    server = model._server
+    version = server.version
+    n_requests = server.info_requests
+    assert n_requests == 1
+    capabilities = server.capabilities
+    assert set(capabilities) == set(check_version.CAPABILITIES)
+    for name, required_version in check_version.CAPABILITIES.items():
+        assert server.has_capability(name) == check_version.meets_version(version, required_version)
+    with pytest.raises(ValueError):
+        server.has_capability("unknown")
+    mesh = model.metadata.meshed_region
+    mesh.nodes.scoping.ids
+    check_version.server_meet_version(version, server)
+    server.check_version(version)
+    assert server.info_requests == n_requests
@@ -1,11 +1,14 @@
 # -*- coding: utf-8 -*-
 import numpy as np
 import os
+import subprocess
+import sys
 
 from ansys.dpf import core
 import ansys.grpc.dpf
 import tempfile
 import ansys.dpf.core.operators as op
+from ansys.dpf.core import outputs as dpf_outputs
 
 
 
@@ -325,6 +328,73 @@ def test_generated_operator_set_config():
     assert conf.config_option_accepted_types("mutex") == ['bool']
     assert conf.options["mutex"]=="false"    
     assert "multiple threads" in conf.config_option_documentation("mutex")
-   
-    
-    
\ No newline at end of file
+
+
+def test_operators_imported_lazily():
+    # the generated operators must not be imported with ansys.dpf.core
+    code = ("import sys, time; tstart = time.perf_counter(); "
+            "import ansys.dpf.core; print(time.perf_counter() - tstart); "
+            "print(sum(name.startswith('ansys.dpf.core.operators.') for name in sys.modules))")
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True,
+                         text=True, check=True).stdout.split()
+    assert float(out[0]) < 3.0
+    assert int(out[1]) == 0
+    assert "operators" in dir(core)
+    assert "stress" in dir(core.operators.result)
+    assert core.operators.result.stress.__name__ == "stress"
+    from ansys.dpf.core.operators.math import add
+    assert add is op.math.add
+
+
+def test_generated_operator_spec_cached():
+    spec = op.math.add._spec()
+    assert op.math.add._spec() is spec
+    assert spec.input_pin(0).name == "fieldA"
+    output_spec = op.mesh.node_coordinates._spec().output_pin(0)
+    types = list(output_spec.type_names)
+    field_spec = dpf_outputs._modify_output_spec_with_one_type(output_spec, "field")
+    assert field_spec.type_names == ["field"]
+    assert output_spec.type_names == types
+
+
+def test_generated_operator_pins_from_spec():
+    add = op.math.add()
+    assert add.inputs.fieldA._spec is op.math.add._spec().input_pin(0)
+    assert add.outputs.field._spec is op.math.add._spec().output_pin(0)
+
+
+def test_operator_class_bound_after_submodule_import():
+    code = ("import ansys.dpf.core.operators.math.add_fc; "
+            "from ansys.dpf import core; "
+            "from ansys.dpf.core.operators.math import add_fc; "
+            "print(isinstance(core.operators.math.add_fc, type), add_fc is core.operators.math.add_fc)")
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True,
+                         text=True, check=True).stdout.split()
+    assert out == ["True", "True"]
+    import ansys.dpf.core.operators.math.sqr_fc
+    op = core.operators.math.sqr_fc()
+    assert isinstance(op, core.Operator)
+
+
+def test_lazy_inits_after_regeneration(tmpdir, monkeypatch):
+    from ansys.dpf.core._lazy_operators import _write_lazy_inits
+    package = os.path.join(tmpdir, "regenerated_operators")
+    subpackage = os.path.join(package, "sub")
+    os.makedirs(subpackage)
+    for path, code in [(os.path.join(package, "__init__.py"), "from . import sub\n"),
+                       (os.path.join(subpackage, "__init__.py"), "from .foo import foo\n"),
+                       (os.path.join(subpackage, "foo.py"), "class foo:\n    pass\n")]:
+        with open(path, "w") as f:
+            f.write(code)
+    _write_lazy_inits(package)
+    with open(os.path.join(subpackage, "__init__.py")) as f:
+        assert "import foo" not in f.read()
+    monkeypatch.syspath_prepend(str(tmpdir))
+    import regenerated_operators
+    assert regenerated_operators.__all__ == ["sub"]
+    assert isinstance(regenerated_operators.sub.foo, type)
+    # operator added by a plugin after the import
+    with open(os.path.join(subpackage, "bar.py"), "w") as f:
+        f.write("class bar:\n    pass\n")
+    assert isinstance(regenerated_operators.sub.bar, type)
+    assert "bar" in regenerated_operators.sub.__all__
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from ansys.dpf import core as dpf
+
+
+@pytest.fixture()
+def arrays():
+    return [np.random.random((10, 3)) + 0.5 for _ in range(4)]
+
+
+@pytest.fixture()
+def fields(arrays):
+    return [dpf.field_from_array(array) for array in arrays]
+
+
+def test_eval_expression(arrays, fields):
+    a, b, c, d = fields
+    expression = ((dpf.lazy(a) - b) ** 2 + c) / d
+    assert expression.output_type == dpf.types.field
+    out = expression.eval()
+    assert np.allclose(out.data, ((arrays[0] - arrays[1]) ** 2 + arrays[2]) / arrays[3])
+
+
+def test_reuse_compiled_workflow(arrays, fields):
+    a, b, c, d = fields
+    ((dpf.lazy(a) - b) ** 2 + c).eval()
+    with dpf.profiling.record() as report:
+        out = ((dpf.lazy(c) - d) ** 2 + a).eval()
+    calls = report.calls()
+    assert "OperatorService/Create" not in calls
+    assert "WorkflowService/Create" not in calls
+    assert np.allclose(out.data, (arrays[2] - arrays[3]) ** 2 + arrays[0])
+
+
+def test_compiled_workflow_after_session(arrays, fields):
+    a, b, c, d = fields
+    with dpf.session() as s:
+        s.keep((dpf.lazy(b) / a - d).eval())
+    out = (dpf.lazy(c) / d - a).eval()
+    assert np.allclose(out.data, arrays[2] / arrays[3] - arrays[0])
+
+
+def test_common_subexpressions_and_constants(arrays, fields):
+    a, b = fields[:2]
+    difference = dpf.lazy(a) - b
+    expression = (difference * 2.) * 3. + difference * 6. + 0.
+    assert repr(expression) == ("add(scale(minus(Field, Field), 6.0), "
+                                "scale(minus(Field, Field), 6.0))")
+    with dpf.profiling.record() as report:
+        out = expression.eval()
+    assert report.calls()["OperatorService/Create"] == 3
+    assert np.allclose(out.data, 12. * (arrays[0] - arrays[1]))
+
+
+def test_scalar_operands(arrays, fields):
+    a = fields[0]
+    assert np.allclose((2. / dpf.lazy(a)).eval().data, 2. / arrays[0])
+    assert np.allclose((1. - dpf.lazy(a)).eval().data, 1. - arrays[0])
+    assert np.allclose((dpf.lazy(a) ** 0.5).eval().data, np.sqrt(arrays[0]))
+    expression = dpf.lazy(a)
+    assert expression * 1. + 0. is expression
+    with pytest.raises(TypeError):
+        dpf.lazy(a) ** fields[1]
+
+
+def test_connect_expression(arrays, fields):
+    a, b = fields[:2]
+    norm = dpf.operators.math.norm(dpf.lazy(a) + b)
+    out = norm.outputs.field()
+    assert np.allclose(out.data, np.linalg.norm(arrays[0] + arrays[1], axis=1))
+
+
+def test_fields_container_expression(allkindofcomplexity):
+    model = dpf.Model(allkindofcomplexity)
+    disp_op = model.results.displacement()
+    disp = disp_op.outputs.fields_container()
+    expression = (dpf.lazy(disp_op) * 2. - disp) ** 2
+    assert expression.output_type == dpf.types.fields_container
+    out = expression.outputs.fields_container()
+    assert len(out) == len(disp)
+    assert np.allclose(out[0].data, disp[0].data ** 2)
+
+
+def test_lazy_invalid_operand():
+    with pytest.raises(TypeError):
+        dpf.lazy("U")
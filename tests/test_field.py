@@ -9,13 +9,6 @@ from ansys.dpf.core import FieldDefinition
 from ansys.dpf.core import operators as ops
 
 
-@pytest.fixture()
-def stress_field(allkindofcomplexity):
-    model = dpf.core.Model(allkindofcomplexity)
-    stress = model.results.stress()
-    return stress.outputs.fields_container()[0]
-
-
 def test_create_field():
     field = dpf.core.Field()
     assert field._message.id != 0
@@ -861,6 +854,155 @@ def test_dot_operator_field():
     out = add.outputs.field()
     assert out.scoping.ids == [1,2]
     assert np.allclose(out.data, -field.data)
+
+
+def test_field_metadata_cache():
+    field = dpf.core.fields_factory.create_3d_vector_field(2)
+    field.data = [1., 2., 3., 4., 5., 6.]
+    field.scoping.ids = [1, 2]
+    assert field.shape == (2, 3)
+    hits = field._metadata_cache.hits
+    assert field.shape == (2, 3)
+    assert len(field) == 6
+    assert field._metadata_cache.hits > hits
+    
+    # client side modifications invalidate the cache
+    field.append([7., 8., 9.], 3)
+    assert field.shape == (3, 3)
+    assert field.scoping.ids == [1, 2, 3]
+    field.scoping.ids = [4, 5, 6]
+    assert field.scoping.ids == [4, 5, 6]
+    field.unit = "mm"
+    assert field.unit == "mm"
+    field.field_definition.unit = "m"
+    assert field.unit == "m"
+    
+    field.cache_metadata = False
+    hits = field._metadata_cache.hits
+    assert field.shape == (3, 3)
+    assert field._metadata_cache.hits == hits
+    
+
+def test_field_get_data_in_buffer():
+    field = dpf.core.fields_factory.create_3d_vector_field(100)
+    data = np.arange(300, dtype=np.float64)
+    field.data = data
+    buffer = np.zeros(600)
+    out = field.get_data(out=buffer)
+    assert out.shape == (100, 3)
+    assert np.allclose(out, data.reshape(100, 3))
+    assert np.allclose(buffer[:300], data)
+    pool = dpf.core.BufferPool()
+    out = field.get_data(out=pool, read_only=True)
+    assert not out.flags.writeable
+    assert np.allclose(out, data.reshape(100, 3))
+    pool.release(out)
+    assert pool.in_use == 0
+    assert field.data_as_list == data.tolist()
+    assert field.data_as_list[4] == 4.0
+
+
+def test_buffer_pool_memmap(tmpdir):
+    with dpf.core.BufferPool(directory=str(tmpdir)) as pool:
+        buffer = pool.get(100, np.float64)
+        buffer[:] = 1.
+        assert len(tmpdir.listdir()) == 1
+        pool.release(buffer)
+        del buffer
+    assert len(tmpdir.listdir()) == 0
+
+
+def test_field_get_data_float32(stress_field):
+    data = stress_field.data
+    data_float = stress_field.get_data(dtype=np.float32)
+    assert data.dtype == np.float64
+    assert data_float.dtype == np.float32
+    assert data_float.shape == data.shape
+    assert np.allclose(data_float, data, rtol=1e-6)
+    entity_float = stress_field.get_entity_data(0, dtype=np.float32)
+    assert entity_float.dtype == np.float32
+    assert np.allclose(entity_float, stress_field.get_entity_data(0), rtol=1e-6)
+    stress_field.float_dtype = np.float32
+    assert stress_field.data.dtype == np.float32
+    stress_field.float_dtype = None
+    assert stress_field.data.dtype == np.float64
+
+
+def test_field_get_data_float32_unsupported(stress_field, monkeypatch):
+    monkeypatch.setattr(stress_field._server, "has_capability",
+                        lambda name: name != "float_transfer")
+    with pytest.raises(dpf.core.errors.DpfVersionNotSupported):
+        stress_field.get_data(dtype=np.float32)
+    assert stress_field.get_data().dtype == np.float64
+    with pytest.raises(ValueError):
+        stress_field.get_data(dtype=np.int32)
+
+
+def test_server_float_dtype(stress_field):
+    server = dpf.core.SERVER
+    data = stress_field.data
+    server.float_dtype = np.float32
+    try:
+        assert stress_field.data.dtype == np.float32
+        assert np.allclose(stress_field.data, data, rtol=1e-6)
+        copy = stress_field.deep_copy()
+        assert np.allclose(copy.get_data(dtype=np.float64), data)
+    finally:
+        server.float_dtype = np.float64
+    with pytest.raises(ValueError):
+        server.float_dtype = np.int32
+    
+
+def test_set_data_small_chunks():
+    server = dpf.core.SERVER
+    chunk_size = server.chunk_size
+    server.chunk_size = 100
+    try:
+        field = dpf.core.fields_factory.create_3d_vector_field(1000)
+        data = np.random.random((1000, 3))
+        field.data = data
+        assert np.allclose(field.data, data)
+        field.data = data.T.copy().T
+        assert np.allclose(field.data, data)
+        field.scoping.ids = range(1, 1001)
+        assert np.allclose(field.scoping.ids, range(1, 1001))
+    finally:
+        server.chunk_size = chunk_size
+    with pytest.raises(ValueError):
+        server.chunk_size = 0
+    
+
+def test_field_deletion_deferred():
+    queue = dpf.core.SERVER.release_queue
+    dpf.core.flush()
+    released = queue.released
+    fields = [dpf.core.Field(nentities=3) for _ in range(100)]
+    del fields
+    assert queue.pending + queue.released - released >= 100
+    dpf.core.flush()
+    assert queue.pending == 0
+    assert queue.released - released >= 100
+    assert queue.failed == 0
+
+
+def test_local_field_append_many():
+    num_entities = 100
+    counts = np.arange(num_entities) % 3 + 1
+    data = np.random.random((counts.sum(), 3))
+    ids = np.arange(1, num_entities + 1)
+    field_to_local = dpf.core.fields_factory.create_3d_vector_field(num_entities, location=dpf.core.locations.elemental_nodal)
+    with field_to_local.as_local_field() as f:
+        f.append_many(ids[:50], data[:counts[:50].sum()], counts[:50])
+        f.append_many(ids[50:], data[counts[:50].sum():], counts[50:])
+        assert np.allclose(f.get_entity_data_by_id(2), data[1:3])
+        f.append_many([], [], [])
+        with pytest.raises(ValueError):
+            f.append_many([101], [1., 2.])
+    assert np.allclose(field_to_local.data, data)
+    assert np.allclose(field_to_local.scoping.ids, ids)
+    assert np.allclose(field_to_local._data_pointer, np.concatenate(([0], np.cumsum(counts)[:-1])) * 3)
+    with field_to_local.as_local_field() as f:
+        assert np.allclose(f.get_entity_data_by_id(num_entities), data[-counts[-1]:])
     
     
 if __name__ == "__main__":
@@ -133,6 +133,79 @@ def test_get_item_field_fields_container():
         assert fc[i]._message.id !=0
 
 
+def test_get_all_entries_fields_container():
+    fc= FieldsContainer()
+    fc.labels =['time','complex']
+    for i in range(0,20):
+        mscop = {"time":i//2+1,"complex":i%2}
+        field = Field(nentities=1)
+        field.scoping.ids = [i+1]
+        fc.add_field(mscop,field)
+    fields, label_spaces = fc.get_all_entries()
+    assert len(fields) == 20
+    for i in range(0,20):
+        assert label_spaces[i] == {"time":i//2+1,"complex":i%2}
+        assert fields[i].scoping.ids == [i+1]
+    assert fc.get_label_spaces() == label_spaces
+    assert fc.get_label_space(3) == {"time":2,"complex":1}
+    assert fc.get_available_ids_for_label("complex") == [0,1]
+    assert [f.scoping.ids[0] for f in fc] == list(range(1,21))
+    fc.add_field({"time":11,"complex":0},Field(nentities=3))
+    assert fc.get_available_ids_for_label() == list(range(1,12))
+
+
+def test_get_all_entries_unordered_fields_container():
+    fc = FieldsContainer()
+    fc.labels = ['time']
+    for i in range(3):
+        field = Field(nentities=1)
+        field.scoping.ids = [i + 1]
+        fc.add_field({"time": i + 1}, field)
+
+    class ReversedEntriesStub:
+        """Stub returning the entries matching a label space in reverse order"""
+
+        def __init__(self, stub):
+            self._stub = stub
+
+        def GetEntries(self, request):
+            response = self._stub.GetEntries(request)
+            if request.HasField("label_space"):
+                entries = list(response.entries)[::-1]
+                del response.entries[:]
+                response.entries.extend(entries)
+            return response
+
+        def __getattr__(self, name):
+            return getattr(self._stub, name)
+
+    fc._stub = ReversedEntriesStub(fc._stub)
+    fields, label_spaces = fc.get_all_entries()
+    assert label_spaces == [{"time": 1}, {"time": 2}, {"time": 3}]
+    assert [field.scoping.ids[0] for field in fields] == [1, 2, 3]
+
+
+def test_iter_numpy_fields_container(disp_fc):
+    out = list(disp_fc.iter_numpy(batch=2))
+    assert len(out) == len(disp_fc)
+    time_value, label_space, data = out[0]
+    assert label_space == disp_fc.get_label_space(0)
+    assert time_value == disp_fc.time_freq_support.time_frequencies.data[label_space["time"]-1]
+    assert np.allclose(data, disp_fc[0].data)
+    assert len(list(disp_fc.iter_numpy(prefetch=False))) == len(disp_fc)
+
+
+def test_fields_container_float_dtype(disp_fc):
+    data = disp_fc[0].data
+    disp_fc.float_dtype = np.float32
+    assert disp_fc[0].data.dtype == np.float32
+    assert np.allclose(disp_fc[0].data, data, rtol=1e-6)
+    assert all(data.dtype == np.float32 for _, _, data in disp_fc.iter_numpy())
+    assert disp_fc[0].get_data(dtype=np.float64).dtype == np.float64
+    disp_fc.float_dtype = None
+    assert disp_fc[0].data.dtype == np.float64
+
+
 def test_delete_fields_container():
     fc = FieldsContainer()
     ref = weakref.ref(fc)
@@ -29,6 +29,27 @@ def test_start_local():
     assert starting_server == id(core.SERVER)
 
 
+def test_server_pool():
+    starting_server = id(core.SERVER)
+    n_init = len(core._server_instances)
+    with core.ServerPool(2, ansys_path=core.SERVER.ansys_path) as pool:
+        assert len(core._server_instances) == n_init + 2
+        assert len(set(server.port for server in pool)) == 2
+        assert pool.check_liveness() == 2
+
+        def data_size(n, server):
+            field = core.Field(nentities=n, server=server)
+            field.data = list(range(n))
+            return len(field.data)
+
+        assert pool.map(data_size, [1, 2, 3, 4]) == [1, 2, 3, 4]
+        assert pool.outstanding_requests() == [0, 0]
+    assert len(pool.alive_servers) == 0
+
+    # ensure global channel didn't change
+    assert starting_server == id(core.SERVER)
+
+
 def test_start_local_failed():
     with pytest.raises(NotADirectoryError):
         core.start_local_server(ansys_path='')
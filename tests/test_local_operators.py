@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+
+from ansys.dpf import core as dpf
+from ansys.dpf.core import local_operators
+
+
+@pytest.fixture()
+def vector_field():
+    data = np.random.random((10, 3))
+    field = dpf.field_from_array(data)
+    field.scoping.ids = range(1, 11)
+    return field
+
+
+def _server_output(name, *inputs):
+    op = dpf.Operator(name)
+    for pin, value in enumerate(inputs):
+        op.connect(pin, value)
+    return op.get_output(0, dpf.types.field)
+
+
+def test_norm(vector_field):
+    norm = local_operators.norm(vector_field)
+    assert np.allclose(norm.data, _server_output("norm", vector_field).data)
+    assert np.allclose(norm.scoping.ids, vector_field.scoping.ids)
+
+
+def test_sqr_sqrt_scale(vector_field):
+    assert np.allclose(local_operators.sqr(vector_field).data,
+                       _server_output("sqr", vector_field).data)
+    assert np.allclose(local_operators.sqrt(vector_field).data,
+                       _server_output("sqrt", vector_field).data)
+    assert np.allclose(local_operators.scale(vector_field, 2.5).data,
+                       _server_output("scale", vector_field, 2.5).data)
+
+
+def test_add(vector_field):
+    assert np.allclose(local_operators.add(vector_field, vector_field).data,
+                       vector_field.data * 2)
+    assert np.allclose(local_operators.add(vector_field, 1.).data, vector_field.data + 1.)
+    other = dpf.field_from_array(np.ones((2, 3)))
+    other.scoping.ids = [3, 12]
+    out = local_operators.add(vector_field, other).data
+    assert np.allclose(out[2], vector_field.data[2] + 1.)
+    assert np.allclose(np.delete(out, 2, 0), np.delete(vector_field.data, 2, 0))
+
+
+def test_min_max(vector_field):
+    field_min, field_max = local_operators.min_max(vector_field)
+    op = dpf.Operator("min_max")
+    op.connect(0, vector_field)
+    assert np.allclose(field_min.data, op.get_output(0, dpf.types.field).data)
+    assert np.allclose(field_max.data, op.get_output(1, dpf.types.field).data)
+
+
+def test_eqv(stress_field):
+    eqv = local_operators.eqv(stress_field)
+    assert np.allclose(eqv.data, _server_output("eqv", stress_field).data)
+    assert np.allclose(eqv._data_pointer, stress_field._data_pointer // 6)
+
+
+def test_principal_invariants(stress_field):
+    fields = local_operators.principal_invariants(stress_field)
+    op = dpf.Operator("invariants")
+    op.connect(0, stress_field)
+    for pin, field in enumerate(fields):
+        assert np.allclose(field.data, op.get_output(pin, dpf.types.field).data)
+
+
+def test_component_selector(vector_field):
+    out = local_operators.component_selector(vector_field, [0, 2])
+    assert np.allclose(out.data, vector_field.data[:, [0, 2]])
+    with pytest.raises(ValueError):
+        local_operators.component_selector(vector_field, 3)
+
+
+def test_fields_container(allkindofcomplexity):
+    model = dpf.Model(allkindofcomplexity)
+    fc = model.results.displacement().outputs.fields_container()
+    norm = local_operators.norm(fc)
+    assert norm.labels == fc.labels
+    assert np.allclose(norm[0].data, np.linalg.norm(fc[0].data, axis=1))
+
+
+def test_local_field_without_operator(vector_field):
+    with vector_field.as_local_field() as local_field:
+        with dpf.profiling.record() as report:
+            field_max = local_field.max()
+            norm = dpf.help.norm(local_field)
+    assert "OperatorService/Create" not in report.calls()
+    assert np.allclose(field_max.data, vector_field.data.max(axis=0))
+    assert np.allclose(norm.data, np.linalg.norm(vector_field.data, axis=1))
@@ -439,4 +439,35 @@ def test_mesh_deep_copy2(simple_bar_model):
     assert np.allclose(copy.nodes.coordinates_field.scoping.ids,mesh.nodes.coordinates_field.scoping.ids)
     assert np.allclose(copy.elements.element_types_field.scoping.ids,mesh.elements.element_types_field.scoping.ids)
     assert np.allclose(copy.elements.connectivities_field.scoping.ids,mesh.elements.connectivities_field.scoping.ids)
-    
\ No newline at end of file
+    
+
+def test_mesh_from_arrays():
+    coordinates = np.array([[0., 0., 0.], [1., 0., 0.], [1., 1., 0.], [0., 1., 0.], [2., 0., 0.]])
+    mesh = dpf.core.MeshedRegion.from_arrays(
+        node_ids=[1, 2, 3, 4, 5],
+        coordinates=coordinates,
+        element_ids=[10, 20],
+        element_types=[dpf.core.element_types.Quad4.value, dpf.core.element_types.Line2.value],
+        connectivity=[0, 1, 2, 3, 1, 4],
+        offsets=[0, 4],
+        unit="mm")
+    assert mesh.nodes.n_nodes == 5
+    assert mesh.elements.n_elements == 2
+    assert mesh.elements.element_by_id(10).shape == "shell"
+    assert mesh.elements.element_by_id(20).shape == "beam"
+    arrays = mesh.to_arrays()
+    assert np.allclose(arrays["node_ids"], [1, 2, 3, 4, 5])
+    assert np.allclose(arrays["coordinates"], coordinates)
+    assert np.allclose(arrays["element_ids"], [10, 20])
+    assert np.allclose(arrays["connectivity"], [0, 1, 2, 3, 1, 4])
+    assert np.allclose(arrays["offsets"], [0, 4, 6])
+    assert arrays["unit"] == "mm"
+
+
+def test_mesh_to_arrays_round_trip(simple_bar_model):
+    mesh = simple_bar_model.metadata.meshed_region
+    arrays = mesh.to_arrays()
+    copy = dpf.core.MeshedRegion.from_arrays(**arrays)
+    copy_arrays = copy.to_arrays()
+    for key in ["node_ids", "coordinates", "element_ids", "element_types", "connectivity", "offsets"]:
+        assert np.allclose(copy_arrays[key], arrays[key])
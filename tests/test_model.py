@@ -105,6 +105,29 @@ def test_result_not_overrided(plate_msup):
     assert len(model1.results)==size
     assert len(model2.results)>len(model1.results)
     
+
+
+def test_result_doc_fetched_once(plate_msup):
+    model = dpf.core.Model(plate_msup)
+    server = model._server
+    server._operator_docs.clear()
+    assert len(model.results) > 0
+    assert len(server._operator_docs) == 0
+    doc = type(model.results).displacement.__doc__
+    assert "displacement" in doc
+    assert server._operator_docs["U"] == doc
+    model2 = dpf.core.Model(plate_msup)
+    assert type(model2.results).displacement.__doc__ is doc
+
+
+def test_result_doc_without_operator(plate_msup):
+    model = dpf.core.Model(plate_msup)
+    model.results.displacement
+    with dpf.core.profiling.record() as report:
+        disp = model.results.displacement
+    assert report.calls()["OperatorService/Create"] == 1
+    assert "displacement" in disp.__doc__
+
         
 def test_result_displacement_model():
     model =dpf.core.Model(examples.download_all_kinds_of_complexity_modal())
@@ -160,6 +183,36 @@ def test_result_time_scoping(plate_msup):
     assert np.allclose(fc.time_freq_support.time_frequencies.data,np.array([0.115, 0.125]))
 
 
+def test_result_eval_parallel(plate_msup):
+    model =dpf.core.Model(plate_msup)
+    disp = model.results.displacement.on_all_time_freqs
+    serial = disp.eval()
+    parallel = disp.eval(parallel=3)
+    assert len(parallel) == len(serial) == 20
+    assert parallel.labels == serial.labels
+    assert parallel.get_label_spaces() == serial.get_label_spaces()
+    for i in [0, 7, 19]:
+        assert np.allclose(parallel[i].data, serial[i].data)
+    stress = model.results.stress.on_time_scoping([1,2,3,19])
+    assert stress.eval(parallel=8).get_available_ids_for_label() == [1,2,3,19]
+
+
+def test_result_iter_time_steps(plate_msup):
+    model =dpf.core.Model(plate_msup)
+    disp = model.results.displacement
+    time_values = model.metadata.time_freq_support.time_frequencies.data
+    with dpf.core.profiling.record() as report:
+        steps = list(disp.iter_time_steps(batch=3))
+    assert report.calls()["OperatorService/Create"] == 1
+    assert len(steps) == 20
+    assert [label_space["time"] for _, label_space, _ in steps] == list(range(1,21))
+    assert np.allclose([time_value for time_value, _, _ in steps], time_values)
+    last = disp.on_last_time_freq.eval()
+    assert np.allclose(steps[-1][2], last[0].data)
+    steps = list(disp.on_time_scoping([2,5]).iter_time_steps(prefetch=False))
+    assert [label_space["time"] for _, label_space, _ in steps] == [2,5]
+
+
 def test_result_spliited_subset(allkindofcomplexity):
     model = dpf.core.Model(allkindofcomplexity)
     vol = model.results.elemental_volume
@@ -214,3 +214,18 @@ def test_model_different_results_big_multi_server(all_kind_of_complexity_models)
     fc = op.outputs.fields_container()
     fc2 = op2.outputs.fields_container()
     check_fc(fc,fc2)
+
+
+def test_connect_with_channel_options():
+    options = dpf.ChannelOptions(max_send_message_length=64 * 1024, keepalive_time_ms=10000,
+                                 streaming_compression="gzip", n_channels=3)
+    server = dpf.connect_to_server(dpf.SERVER.ip, dpf.SERVER.port, as_global=False,
+                                   channel_options=options)
+    assert server.channel_options is options
+    assert server.chunk_size < options.max_send_message_length
+    data = np.random.random(150000)
+    fields = [dpf.Field(nentities=50000, server=server) for _ in range(3)]
+    for field in fields:
+        field.data = data
+    for field in fields:
+        assert np.allclose(field.data.ravel(), data)
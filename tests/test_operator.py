@@ -933,6 +933,83 @@ def test_dot_operator_operator():
     assert np.allclose(out[0].data, -field.data)
     
     
+def test_get_output_async_operator():
+    ops_min_max = []
+    for i in range(3):
+        op = dpf.core.Operator("min_max")
+        inpt = dpf.core.Field(nentities=3)
+        inpt.data = np.arange(9.0) + i
+        inpt.scoping.ids = [1,2,3]
+        op.connect(0, inpt)
+        ops_min_max.append(op)
+    futures = [op.get_output_async(0, dpf.core.types.field) for op in ops_min_max]
+    outs = dpf.core.gather(*futures, timeout=60)
+    for i, out in enumerate(outs):
+        assert np.allclose(out.data, [i, i+1.0, i+2.0])
+    assert all(future.done() for future in futures)
+    assert futures[0].result() is outs[0]
+
+
+def test_get_output_async_error_operator():
+    op = dpf.core.Operator("min_max")
+    future = op.get_output_async(0, dpf.core.types.field)
+    with pytest.raises(errors.DPFServerException):
+        future.result()
+
+
+def test_get_output_aio_operator():
+    import asyncio
+    op = dpf.core.Operator("min_max")
+    inpt = dpf.core.Field(nentities=3)
+    inpt.data = [1,2,3,4,5,6,7,8,9]
+    inpt.scoping.ids = [1,2,3]
+    op.connect(0, inpt)
+
+    async def evaluate():
+        return await dpf.core.gather(op.get_output_aio(0, dpf.core.types.field),
+                                     op.get_output_aio(1, dpf.core.types.field))
+    field_min, field_max = asyncio.run(evaluate())
+    assert np.allclose(field_min.data, [1.0,2.0,3.0])
+    assert np.allclose(field_max.data, [7.0,8.0,9.0])
+
+
+def test_aio_channel_per_event_loop():
+    import asyncio
+    op = dpf.core.Operator("min_max")
+    inpt = dpf.core.Field(nentities=3)
+    inpt.data = np.arange(9.0)
+    inpt.scoping.ids = [1,2,3]
+    op.connect(0, inpt)
+    server = op._server
+
+    async def evaluate():
+        out = await op.get_output_aio(0, dpf.core.types.field)
+        return out, weakref.ref(server._aio_channel())
+    _, first_channel = asyncio.run(evaluate())
+    _, second_channel = asyncio.run(evaluate())
+    gc.collect()
+    assert first_channel() is None
+    assert second_channel() is not None
+
+
+def test_gather_mixed_futures():
+    import asyncio
+    op = dpf.core.Operator("min_max")
+    inpt = dpf.core.Field(nentities=3)
+    inpt.data = np.arange(9.0)
+    inpt.scoping.ids = [1,2,3]
+    op.connect(0, inpt)
+
+    async def evaluate():
+        return await dpf.core.gather(op.get_output_aio(0, dpf.core.types.field),
+                                     op.get_output_async(1, dpf.core.types.field))
+    field_min, field_max = asyncio.run(evaluate())
+    assert np.allclose(field_min.data, [0.0,1.0,2.0])
+    assert np.allclose(field_max.data, [6.0,7.0,8.0])
+    with pytest.raises(TypeError):
+        dpf.core.gather(op)
+
+
 def test_delete_operator():
     op = dpf.core.Operator("min_max")
     op.__del__()
@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from ansys.dpf import core as dpf
+from ansys.dpf.core import output_cache
+
+
+@pytest.fixture()
+def cache():
+    cache = output_cache.enable()
+    yield cache
+    output_cache.disable()
+
+
+def test_cached_output(cache, allkindofcomplexity):
+    model = dpf.Model(allkindofcomplexity)
+    disp = model.results.displacement().outputs.fields_container()
+    with dpf.profiling.record() as report:
+        cached = model.results.displacement().outputs.fields_container()
+    assert "OperatorService/Get" not in report.calls()
+    assert cached is disp
+    assert cache.stats["hits"] == 1
+    assert cache.stats["hit_rate"] == 0.5
+    assert cache.size == sum(field.size for field in disp) * 8
+
+
+def test_invalidate_on_connect(cache, allkindofcomplexity):
+    model = dpf.Model(allkindofcomplexity)
+    disp = model.results.displacement()
+    disp.outputs.fields_container()
+    disp.inputs.mesh_scoping(dpf.Scoping(ids=[1, 2], location=dpf.locations.nodal))
+    assert cache.stats["invalidations"] == 1
+    scoped = disp.outputs.fields_container()
+    assert len(scoped[0].scoping) == 2
+    assert cache.stats["misses"] == 2
+
+
+def test_eviction(cache, allkindofcomplexity):
+    model = dpf.Model(allkindofcomplexity)
+    model.results.displacement().outputs.fields_container()
+    cache.max_bytes = cache.size
+    model.results.stress().outputs.fields_container()
+    assert cache.size <= cache.max_bytes
+    disp = model.results.displacement()
+    disp.inputs.mesh_scoping(dpf.Scoping(ids=[1, 2], location=dpf.locations.nodal))
+    disp.outputs.fields_container()
+    assert cache.stats["evictions"] == 1
+    assert len(cache) == 1
+    cache.clear()
+    assert cache.size == 0
+
+
+def test_released_output(cache, allkindofcomplexity):
+    with dpf.session():
+        model = dpf.Model(allkindofcomplexity)
+        released = model.results.displacement().outputs.fields_container()
+    model = dpf.Model(allkindofcomplexity)
+    disp = model.results.displacement().outputs.fields_container()
+    assert disp is not released
+    assert disp._message is not None
+    assert disp[0].data.size > 0
+    assert cache.stats["hits"] == 0
+    assert len(cache) == 1
+
+
+def test_output_per_server(cache, allkindofcomplexity):
+    other = dpf.start_local_server(as_global=False)
+    disp = dpf.Model(allkindofcomplexity).results.displacement().outputs.fields_container()
+    model = dpf.Model(allkindofcomplexity, server=other)
+    other_disp = model.results.displacement().outputs.fields_container()
+    assert other_disp is not disp
+    assert other_disp._server is other
+    assert cache.stats["hits"] == 0
+    assert len(cache) == 2
+
+
+def test_uncacheable_input(cache):
+    field = dpf.field_from_array(np.ones((10, 3)))
+    norm = dpf.operators.math.norm(field)
+    norm.outputs.field()
+    norm.outputs.field()
+    assert cache.stats["uncacheable"] == 2
+    assert len(cache) == 0
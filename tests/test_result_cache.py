@@ -0,0 +1,103 @@
+import os
+
+import numpy as np
+import pytest
+
+from ansys.dpf import core as dpf
+from ansys.dpf.core import result_cache
+
+
+@pytest.fixture()
+def cache(tmp_path):
+    cache = result_cache.enable(str(tmp_path / "cache"))
+    yield cache
+    result_cache.disable()
+
+
+def test_cached_result(cache, allkindofcomplexity):
+    model = dpf.Model(allkindofcomplexity)
+    disp = model.results.displacement().outputs.fields_container()
+    model = dpf.Model(allkindofcomplexity)
+    with dpf.profiling.record() as report:
+        cached = model.results.displacement().outputs.fields_container()
+    assert report.calls().get("OperatorService/Get", 0) == 0
+    assert cache.stats["hits"] == 1
+    assert cache.stats["misses"] == 1
+    assert cached.labels == disp.labels
+    assert len(cached) == len(disp)
+    assert np.allclose(cached[0].data, disp[0].data)
+    assert np.allclose(cached[0].scoping.ids, disp[0].scoping.ids)
+    assert cached[0].unit == disp[0].unit
+    assert np.allclose(cached.time_freq_support.time_frequencies.data,
+                       disp.time_freq_support.time_frequencies.data)
+
+
+def test_inputs_in_fingerprint(cache, allkindofcomplexity):
+    model = dpf.Model(allkindofcomplexity)
+    disp = model.results.displacement()
+    key = result_cache.output_fingerprint(disp, 0, dpf.types.fields_container)
+    assert key is not None
+    scoping = dpf.Scoping(ids=[1, 2], location=dpf.locations.nodal)
+    disp.inputs.mesh_scoping(scoping)
+    scoped_key = result_cache.output_fingerprint(disp, 0, dpf.types.fields_container)
+    assert scoped_key != key
+    scoping.ids = [1, 3]
+    assert result_cache.output_fingerprint(disp, 0, dpf.types.fields_container) != scoped_key
+    norm = dpf.operators.math.norm_fc(disp.outputs.fields_container())
+    assert result_cache.output_fingerprint(norm, 0, dpf.types.fields_container) is None
+    assert result_cache.output_fingerprint(dpf.operators.math.norm_fc(disp)) is not None
+
+
+def test_list_mutated_after_connect(cache):
+    values = [1., 2.]
+    op = dpf.Operator("forward")
+    op.connect(0, values)
+    values.append(3.)
+    key = result_cache.output_fingerprint(op, 0, dpf.types.field)
+    connected = dpf.Operator("forward")
+    connected.connect(0, [1., 2.])
+    assert key == result_cache.output_fingerprint(connected, 0, dpf.types.field)
+    mutated = dpf.Operator("forward")
+    mutated.connect(0, values)
+    assert key != result_cache.output_fingerprint(mutated, 0, dpf.types.field)
+
+
+def test_operator_connected_by_workflow(cache, allkindofcomplexity, simple_bar):
+    disp = dpf.operators.result.displacement()
+    workflow = dpf.Workflow()
+    workflow.add_operator(disp)
+    workflow.set_input_name("data_sources", disp.inputs.data_sources)
+    workflow.connect("data_sources", dpf.DataSources(allkindofcomplexity))
+    first = disp.outputs.fields_container()
+    workflow.connect("data_sources", dpf.DataSources(simple_bar))
+    second = disp.outputs.fields_container()
+    assert result_cache.output_fingerprint(disp, 0, dpf.types.fields_container) is None
+    assert cache.stats["hits"] == 0
+    assert len(cache) == 0
+    assert len(second[0].scoping) != len(first[0].scoping)
+
+
+def test_modified_file(cache, allkindofcomplexity, tmp_path):
+    path = str(tmp_path / "copy.rst")
+    with open(allkindofcomplexity, "rb") as source, open(path, "wb") as copy:
+        copy.write(source.read())
+    model = dpf.Model(path)
+    model.results.displacement().outputs.fields_container()
+    os.utime(path, ns=(0, 0))
+    model.results.displacement().outputs.fields_container()
+    assert cache.stats["misses"] == 2
+
+
+def test_eviction(cache, allkindofcomplexity):
+    model = dpf.Model(allkindofcomplexity)
+    model.results.displacement().outputs.fields_container()
+    cache.max_bytes = cache.size
+    disp = model.results.displacement()
+    disp.inputs.mesh_scoping(dpf.Scoping(ids=[1, 2], location=dpf.locations.nodal))
+    disp.outputs.fields_container()
+    assert cache.stats["evictions"] >= 1
+    assert cache.size <= cache.max_bytes
+    reopened = result_cache.ResultCache(cache.path)
+    assert len(reopened) == len(cache)
+    cache.clear()
+    assert len(cache) == 0
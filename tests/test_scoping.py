@@ -177,4 +177,31 @@ def test_largest_set_ids_one_shot():
         return #check that either more than 8MB works or it throws
     
     assert np.allclose( scop.ids,range(1, int(8.2e6/28)))
-    
\ No newline at end of file
+    
+
+def test_get_ids_in_buffer():
+    scop = Scoping()
+    ids = list(range(1, 1001))
+    scop.ids = ids
+    buffer = np.zeros(2000, dtype=np.int32)
+    out = scop.get_ids(out=buffer)
+    assert np.allclose(out, ids)
+    assert np.allclose(buffer[:1000], ids)
+    read_only = scop.get_ids(read_only=True)
+    assert not read_only.flags.writeable
+    with pytest.raises(ValueError):
+        scop.get_ids(out=np.zeros(10, dtype=np.int32))
+
+
+def test_scoping_index():
+    scop = Scoping()
+    scop.ids = [5, 3, 100, 7]
+    index = dpf.core.ScopingIndex(scop)
+    indices, mask = index.map([7, 8, 5, 100])
+    assert np.allclose(indices, [3, 0, 2])
+    assert np.allclose(mask, [True, False, True, True])
+    sparse = dpf.core.ScopingIndex([10, int(1e9), 3])
+    assert np.allclose(sparse.indices([3, 4, int(1e9)]), [2, -1, 1])
+    empty = dpf.core.ScopingIndex([])
+    indices, mask = empty.map(scop)
+    assert len(indices) == 0 and not mask.any()
@@ -4,6 +4,8 @@ import ansys.grpc.dpf
 import os
 import pathlib
 
+import pytest
+
 
 def test_connect():
     base_service = dpf.core.BaseService(load_operators=False)
@@ -197,4 +199,61 @@ def test_load_plugin_correctly():
     exists = os.path.exists(os.path.join(actual_path, "..",r"ansys/dpf/core/operators/fft_eval.py"))
     assert not exists 
     num_lines = sum(1 for line in open(os.path.join(actual_path, "..",r"ansys/dpf/core/operators/math/__init__.py")))
-    assert num_lines >= 11
\ No newline at end of file
+    assert num_lines >= 11
+
+
+def test_session_releases_entities(allkindofcomplexity):
+    outside = dpf.core.Scoping()
+    with dpf.core.session() as s:
+        model = dpf.core.Model(allkindofcomplexity)
+        fields_container = model.results.displacement().outputs.fields_container()
+        fields = list(fields_container)
+        for field in fields:
+            field.cycle = fields
+        scoping = dpf.core.Scoping(ids=[1, 2])
+        kept = s.keep(fields[0])
+        with pytest.raises(ValueError):
+            s.keep(outside)
+        assert len(s) > 0
+    assert s.released > 0
+    assert scoping._message is None
+    assert fields_container._message is None
+    assert dpf.core.SERVER.release_queue.pending == 0
+    assert kept.data.size > 0
+    assert kept.location == dpf.core.locations.nodal
+    assert outside._message is not None
+
+
+def test_profiling_record(tmpdir):
+    calls = []
+    dpf.core.profiling.add_hook(calls.append)
+    try:
+        with dpf.core.profiling.record() as report:
+            field = dpf.core.fields_factory.create_3d_vector_field(1000)
+            field.data = range(3000)
+            assert field.data.size == 3000
+    finally:
+        dpf.core.profiling.remove_hook(calls.append)
+    assert report.calls()["FieldService/UpdateData"] == 1
+    assert len(calls) == report.total_calls
+    stats = report.to_dict()["methods"]["FieldService/List"]
+    assert stats["response_bytes"] >= 3000 * 8
+    assert stats["response_chunks"] >= 1
+    assert sum(stats["histogram"]) == stats["calls"]
+    path = os.path.join(tmpdir, "report.json")
+    report.to_json(path)
+    assert os.path.exists(path)
+    assert "FieldService/List" in str(report)
+
+
+def test_profiling_serialized_requests():
+    with dpf.core.profiling.record() as report:
+        mesh = dpf.core.MeshedRegion.from_arrays(
+            node_ids=[1, 2, 3, 4],
+            coordinates=[[0., 0., 0.], [1., 0., 0.], [1., 1., 0.], [0., 1., 0.]],
+            element_ids=[1],
+            element_types=[dpf.core.element_types.Quad4.value],
+            connectivity=[0, 1, 2, 3])
+    assert mesh.elements.n_elements == 1
+    stats = report.to_dict()["methods"]["MeshedRegionService/Add"]
+    assert stats["request_bytes"] > 0
@@ -49,6 +49,23 @@ def test_connect_field_workflow():
     assert np.allclose(fOut.data,[7.0,8.0,9.0])
 
 
+def test_get_output_async_workflow():
+    wf = dpf.core.Workflow()
+    op= dpf.core.Operator("min_max")
+    inpt = dpf.core.Field(nentities=3)
+    inpt.data = [1,2,3,4,5,6,7,8,9]
+    inpt.scoping.ids = [1,2,3]
+    wf.add_operator(op)
+    wf.set_input_name("field", op, 0)
+    wf.set_output_name("min", op, 0)
+    wf.set_output_name("max", op, 1)
+    wf.connect("field", inpt)
+    f_min = wf.get_output_async("min", dpf.core.types.field)
+    f_max = wf.get_output_async("max", dpf.core.types.field)
+    assert np.allclose(f_min.result().data,[1.0,2.0,3.0])
+    assert np.allclose(f_max.result().data,[7.0,8.0,9.0])
+
+
 def test_connect_list_workflow(velocity_acceleration):    
     wf = dpf.core.Workflow()
     model = dpf.core.Model(velocity_acceleration)